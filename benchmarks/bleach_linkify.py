@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Bleach and Linkify benchmark
+Times sanitizing and linkifying comment-sized HTML with engines reused by
+filters, against building a new bleach cleaner or linker for every value,
+as well as with a cache of results over recurring comments.
+
+Comments are generated from a fixed seed, so that runs are reproducible.
+
+Run from project root: python benchmarks/bleach_linkify.py [rounds]
+"""
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from bleach.linkifier import Linker
+from bleach.sanitizer import Cleaner
+from shiftschema.cache import LruCache
+from shiftschema.filters import Bleach, Linkify
+
+
+words = (
+    'the quick brown fox jumps over lazy dog schema filter validate '
+    'comment thread reply great point agree disagree thanks'
+).split()
+
+fragments = [
+    '<b>{}</b>',
+    '<em>{}</em>',
+    '<a href="https://example.com/{}">link</a>',
+    'see www.example.org/{} for details',
+    'mail me at {}@example.com',
+    '<script>alert("{}")</script>',
+    '<img src="x.png" onerror="{}">',
+    '<p style="color: red">{}</p>',
+    '<!-- {} -->',
+    '<blockquote><code>{}</code></blockquote>',
+]
+
+
+def comments(count, seed=42):
+    """ Generate comments of a few sentences with markup and links """
+    rnd = random.Random(seed)
+    result = []
+    for _ in range(count):
+        parts = []
+        for _ in range(rnd.randint(20, 80)):
+            word = rnd.choice(words)
+            if rnd.random() < 0.1:
+                word = rnd.choice(fragments).format(word)
+            parts.append(word)
+        result.append('<p>' + ' '.join(parts) + '</p>')
+
+    return result
+
+
+def run(rounds):
+    """ Print time per comment for each way of filtering """
+    values = comments(200)
+    size = sum(map(len, values)) // len(values)
+    print('{} comments, {} characters on average'.format(len(values), size))
+
+    bleach = Bleach()
+    linkify = Linkify()
+
+    def new_cleaner(value):
+        return Cleaner(**bleach.bleach_params).clean(value)
+
+    def new_linker(value):
+        return Linker(**linkify.linkify_params).linkify(value)
+
+    cases = [
+        ('bleach, new cleaner', new_cleaner),
+        ('bleach', bleach.filter),
+        ('bleach, cache hits', Bleach(cache=LruCache()).filter),
+        ('linkify, new linker', new_linker),
+        ('linkify', linkify.filter),
+        ('linkify, cache hits', Linkify(cache=LruCache()).filter),
+    ]
+    for name, filter in cases:
+        case = lambda: [filter(value) for value in values]
+        best = min(timeit.repeat(case, number=1, repeat=rounds))
+        per_value = best / len(values) * 1e6
+        print('{:<20} {:10.1f} us per comment'.format(name, per_value))
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -95,9 +95,15 @@ setup(**dict(
     # project dependencies
     install_requires=[
         'bleach>=3.3.0,<4.0.0',
-        'python-slugify>=5.0.2,<6.0.0'
+        'python-slugify>=5.0.2,<6.0.0',
+        'click>=8.0.0,<9.0.0'
     ],
 
+    # console scripts
+    entry_points=dict(
+        console_scripts=['shiftschema = shiftschema.cli:cli']
+    ),
+
 
     # project license
     license=license_type
@@ -0,0 +1,3 @@
+from shiftschema.cache.abstract_cache import AbstractCache
+from shiftschema.cache.lru_cache import LruCache
+from shiftschema.cache.sqlite_cache import SqliteCache
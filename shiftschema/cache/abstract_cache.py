@@ -0,0 +1,211 @@
+from abc import ABCMeta, abstractmethod
+from shiftschema.exceptions import NotCanonical
+import functools
+import hashlib
+import types
+
+
+class AbstractCache(metaclass=ABCMeta):
+    """
+    Abstract cache
+    Provides a base for result caches that can be given to filters. Caches
+    are content-addressed: keys are hashes of the value together with the
+    configuration that produced the result, so identical input processed
+    with identical settings is only computed once. Keeps track of hits and
+    misses to report hit rate.
+    """
+
+    hits = 0
+    misses = 0
+
+    @abstractmethod
+    def load(self, key):
+        """
+        Load
+        Abstract storage lookup: implement this in your concrete caches.
+        Returns stored value or None if key is not in cache.
+
+        :param key:             str, cache key
+        :return:                stored value or None
+        """
+        raise NotImplemented
+
+    @abstractmethod
+    def set(self, key, value):
+        """
+        Set
+        Abstract storage write: implement this in your concrete caches.
+
+        :param key:             str, cache key
+        :param value:           value to store
+        :return:                None
+        """
+        raise NotImplemented
+
+    @abstractmethod
+    def __len__(self):
+        raise NotImplemented
+
+    def get(self, key):
+        """
+        Get
+        Returns cached value or None on miss and updates hit statistics.
+
+        :param key:             str, cache key
+        :return:                cached value or None
+        """
+        value = self.load(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return value
+
+    @property
+    def hit_rate(self):
+        """ Share of lookups served from cache (0.0 - 1.0) """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        """
+        Stats
+        Returns cache hit statistics.
+
+        :return:                dict
+        """
+        return dict(
+            hits=self.hits,
+            misses=self.misses,
+            hit_rate=self.hit_rate,
+            size=len(self),
+        )
+
+    def reset_stats(self):
+        """
+        Reset stats
+        Zeroes hit statistics.
+
+        :return:                None
+        """
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def canonical(obj, seen=None):
+        """
+        Canonical
+        Converts configuration object into a deterministic representation
+        suitable for hashing: dicts and sets are sorted, classes and
+        builtins are represented by their module and qualified name.
+        Functions are represented by their name along with their code,
+        defaults and contents of closure cells, so that closures, lambdas
+        and partials configured differently get different representations.
+        Objects providing a definition() are represented by it, other
+        objects without a repr of their own by their class and attributes.
+        Globals referenced by functions are not taken into account.
+
+        Raises NotCanonical for objects that can't be represented in a
+        deterministic way, e.g. ones whose repr holds a memory address.
+
+        :param obj:             object to convert
+        :param seen:            set or None, ids of objects being converted
+        :return:                str
+        """
+        seen = set() if seen is None else seen
+
+        def canonical(item):
+            return AbstractCache.canonical(item, seen)
+
+        if isinstance(obj, dict):
+            items = [(canonical(k), canonical(v)) for k, v in obj.items()]
+            return '{' + ','.join(k + ':' + v for k, v in sorted(items)) + '}'
+        if isinstance(obj, (set, frozenset)):
+            items = sorted(canonical(item) for item in obj)
+            return '{' + ','.join(items) + '}'
+        if isinstance(obj, (list, tuple)):
+            items = [canonical(item) for item in obj]
+            return '[' + ','.join(items) + ']'
+        if isinstance(obj, types.CodeType):
+            code = [obj.co_code.hex(), obj.co_consts, obj.co_names]
+            return '<code ' + canonical(code) + '>'
+
+        name = getattr(obj, '__qualname__', None)
+        module = getattr(obj, '__module__', None) or ''
+        if isinstance(obj, type):
+            return '<' + module + '.' + name + '>'
+        if isinstance(obj, types.BuiltinFunctionType):
+            bound = getattr(obj, '__self__', None)
+            if bound is None or isinstance(bound, types.ModuleType):
+                return '<' + module + '.' + name + '>'
+
+        # objects that can refer back to themselves
+        if id(obj) in seen:
+            return '<recursive>'
+        seen.add(id(obj))
+        try:
+            if isinstance(obj, functools.partial):
+                partial = [obj.func, obj.args, obj.keywords]
+                return '<partial ' + canonical(partial) + '>'
+            if isinstance(obj, types.MethodType):
+                method = [obj.__func__, obj.__self__]
+                return '<method ' + canonical(method) + '>'
+            if isinstance(obj, types.BuiltinFunctionType):
+                return '<' + name + ' of ' + canonical(obj.__self__) + '>'
+            if isinstance(obj, types.FunctionType):
+                try:
+                    cells = [c.cell_contents for c in obj.__closure__ or ()]
+                except ValueError:
+                    err = 'Function {} has an empty closure cell'
+                    raise NotCanonical(err.format(name))
+                function = [
+                    obj.__code__,
+                    obj.__defaults__,
+                    obj.__kwdefaults__,
+                    cells
+                ]
+                name = module + '.' + name
+                return '<' + name + ' ' + canonical(function) + '>'
+            if callable(getattr(obj, 'definition', None)):
+                return canonical(obj.definition())
+            default_repr = type(obj).__repr__ is object.__repr__
+            if default_repr and hasattr(obj, '__dict__'):
+                return canonical([type(obj), vars(obj)])
+        finally:
+            seen.discard(id(obj))
+
+        representation = repr(obj)
+        if ' at 0x' in representation:
+            err = 'Unable to represent {} in a deterministic way'
+            raise NotCanonical(err.format(representation))
+
+        return representation
+
+    @staticmethod
+    def namespace(name, config):
+        """
+        Namespace
+        Returns a digest of named configuration to prefix cache keys with.
+
+        :param name:            str, namespace name, e.g. filter name
+        :param config:          object, configuration affecting results
+        :return:                str
+        """
+        digest = AbstractCache.canonical(config).encode('utf-8')
+        return name + ':' + hashlib.sha256(digest).hexdigest()
+
+    @staticmethod
+    def key(value, namespace=''):
+        """
+        Key
+        Returns content-addressed cache key for a string value.
+
+        :param value:           str, value to cache results for
+        :param namespace:       str, namespace from configuration
+        :return:                str
+        """
+        digest = hashlib.sha256(namespace.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(value.encode('utf-8', 'surrogatepass'))
+        return digest.hexdigest()
@@ -0,0 +1,77 @@
+from shiftschema.cache.abstract_cache import AbstractCache
+from shiftschema.exceptions import InvalidOption
+from collections import OrderedDict
+import threading
+
+
+class LruCache(AbstractCache):
+    """
+    LRU cache
+    In-process cache holding a bounded number of entries. Once full, least
+    recently used entries are evicted. Safe to share between threads.
+    """
+
+    def __init__(self, maxsize=1024):
+        """
+        Initialize cache
+
+        :param maxsize:         int, maximum number of entries
+        :return:                None
+        """
+        if not isinstance(maxsize, int) or maxsize < 1:
+            raise InvalidOption('Cache maxsize must be a positive integer')
+
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def load(self, key):
+        """
+        Load
+        Returns stored value or None, marking entry as recently used.
+
+        :param key:             str, cache key
+        :return:                stored value or None
+        """
+        with self.lock:
+            value = self.entries.get(key)
+            if value is not None:
+                self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        """
+        Set
+        Stores value, evicting least recently used entry if cache is full.
+
+        :param key:             str, cache key
+        :param value:           value to store
+        :return:                None
+        """
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        """
+        Clear
+        Removes all entries.
+
+        :return:                None
+        """
+        with self.lock:
+            self.entries.clear()
@@ -0,0 +1,117 @@
+from shiftschema.cache.abstract_cache import AbstractCache
+from shiftschema.exceptions import InvalidOption
+import pickle
+import sqlite3
+import threading
+
+
+class SqliteCache(AbstractCache):
+    """
+    Sqlite cache
+    On-disk cache backed by an sqlite database that can be shared between
+    processes and survives restarts. Values are pickled. When maxsize is
+    given, only entries stored by the last maxsize writes are kept, so that
+    oldest entries are evicted with a range delete by rowid rather than by
+    counting and sorting the whole table. Each thread gets its own database
+    connection.
+    """
+
+    def __init__(self, path, maxsize=None, timeout=5.0):
+        """
+        Initialize cache
+
+        :param path:            str, path to database file
+        :param maxsize:         int or None, maximum number of entries
+        :param timeout:         float, seconds to wait for database lock
+        :return:                None
+        """
+        if maxsize is not None and (
+            not isinstance(maxsize, int) or maxsize < 1
+        ):
+            raise InvalidOption('Cache maxsize must be a positive integer')
+
+        self.path = path
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self.local = threading.local()
+
+        with self.connection:
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS cache ('
+                'key TEXT PRIMARY KEY, value BLOB NOT NULL)'
+            )
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['local']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.local = threading.local()
+
+    @property
+    def connection(self):
+        """
+        Connection
+        Returns database connection for current thread.
+
+        :return:                sqlite3.Connection
+        """
+        connection = getattr(self.local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=self.timeout)
+            self.local.connection = connection
+
+        return connection
+
+    def __len__(self):
+        query = 'SELECT COUNT(*) FROM cache'
+        return self.connection.execute(query).fetchone()[0]
+
+    def load(self, key):
+        """
+        Load
+        Returns stored value or None if key is not in cache.
+
+        :param key:             str, cache key
+        :return:                stored value or None
+        """
+        query = 'SELECT value FROM cache WHERE key = ?'
+        row = self.connection.execute(query, (key,)).fetchone()
+        if row is None:
+            return None
+
+        return pickle.loads(row[0])
+
+    def set(self, key, value):
+        """
+        Set
+        Stores value, evicting oldest entries if cache is full.
+
+        :param key:             str, cache key
+        :param value:           value to store
+        :return:                None
+        """
+        value = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self.connection as connection:
+            cursor = connection.execute(
+                'INSERT OR REPLACE INTO cache (key, value) VALUES (?, ?)',
+                (key, value)
+            )
+            rowid = cursor.lastrowid
+            if self.maxsize is not None and rowid > self.maxsize:
+                connection.execute(
+                    'DELETE FROM cache WHERE rowid <= ?',
+                    (rowid - self.maxsize,)
+                )
+
+    def clear(self):
+        """
+        Clear
+        Removes all entries.
+
+        :return:                None
+        """
+        with self.connection as connection:
+            connection.execute('DELETE FROM cache')
@@ -0,0 +1,355 @@
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from importlib import import_module
+from shiftschema.schema import Schema
+from shiftschema import parallel
+from itertools import islice
+import click
+import csv
+import json
+import mmap
+import os
+import sys
+import time
+
+# -----------------------------------------------------------------------------
+# Helpers
+# -----------------------------------------------------------------------------
+
+
+def load_schema(spec, locale=None):
+    """
+    Load schema
+    Imports schema from a 'module:name' spec. Name can point to a schema
+    class, which is instantiated, or a schema instance. Modules are looked
+    up in current working directory first, like with python -m, so that
+    installed console scripts find project schemas.
+
+    :param spec:            str, 'module:name' spec
+    :param locale:          str or None, locale to translate messages to
+    :return:                shiftschema.schema.Schema
+    """
+    module_name, _, name = spec.partition(':')
+    if not module_name or not name:
+        err = 'Schema must be given as module:name, got "{}"'
+        raise click.BadParameter(err.format(spec))
+
+    cwd = os.getcwd()
+    if cwd not in sys.path:
+        sys.path.insert(0, cwd)
+
+    try:
+        schema = getattr(import_module(module_name), name)
+    except (ImportError, AttributeError) as error:
+        err = 'Unable to load schema "{}": {}'
+        raise click.BadParameter(err.format(spec, error))
+
+    if isinstance(schema, type) and issubclass(schema, Schema):
+        schema = schema()
+    if not isinstance(schema, Schema):
+        err = '"{}" is not a schema'
+        raise click.BadParameter(err.format(spec))
+
+    if locale:
+        schema.locale = locale
+    return schema
+
+
+def init_worker(spec, locale=None):
+    """ Process pool initializer: loads schema once in each worker """
+    parallel.init_worker(load_schema(spec, locale))
+
+
+def run_ordered(func, tasks, workers=0, initargs=()):
+    """
+    Run ordered
+    Runs func over an iterable of argument tuples in a process pool,
+    yielding results in order. Only a few tasks per worker are pending at a
+    time, so that input is read and results are written as they go. With
+    no workers, tasks are run in this process.
+
+    :param func:            callable, picklable task function
+    :param tasks:           iterable of argument tuples
+    :param workers:         int, number of worker processes
+    :param initargs:        tuple, arguments for init_worker
+    :return:                generator of results
+    """
+    if not workers:
+        init_worker(*initargs)
+        for args in tasks:
+            yield func(*args)
+        return
+
+    window = workers * 2
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_worker,
+        initargs=initargs
+    ) as executor:
+        pending = deque()
+        for args in tasks:
+            pending.append(executor.submit(func, *args))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def split_lines(path, chunk_size):
+    """
+    Split lines
+    Splits a memory-mapped file into byte ranges of about chunk_size bytes,
+    aligned to line ends.
+
+    :param path:            str, path to file
+    :param chunk_size:      int, number of bytes per chunk
+    :return:                generator of (start, stop) byte offsets
+    """
+    with open(path, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+        if not size:
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            start = 0
+            while start < size:
+                stop = data.find(b'\n', start + chunk_size - 1)
+                stop = size if stop == -1 else stop + 1
+                yield start, stop
+                start = stop
+
+
+def validate_lines(path, start, stop):
+    """
+    Validate lines
+    Validates JSON lines in a byte range of a file with schema loaded in
+    worker. Blank lines are skipped and lines that are not valid JSON are
+    reported under a __json__ key.
+
+    :param path:            str, path to file
+    :param start:           int, offset of first byte
+    :param stop:            int, offset after last byte
+    :return:                tuple, (number of lines, list of (line index,
+                            translated messages) for invalid lines)
+    """
+    with open(path, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            lines = data[start:stop].split(b'\n')
+    if lines[-1] == b'':
+        lines.pop()  # chunks end with a line break
+
+    invalid = []
+    for index, line in enumerate(lines):
+        if not line.strip():
+            continue
+        try:
+            model = json.loads(line)
+        except ValueError as error:
+            invalid.append((index, {'__json__': [str(error)]}))
+            continue
+
+        result = parallel.worker_schema.validate(model)
+        if not result:
+            invalid.append((index, result.get_messages()))
+
+    return len(lines), invalid
+
+
+def read_batches(reader, batch_size):
+    """
+    Read batches
+    Reads rows lazily, in lists of batch_size rows.
+
+    :param reader:          iterator of rows
+    :param batch_size:      int, number of rows per batch
+    :return:                generator of lists of rows
+    """
+    while True:
+        batch = list(islice(reader, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def process_rows(rows):
+    """
+    Process rows
+    Filters and validates a batch of rows with schema loaded in worker.
+
+    :param rows:            list of dicts, rows to process
+    :return:                list of (filtered row, translated messages or
+                            None if row is valid) tuples
+    """
+    processed = []
+    for row in rows:
+        result = parallel.worker_schema.process(row)
+        processed.append((row, None if result else result.get_messages()))
+
+    return processed
+
+
+def print_stats(stats, started, unit='lines'):
+    """ Print throughput stats to stderr """
+    seconds = max(time.perf_counter() - started, 1e-9)
+    message = '{} {} ({} invalid) in {:.2f}s: {:,.0f} {}/s, {:.1f} MB/s'
+    click.echo(message.format(
+        stats[unit],
+        unit,
+        stats['invalid'],
+        seconds,
+        stats[unit] / seconds,
+        unit,
+        stats['bytes'] / seconds / 1024 / 1024
+    ), err=True)
+
+
+# -----------------------------------------------------------------------------
+# Commands
+# -----------------------------------------------------------------------------
+
+
+@click.group(help='Filter and validate data files with shiftschema schemas')
+def cli():
+    pass
+
+
+workers_option = click.option(
+    '--workers', '-w',
+    type=click.IntRange(min=0),
+    default=os.cpu_count(),
+    help='Worker processes, 0 to run in this process'
+)
+
+locale_option = click.option(
+    '--locale',
+    help='Locale to translate messages to'
+)
+
+
+@cli.command(name='validate')
+@click.argument('schema')
+@click.argument('data', type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    '--output', '-o',
+    type=click.File('w'),
+    default='-',
+    help='Error report file (default: stdout)'
+)
+@workers_option
+@click.option(
+    '--chunk-size',
+    type=click.IntRange(min=1),
+    default=4 * 1024 * 1024,
+    help='Bytes of input per worker task'
+)
+@locale_option
+def validate(schema, data, output, workers, chunk_size, locale):
+    """
+    Validate JSON lines in DATA with SCHEMA (module:name)
+
+    Reports invalid lines as JSON lines with line number and translated
+    error messages, and exits with status 1 if any were found.
+    """
+    load_schema(schema)  # fail early
+    started = time.perf_counter()
+    stats = dict(lines=0, invalid=0, bytes=os.path.getsize(data))
+
+    chunks = split_lines(data, chunk_size)
+    tasks = ((data, start, stop) for start, stop in chunks)
+    results = run_ordered(
+        validate_lines,
+        tasks,
+        workers=workers,
+        initargs=(schema, locale)
+    )
+    for lines, invalid in results:
+        for index, messages in invalid:
+            report = dict(line=stats['lines'] + index + 1, errors=messages)
+            output.write(json.dumps(report, default=str) + '\n')
+        stats['lines'] += lines
+        stats['invalid'] += len(invalid)
+
+    output.flush()
+    print_stats(stats, started)
+    if stats['invalid']:
+        raise SystemExit(1)
+
+
+@cli.command(name='clean')
+@click.argument('schema')
+@click.argument('source', type=click.Path(exists=True, dir_okay=False))
+@click.argument('target', type=click.Path(dir_okay=False, writable=True))
+@click.option(
+    '--errors', '-e',
+    type=click.File('w'),
+    help='Rejected rows file, as JSON lines'
+)
+@workers_option
+@click.option(
+    '--batch-size',
+    type=click.IntRange(min=1),
+    default=1000,
+    help='Rows per worker task'
+)
+@click.option('--delimiter', default=',', help='CSV field delimiter')
+@locale_option
+def clean(
+    schema,
+    source,
+    target,
+    errors,
+    workers,
+    batch_size,
+    delimiter,
+    locale
+):
+    """
+    Clean CSV rows in SOURCE with SCHEMA (module:name) into TARGET
+
+    Rows are read lazily, filtered and validated with the schema as dicts
+    with header fields as keys. Valid rows are written to TARGET with
+    filtered values, rejected ones are written with their row number and
+    translated error messages to a JSON lines file given with --errors.
+    """
+    load_schema(schema)  # fail early
+    started = time.perf_counter()
+    stats = dict(rows=0, invalid=0, bytes=os.path.getsize(source))
+
+    with open(source, newline='') as source_file, \
+            open(target, 'w', newline='') as target_file:
+        reader = csv.DictReader(source_file, delimiter=delimiter)
+        writer = csv.DictWriter(
+            target_file,
+            fieldnames=reader.fieldnames or [],
+            delimiter=delimiter,
+            extrasaction='ignore'
+        )
+        if reader.fieldnames:
+            writer.writeheader()
+
+        tasks = ((batch,) for batch in read_batches(reader, batch_size))
+        results = run_ordered(
+            process_rows,
+            tasks,
+            workers=workers,
+            initargs=(schema, locale)
+        )
+        for processed in results:
+            for row, messages in processed:
+                stats['rows'] += 1
+                if messages is None:
+                    writer.writerow(row)
+                    continue
+
+                stats['invalid'] += 1
+                if errors:
+                    report = dict(row=stats['rows'], data=row, errors=messages)
+                    errors.write(json.dumps(report, default=str) + '\n')
+
+    if errors:
+        errors.flush()
+    print_stats(stats, started, unit='rows')
+
+
+if __name__ == '__main__':
+    cli()
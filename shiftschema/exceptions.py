@@ -76,6 +76,15 @@ class InvalidOption(ShiftValidateException, ValueError):
     pass
 
 
+class NotCanonical(ShiftValidateException, TypeError):
+    """
+    Not canonical
+    Raised when a configuration object can't be represented in a
+    deterministic way to be hashed into cache keys or fingerprints
+    """
+    pass
+
+
 class NoTranslations(ShiftValidateException, ValueError):
     """
     Translation not found
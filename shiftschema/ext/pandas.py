@@ -0,0 +1,207 @@
+import numpy as np
+import pandas as pd
+from shiftschema.schema import Schema
+from shiftschema.result import Result
+from shiftschema.rows import Rows
+
+
+def frame_columns(frame):
+    """
+    Frame columns
+    Converts DataFrame columns to columns for batch validation. Numeric and
+    boolean columns without missing values are kept as arrays to be
+    validated with array operations, others are turned into lists with
+    missing values (NaN, NaT, NA) given as None.
+
+    :param frame:           pandas.DataFrame
+    :return:                dict, column name to series or list of values
+    """
+    columns = dict()
+    for name in frame.columns:
+        series = frame[name]
+        dtype = series.dtype
+        numeric = isinstance(dtype, np.dtype) and dtype.kind in 'biuf'
+        if numeric and not series.hasnans:
+            columns[name] = series
+            continue
+
+        column = series.astype(object)
+        if series.hasnans:
+            column = column.where(series.notna(), None)
+        columns[name] = column.tolist()
+
+    return columns
+
+
+def flatten(errors, path=''):
+    """
+    Flatten
+    Walks errors of a result and yields them one by one along with a path
+    to the property they belong to: property names of nested entities and
+    indexes of collection items are joined with dots.
+
+    :param errors:          dict, errors of a result
+    :param path:            str, path of parent property
+    :return:                generator of (path, error) tuples
+    """
+    for property_name, prop_errors in errors.items():
+        current = str(property_name)
+        if path:
+            current = path + '.' + current
+        if isinstance(prop_errors, list):
+            for error in prop_errors:
+                yield current, error
+            continue
+
+        for error in prop_errors.get('direct', []):
+            yield current, error
+        if prop_errors.get('schema'):
+            yield from flatten(prop_errors['schema'], current)
+        for index, item in prop_errors.get('collection', {}).items():
+            if isinstance(item, Result):
+                item = item.errors
+            yield from flatten(item, current + '.' + str(index))
+
+
+def errors_frame(result, index, locale=None):
+    """
+    Errors frame
+    Puts errors of a batch result into a frame with a row per error: row
+    label, property path and translated message. Each distinct message is
+    only translated once.
+
+    :param result:          shiftschema.result.BatchResult
+    :param index:           pandas.Index, labels of rows
+    :param locale:          str or None, locale to translate messages to
+    :return:                pandas.DataFrame
+    """
+    locale = locale or result.locale
+    translated = dict()
+    errors = []
+    for row in result.invalid:
+        row_result = result.errors[row]
+        for path, error in flatten(row_result.errors):
+            message = translated.get(error.message)
+            if message is None:
+                message = error.message
+                if result.translator:
+                    message = result.translator.translate(message, locale)
+                translated[error.message] = message
+            message = row_result.format_error(message, error.kwargs)
+            errors.append((index[row], path, message))
+
+    return pd.DataFrame(errors, columns=['row', 'path', 'message'])
+
+
+def validate_frame(
+    schema,
+    frame,
+    context=None,
+    locale=None,
+    workers=None,
+    chunk_size=None
+):
+    """
+    Validate frame
+    Validates each row of a DataFrame with schema, mapping schema properties
+    to columns of the same name. Columns are validated with
+    validate_columns(), so simple properties are validated a column at a
+    time with batch and array implementations of validators, while custom
+    validators, state validators, entities and collections are given each
+    row as a dict.
+
+    :param schema:          shiftschema.schema.Schema
+    :param frame:           pandas.DataFrame
+    :param context:         object, dict or None
+    :param locale:          str or None, locale to translate messages to
+    :param workers:         int or None, number of worker processes
+    :param chunk_size:      int or None, number of rows per worker task
+    :return:                tuple, (bool series flagging valid rows,
+                            errors frame with row, path and message columns)
+    """
+    result = schema.validate_columns(
+        frame_columns(frame),
+        context=context,
+        workers=workers,
+        chunk_size=chunk_size
+    )
+
+    valid = pd.Series(
+        [not invalid for invalid in result.mask],
+        index=frame.index,
+        name='valid',
+        dtype=bool
+    )
+
+    return valid, errors_frame(result, frame.index, locale=locale)
+
+
+def filter_frame(schema, frame, context=None):
+    """
+    Filter frame
+    Returns a copy of a DataFrame with columns of simple schema properties
+    filtered a column at a time, using batch implementations of filters
+    where available. Other filters are given each row as a dict. Missing
+    values are left as they are.
+
+    :param schema:          shiftschema.schema.Schema
+    :param frame:           pandas.DataFrame
+    :param context:         object, dict or None
+    :return:                pandas.DataFrame
+    """
+    columns = frame_columns(frame)
+    rows = Rows(*Rows.prepare(columns))
+    filtered = frame.copy()
+    for property_name, prop in schema.properties.items():
+        if property_name not in columns or not prop.filters:
+            continue
+
+        values = prop.filter_many(
+            rows.columns[property_name],
+            models=rows,
+            context=context
+        )
+        filtered[property_name] = pd.Series(
+            values,
+            index=frame.index,
+            name=property_name
+        )
+
+    return filtered
+
+
+class FrameSchemaMixin:
+    """
+    Frame schema mixin
+    Adds DataFrame validation and filtering to schemas.
+    """
+
+    def validate_frame(
+        self,
+        frame,
+        context=None,
+        locale=None,
+        workers=None,
+        chunk_size=None
+    ):
+        """ Validate rows of a DataFrame, see validate_frame() """
+        return validate_frame(
+            self,
+            frame,
+            context=context,
+            locale=locale,
+            workers=workers,
+            chunk_size=chunk_size
+        )
+
+    def filter_frame(self, frame, context=None):
+        """ Return a filtered copy of a DataFrame, see filter_frame() """
+        return filter_frame(self, frame, context=context)
+
+
+class FrameSchema(FrameSchemaMixin, Schema):
+    """
+    Frame schema
+    Extends schema to validate and filter pandas DataFrames
+    """
+    pass
@@ -8,6 +8,7 @@ from shiftschema.filters.uppercase import Uppercase
 from shiftschema.filters.bleach import Bleach
 from shiftschema.filters.linkify import Linkify
 from shiftschema.filters.add_http import AddHttp
+from shiftschema.filters.fused_string import FusedString
 
 
 # todo implement these filters:
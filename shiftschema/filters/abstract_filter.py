@@ -1,13 +1,37 @@
 from abc import ABCMeta, abstractmethod
 
+# numpy is optional, only needed to filter arrays
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class AbstractFilter(metaclass=ABCMeta):
     """
     Abstract filter
     Provides a base for concrete filters and your custom filters. All
     of those can be added to simple properties on the processor.
+
+    Filters that always return the same value when applied to their own
+    output, regardless of model and context, should declare themselves
+    idempotent. Properties skip filtering values they've just produced
+    when all of their filters are idempotent.
+
+    Filters whose results only depend on value, model, context and their
+    options should declare themselves deterministic. Schemas only cache
+    results when all of their filters and validators are deterministic.
     """
 
+    # whether filtering own output returns it unchanged
+    idempotent = False
+
+    # whether results only depend on value, model, context and options
+    deterministic = False
+
+    # attributes holding runtime state rather than configuration
+    runtime = ()
+
     @abstractmethod
     def filter(self, value, model=None, context=None):
         """
@@ -22,5 +46,73 @@ class AbstractFilter(metaclass=ABCMeta):
         """
         raise NotImplemented
 
+    def filter_many(self, values, model=None, context=None):
+        """
+        Filter many
+        Filters a batch of values sharing the same model and context and
+        returns a list of filtered values. Override this in concrete filters
+        to provide faster batch implementations, which may return NumPy
+        arrays when given arrays of strings.
 
+        :param values:              iterable, values to filter
+        :param model:               parent model of the property
+        :param context:             parent model or custom context
+        :return:                    list of filtered values
+        """
+        values = self.to_list(values)
+        return [self.filter(value, model, context) for value in values]
 
+    @property
+    def vectorized(self):
+        """
+        Vectorized
+        Whether filter provides its own batch implementation. Values of
+        a column are only filtered as a batch by such filters, others are
+        run per value, with each row given as model.
+
+        :return:                    bool
+        """
+        return type(self).filter_many is not AbstractFilter.filter_many
+
+    def definition(self):
+        """
+        Definition
+        Describes filter for schema fingerprints: its class and instance
+        attributes, except those listed as runtime state. Override this if
+        attributes of your filter don't describe what it does.
+
+        :return:                    list, [class, dict of attributes]
+        """
+        config = {
+            name: value for name, value in vars(self).items()
+            if name not in self.runtime
+        }
+        return [type(self), config]
+
+    @staticmethod
+    def is_string_array(values):
+        """
+        Is string array
+        Checks whether values are a NumPy array of strings.
+
+        :param values:              values to check
+        :return:                    bool
+        """
+        dtype = getattr(values, 'dtype', None)
+        return dtype is not None and dtype.kind == 'U'
+
+    @staticmethod
+    def to_list(values):
+        """
+        To list
+        Converts arrays to lists of python values and other iterables,
+        except lists and tuples, to lists.
+
+        :param values:              iterable, values to convert
+        :return:                    list or tuple
+        """
+        if hasattr(values, 'tolist'):
+            return values.tolist()
+        if not isinstance(values, (list, tuple)):
+            return list(values)
+        return values
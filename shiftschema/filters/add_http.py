@@ -1,4 +1,5 @@
 from shiftschema.filters import AbstractFilter
+from shiftschema.filters.abstract_filter import np
 
 
 class AddHttp(AbstractFilter):
@@ -7,6 +8,12 @@ class AddHttp(AbstractFilter):
     Adds http to a string if it doesn't start with http or https already.
     """
 
+    # results only depend on value and options
+    deterministic = True
+
+    # filtering own output returns it unchanged
+    idempotent = True
+
     def __init__(self, to_int=False):
         """
         Initialize filter.
@@ -37,5 +44,25 @@ class AddHttp(AbstractFilter):
 
         return value
 
+    def filter_many(self, values, model=None, context=None):
+        """
+        Filter many
+        Adds http to a batch of strings at once, using numpy.char for
+        arrays of strings. Non-string values are returned as they are.
 
+        :param values:              iterable, values to filter
+        :param model:               parent model being validated
+        :param context:             object, filtering context
+        :return:                    list or numpy.ndarray
+        """
+        http = ('http://', 'https://')
+        if self.is_string_array(values):
+            has_http = np.char.startswith(values, http[0])
+            has_http |= np.char.startswith(values, http[1])
+            return np.where(has_http, values, np.char.add(http[0], values))
 
+        return [
+            value if type(value) is not str or value.startswith(http)
+            else 'http://' + value
+            for value in self.to_list(values)
+        ]
@@ -1,5 +1,7 @@
 from shiftschema.filters import AbstractFilter
-import bleach
+from shiftschema.exceptions import InvalidOption, NotCanonical
+from bleach.sanitizer import Cleaner
+import threading
 
 
 class Bleach(AbstractFilter):
@@ -15,8 +17,25 @@ class Bleach(AbstractFilter):
     Not safe: <body data-bio="{{ bleach.clean(user_bio} }}">
 
     See bleach documentation at: https://bleach.readthedocs.io
+
+    Bleach cleaners are expensive to create (each builds an html5lib parser
+    and serializer) and are not thread-safe, so the filter creates one per
+    thread on first use and reuses it afterwards.
+
+    Can be given a cache (see shiftschema.cache) to avoid re-sanitizing
+    recurring documents. Results are keyed by a hash of the value and filter
+    config, where callable attributes are described by their code, defaults,
+    closure cells and partial arguments. Callables that can't be described
+    this way raise NotCanonical, surfaced as InvalidOption when creating a
+    filter with a cache.
     """
 
+    # results only depend on value and options
+    deterministic = True
+
+    # filtering own output returns it unchanged
+    idempotent = True
+
     # list of allowed tags
     # default: bleach.sanitizer.ALLOWED_TAGS
     tags = None
@@ -42,6 +61,15 @@ class Bleach(AbstractFilter):
     # a dict of prepared bleach params containing all of the above
     bleach_params = None
 
+    # optional cache of sanitized results (shiftschema.cache)
+    cache = None
+
+    # cache key prefix derived from bleach params
+    namespace = None
+
+    # attributes not affecting results
+    runtime = ('cache', 'namespace', 'local')
+
     def __init__(
         self,
         tags=None,
@@ -49,7 +77,8 @@ class Bleach(AbstractFilter):
         styles=None,
         protocols=None,
         strip=True,
-        strip_comments=True
+        strip_comments=True,
+        cache=None
     ):
         """
         Initialize the filter and set bleach config options
@@ -60,6 +89,7 @@ class Bleach(AbstractFilter):
         :param protocols: allowed protocols for links
         :param strip: strip disallowed elements?
         :param strip_comments: strip comments?
+        :param cache: optional cache of results, e.g. LruCache
         """
         self.tags = tags
         self.attributes = attributes
@@ -83,6 +113,40 @@ class Bleach(AbstractFilter):
         if self.protocols:
             self.bleach_params['protocols'] = self.protocols
 
+        self.cache = cache
+        if cache is not None:
+            try:
+                self.namespace = cache.namespace('bleach', self.bleach_params)
+            except NotCanonical as error:
+                err = 'Unable to cache results of this configuration: {}'
+                raise InvalidOption(err.format(error))
+
+        self.local = threading.local()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['local']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.local = threading.local()
+
+    @property
+    def cleaner(self):
+        """
+        Cleaner
+        Returns bleach cleaner for current thread, creating it on first use.
+
+        :return:                    bleach.sanitizer.Cleaner
+        """
+        cleaner = getattr(self.local, 'cleaner', None)
+        if cleaner is None:
+            cleaner = Cleaner(**self.bleach_params)
+            self.local.cleaner = cleaner
+
+        return cleaner
+
     def filter(self, value, model=None, context=None):
         """
         Filter
@@ -97,6 +161,15 @@ class Bleach(AbstractFilter):
         if type(value) is not str:
             return value
 
-        return bleach.clean(text=value, **self.bleach_params)
+        if self.cache is None:
+            return self.cleaner.clean(value)
+
+        key = self.cache.key(value, self.namespace)
+        filtered = self.cache.get(key)
+        if filtered is None:
+            filtered = self.cleaner.clean(value)
+            self.cache.set(key, filtered)
+
+        return filtered
 
 
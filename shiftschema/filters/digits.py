@@ -9,6 +9,15 @@ class Digits(AbstractFilter):
     convert to integer.
     """
 
+    # results only depend on value and options
+    deterministic = True
+
+    # filtering own output returns it unchanged
+    idempotent = True
+
+    # pattern to remove everything but digits
+    non_digits = re.compile(r'\D+')
+
     def __init__(self, to_int=False):
         """
         Initialize digits filter. Sets flag to also convert to integer.
@@ -41,5 +50,26 @@ class Digits(AbstractFilter):
 
         return found
 
+    def filter_many(self, values, model=None, context=None):
+        """
+        Filter many
+        Removes everything but digits from a batch of strings at once.
+        Non-string values are returned as they are.
 
+        :param values:              iterable, values to filter
+        :param model:               parent model being validated
+        :param context:             object, filtering context
+        :return:                    list or numpy.ndarray
+        """
+        non_digits = self.non_digits.sub
+        filtered = [
+            non_digits('', value) if type(value) is str else value
+            for value in self.to_list(values)
+        ]
+        if not self.to_int:
+            return filtered
 
+        return [
+            int(value) if value and type(value) is str else value
+            for value in filtered
+        ]
@@ -0,0 +1,199 @@
+from shiftschema.filters import AbstractFilter
+from shiftschema.filters.add_http import AddHttp
+from shiftschema.filters.digits import Digits
+from shiftschema.filters.lowercase import Lowercase
+from shiftschema.filters.slugify import Slugify
+from shiftschema.filters.stringify import Stringify
+from shiftschema.filters.strip import Strip
+from shiftschema.filters.uppercase import Uppercase
+from functools import partial
+from operator import methodcaller
+import re
+
+
+def add_http(value):
+    """ Add http scheme unless value starts with http or https """
+    if value.startswith(('http://', 'https://')):
+        return value
+    return 'http://' + value
+
+
+class FusedString(AbstractFilter):
+    """
+    Fused string filters
+    Replaces a run of consecutive built-in string filters with a single
+    filter that applies all of them to a string in one go, without repeated
+    type checks and method calls. Redundant steps, like repeated strips or
+    lowercasing an already lowercase slug, are dropped. Non-string values
+    are passed through original filters, so the result always matches the
+    unfused chain.
+
+    Filters are fused by their exact type (subclasses are left alone) and
+    their options are read once, when the filter is created.
+    """
+
+    # results only depend on value and options
+    deterministic = True
+
+    # filter types that can be fused
+    fusable = (
+        Strip,
+        Lowercase,
+        Uppercase,
+        Digits,
+        AddHttp,
+        Stringify,
+        Slugify,
+    )
+
+    # steps that produce the same result when repeated
+    repeatable = ('strip', 'lower', 'upper', 'digits', 'add_http')
+
+    # pattern to remove everything but digits
+    non_digits = re.compile(r'\D+')
+
+    def __init__(self, filters):
+        """
+        Initialize filter
+        Accepts a list of fusable filters and compiles them into steps.
+
+        :param filters:         list, filters to fuse
+        :return:                None
+        """
+        self.filters = list(filters)
+        self.idempotent = all(filter.idempotent for filter in self.filters)
+        self.to_int = False
+        self.steps = self.compile(self.filters)
+
+    @classmethod
+    def can_fuse(cls, filter):
+        """
+        Can fuse
+        Checks whether filter is one of built-in string filters.
+
+        :param filter:          AbstractFilter, filter to check
+        :return:                bool
+        """
+        return type(filter) in cls.fusable
+
+    @classmethod
+    def fuse(cls, filters):
+        """
+        Fuse
+        Returns a list of filters where each run of two or more consecutive
+        fusable filters is replaced with a fused filter. Digits filter
+        converting to integer ends a run, as it does not produce a string.
+
+        :param filters:         list, filters to fuse
+        :return:                list
+        """
+        pipeline = []
+        run = []
+
+        def flush():
+            if len(run) > 1:
+                pipeline.append(cls(run))
+            else:
+                pipeline.extend(run)
+            run.clear()
+
+        for filter in filters:
+            if not cls.can_fuse(filter):
+                flush()
+                pipeline.append(filter)
+                continue
+
+            run.append(filter)
+            if type(filter) is Digits and filter.to_int:
+                flush()
+
+        flush()
+        return pipeline
+
+    def compile(self, filters):
+        """
+        Compile
+        Converts filters into a list of string callables, dropping the
+        redundant ones.
+
+        :param filters:         list, filters to compile
+        :return:                list
+        """
+        steps = []
+        previous = None
+        for filter in filters:
+            if type(filter) is Digits and filter.to_int:
+                self.to_int = True
+
+            step = self.step(filter)
+            if step is None:
+                continue  # stringify is a no-op on strings
+
+            key, func = step
+            if key == previous and key[0] in self.repeatable:
+                continue
+            if key == ('lower',) and previous and previous[0] == 'slug':
+                if previous[1]:
+                    continue  # slug is lowercase already
+
+            steps.append(func)
+            previous = key
+
+        return steps
+
+    def step(self, filter):
+        """
+        Step
+        Returns a key describing what a filter does to a string along with
+        a callable doing that, or None if filter does not change strings.
+
+        :param filter:          AbstractFilter, filter to compile
+        :return:                tuple or None, (key, callable)
+        """
+        kind = type(filter)
+        if kind is Stringify:
+            return None
+        if kind is Lowercase:
+            return ('lower',), str.lower
+        if kind is Uppercase:
+            return ('upper',), str.upper
+        if kind is AddHttp:
+            return ('add_http',), add_http
+        if kind is Digits:
+            return ('digits',), partial(self.non_digits.sub, '')
+        if kind is Strip:
+            method = dict(left='lstrip', right='rstrip', both='strip')
+            method = method[filter.mode]
+            return ('strip', method, filter.chars), methodcaller(
+                method,
+                filter.chars
+            )
+
+        # slug is lowercase unless replacements or separator add uppercase
+        lowercase = filter.lowercase and not filter.replacements
+        if lowercase and isinstance(filter.separator, str):
+            lowercase = filter.separator == filter.separator.lower()
+        return ('slug', lowercase), filter.filter
+
+    def filter(self, value, model=None, context=None):
+        """
+        Filter
+        Performs value filtering and returns filtered result.
+
+        :param value:               input value
+        :param model:               parent model being validated
+        :param context:             object, filtering context
+        :return:                    filtered value
+        """
+        if type(value) is not str:
+            for filter in self.filters:
+                value = filter.filter(value, model=model, context=context)
+            return value
+
+        for step in self.steps:
+            value = step(value)
+
+        if self.to_int and value:
+            value = int(value)
+
+        return value
@@ -1,5 +1,12 @@
 from shiftschema.filters import AbstractFilter
+from shiftschema.exceptions import InvalidOption, NotCanonical
 from bleach.linkifier import Linker
+import threading
+
+
+def default_callback(attrs, new=False):
+    """ Default linkify callback (does not add anything to attrs) """
+    return attrs
 
 
 class Linkify(AbstractFilter):
@@ -12,8 +19,21 @@ class Linkify(AbstractFilter):
 
     See linkify documentation to see how callbacks work:
     https://bleach.readthedocs.io/en/latest/linkify.html
+
+    Linkers are not thread-safe, so the filter creates one per thread on
+    first use and reuses it afterwards.
+
+    Can be given a cache (see shiftschema.cache) to avoid re-linkifying
+    recurring documents. Results are keyed by a hash of the value and filter
+    config, where callbacks are described by their code, defaults, closure
+    cells and partial arguments. Callbacks that can't be described this way
+    raise NotCanonical, surfaced as InvalidOption when creating a filter with
+    a cache.
     """
 
+    # results only depend on value and options
+    deterministic = True
+
     # list of callbacks to apply
     # default: bleach.linkifier.DEFAULT_CALLBACKS
     callbacks = None
@@ -27,13 +47,29 @@ class Linkify(AbstractFilter):
     # prepared list of params for linkifier containing all of the above
     linkify_params = None
 
-    def __init__(self, callbacks=None, skip_tags=None, parse_email=True):
+    # optional cache of linkified results (shiftschema.cache)
+    cache = None
+
+    # cache key prefix derived from linkify params
+    namespace = None
+
+    # attributes not affecting results
+    runtime = ('cache', 'namespace', 'local')
+
+    def __init__(
+        self,
+        callbacks=None,
+        skip_tags=None,
+        parse_email=True,
+        cache=None
+    ):
         """
         Initialize the filter and set bleach linkifier config options
 
         :param callbacks: list of callbacks
         :param skip_tags: list - skips links within these tags
         :param parse_email: bool - whether to linkify emails
+        :param cache: optional cache of results, e.g. LruCache
         """
 
         self.callbacks = callbacks
@@ -49,10 +85,45 @@ class Linkify(AbstractFilter):
         if self.callbacks:
             self.linkify_params['callbacks'] = self.callbacks
         else:
-            def default_callback(attrs, new=False):
-                return attrs
             self.linkify_params['callbacks'] = [default_callback]
 
+        self.cache = cache
+        if cache is not None:
+            try:
+                self.namespace = cache.namespace(
+                    'linkify',
+                    self.linkify_params
+                )
+            except NotCanonical as error:
+                err = 'Unable to cache results of this configuration: {}'
+                raise InvalidOption(err.format(error))
+
+        self.local = threading.local()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['local']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.local = threading.local()
+
+    @property
+    def linker(self):
+        """
+        Linker
+        Returns bleach linker for current thread, creating it on first use.
+
+        :return:                    bleach.linkifier.Linker
+        """
+        linker = getattr(self.local, 'linker', None)
+        if linker is None:
+            linker = Linker(**self.linkify_params)
+            self.local.linker = linker
+
+        return linker
+
     def filter(self, value, model=None, context=None):
         """
         Filter
@@ -68,7 +139,15 @@ class Linkify(AbstractFilter):
         if type(value) is not str:
             return value
 
-        linker = Linker(**self.linkify_params)
-        return linker.linkify(value)
+        if self.cache is None:
+            return self.linker.linkify(value)
+
+        key = self.cache.key(value, self.namespace)
+        filtered = self.cache.get(key)
+        if filtered is None:
+            filtered = self.linker.linkify(value)
+            self.cache.set(key, filtered)
+
+        return filtered
 
 
@@ -9,6 +9,9 @@ class Slugify(AbstractFilter):
     given text.
     """
 
+    # results only depend on value and options
+    deterministic = True
+
     # convert html entities to unicode
     entities = True
 
@@ -9,6 +9,12 @@ class Stringify(AbstractFilter):
     expect a string value
     """
 
+    # results only depend on value and options
+    deterministic = True
+
+    # filtering own output returns it unchanged
+    idempotent = True
+
     none_to_int = False
     false_to_empty = False
 
@@ -41,5 +47,36 @@ class Stringify(AbstractFilter):
 
         return str(value)
 
+    def filter_many(self, values, model=None, context=None):
+        """
+        Filter many
+        Converts a batch of values to strings at once. Arrays of strings
+        are returned as they are, arrays of integers and booleans are cast
+        with NumPy.
+
+        :param values:              iterable, values to filter
+        :param model:               parent model being validated
+        :param context:             object, filtering context
+        :return:                    list or numpy.ndarray
+        """
+        if self.is_string_array(values):
+            return values
+        kinds = 'iu' if self.false_to_empty else 'iub'
+        if getattr(values, 'dtype', None) is not None:
+            if values.dtype.kind in kinds:
+                return values.astype(str)
 
+        none_to_empty = self.none_to_empty
+        false_to_empty = self.false_to_empty
+        filtered = []
+        for value in self.to_list(values):
+            if type(value) is str:
+                filtered.append(value)
+            elif none_to_empty and value is None:
+                filtered.append('')
+            elif false_to_empty and value is False:
+                filtered.append('')
+            else:
+                filtered.append(str(value))
 
+        return filtered
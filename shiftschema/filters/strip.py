@@ -1,4 +1,5 @@
 from shiftschema.filters import AbstractFilter
+from shiftschema.filters.abstract_filter import np
 from shiftschema.exceptions import InvalidOption
 
 
@@ -9,6 +10,12 @@ class Strip(AbstractFilter):
     Either from the front, back or from both sides.
     """
 
+    # results only depend on value and options
+    deterministic = True
+
+    # filtering own output returns it unchanged
+    idempotent = True
+
     def __init__(self, mode='both', chars=None):
         """
         Initialize filter
@@ -51,4 +58,25 @@ class Strip(AbstractFilter):
         else:
             return value.strip(self.chars)
 
+    def filter_many(self, values, model=None, context=None):
+        """
+        Filter many
+        Strips a batch of strings at once, using numpy.char for arrays of
+        strings. Non-string values are returned as they are.
+
+        :param values:              iterable, values to filter
+        :param model:               parent model being validated
+        :param context:             object, filtering context
+        :return:                    list or numpy.ndarray
+        """
+        method = dict(left='lstrip', right='rstrip', both='strip')
+        method = method[self.mode]
+        if self.is_string_array(values):
+            return getattr(np.char, method)(values, self.chars)
 
+        strip = getattr(str, method)
+        chars = self.chars
+        return [
+            strip(value, chars) if type(value) is str else value
+            for value in self.to_list(values)
+        ]
@@ -1,4 +1,5 @@
 from shiftschema.filters import AbstractFilter
+from shiftschema.filters.abstract_filter import np
 
 
 class Uppercase(AbstractFilter):
@@ -8,6 +9,12 @@ class Uppercase(AbstractFilter):
     a string it will be converted to one implicitly.
     """
 
+    # results only depend on value and options
+    deterministic = True
+
+    # filtering own output returns it unchanged
+    idempotent = True
+
     def filter(self, value, model=None, context=None):
         """
         Filter
@@ -25,4 +32,22 @@ class Uppercase(AbstractFilter):
 
         return value.upper()
 
+    def filter_many(self, values, model=None, context=None):
+        """
+        Filter many
+        Converts a batch of strings to uppercase at once, using numpy.char
+        for arrays of strings. Non-string values are returned as they are.
 
+        :param values:              iterable, values to filter
+        :param model:               parent model being validated
+        :param context:             object, filtering context
+        :return:                    list or numpy.ndarray
+        """
+        if self.is_string_array(values):
+            return np.char.upper(values)
+
+        upper = str.upper
+        return [
+            upper(value) if type(value) is str else value
+            for value in self.to_list(values)
+        ]
@@ -0,0 +1,239 @@
+import codecs
+import json
+
+
+class JsonStream:
+    """
+    JSON stream
+    Incremental tokenizer for large JSON documents. Reads a file in chunks
+    and walks members of its top-level object, decoding values one at a
+    time with json.JSONDecoder.raw_decode. Chosen array members can be
+    iterated lazily, item by item, so that a huge array is never held in
+    memory as a whole: only the item being decoded is buffered.
+    """
+
+    whitespace = ' \t\n\r'
+    number = '0123456789+-.eE'
+
+    # decode errors this close to the end of buffer may be caused by a value
+    # cut off at the end of a chunk, like 'tru' or '"\ud83', rather than by
+    # a malformed document
+    lookahead = 16
+
+    def __init__(self, fp, chunk_size=64 * 1024):
+        """
+        Initialize
+        Accepts a file object, opened in text or binary mode (UTF-8), to
+        read the document from.
+
+        :param fp:              file object to read from
+        :param chunk_size:      int, number of characters to read at once
+        :return:                None
+        """
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.utf8 = codecs.getincrementaldecoder('utf-8')()
+        self.buffer = ''
+        self.pos = 0
+        self.offset = 0
+        self.lines = 0
+        self.column = 0
+        self.eof = False
+
+    def error(self, message, pos=None):
+        """
+        Error
+        Returns decode error at current position, or at given position in
+        buffer. Position, line and column of the error are given within the
+        document, while the error holds the buffered part of it only.
+
+        :param message:         str, error message
+        :param pos:             int or None, position in buffer
+        :return:                json.JSONDecodeError
+        """
+        pos = self.pos if pos is None else pos
+        before = self.buffer[:pos]
+        lines = before.count('\n')
+        lineno = self.lines + lines + 1
+        if lines:
+            colno = pos - before.rfind('\n')
+        else:
+            colno = self.column + pos + 1
+
+        offset = self.offset + pos
+        error = json.JSONDecodeError(message, self.buffer, pos)
+        error.pos, error.lineno, error.colno = offset, lineno, colno
+        error.args = ('%s: line %d column %d (char %d)' % (
+            message, lineno, colno, offset
+        ),)
+        return error
+
+    def read(self, size=None):
+        """
+        Read
+        Reads next chunk of the document into buffer, dropping the part
+        that was already consumed.
+
+        :param size:            int or None, number of characters to read
+        :return:                bool, False at the end of the document
+        """
+        if self.eof:
+            return False
+
+        data = self.fp.read(size or self.chunk_size)
+        chunk = data
+        if isinstance(data, bytes):
+            chunk = self.utf8.decode(data, final=not data)
+
+        if not data:
+            self.eof = True
+            if not chunk:
+                return False
+
+        consumed = self.buffer[:self.pos]
+        lines = consumed.count('\n')
+        if lines:
+            self.lines += lines
+            self.column = len(consumed) - consumed.rfind('\n') - 1
+        else:
+            self.column += len(consumed)
+
+        self.offset += self.pos
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """
+        Peek
+        Skips whitespace and returns next character without consuming it,
+        or an empty string at the end of the document.
+
+        :return:                str
+        """
+        while True:
+            buffer = self.buffer
+            pos = self.pos
+            while pos < len(buffer) and buffer[pos] in self.whitespace:
+                pos += 1
+            self.pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self.read():
+                return ''
+
+    def expect(self, chars):
+        """
+        Expect
+        Consumes next character, which must be one of chars.
+
+        :param chars:           str, expected characters
+        :return:                str, consumed character
+        """
+        char = self.peek()
+        if not char or char not in chars:
+            expected = ' or '.join(repr(char) for char in chars)
+            raise self.error('Expecting ' + expected)
+
+        self.pos += 1
+        return char
+
+    def decode(self):
+        """
+        Decode
+        Decodes next value, reading more of the document until it is
+        complete. Numbers are only complete once something other than a
+        number character, or the end of the document, follows them: '1.'
+        decodes as 1 before the rest of '1.5' is read. Malformed values
+        raise as soon as the error is found, unless it may be caused by the
+        value being cut off at the end of buffer.
+
+        :return:                decoded value
+        """
+        if not self.peek():
+            raise self.error('Expecting value')
+
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as error:
+                if self.truncated(error) and self.read(self.more()):
+                    continue
+                raise self.error(error.msg, error.pos) from None
+
+            if self.incomplete(value, end) and self.read(self.more()):
+                continue
+
+            self.pos = end
+            return value
+
+    def truncated(self, error):
+        """ Whether decode error may be caused by end of buffer """
+        if error.msg.startswith('Unterminated string'):
+            return True
+        return len(self.buffer) - error.pos <= self.lookahead
+
+    def incomplete(self, value, end):
+        """ Whether decoded number may continue past end of buffer """
+        if end == len(self.buffer):
+            return True
+        if type(value) not in (int, float):
+            return False
+        return not self.buffer[end:].strip(self.number)
+
+    def more(self):
+        """ Size of next read: grows with value being decoded """
+        return max(self.chunk_size, len(self.buffer) - self.pos)
+
+    def items(self):
+        """
+        Items
+        Iterates over items of an array, decoding one at a time.
+
+        :return:                generator of items
+        """
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+
+        while True:
+            yield self.decode()
+            if self.expect(',]') == ']':
+                return
+
+    def members(self, lazy=()):
+        """
+        Members
+        Iterates over members of the top-level object as (key, value)
+        tuples. Arrays of members named in lazy are given as generators of
+        their items, which must be iterated before moving on to the next
+        member (the rest of the items is skipped otherwise).
+
+        :param lazy:            collection of member names to iterate lazily
+        :return:                generator of (key, value) tuples
+        """
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+        else:
+            while True:
+                key = self.decode()
+                if not isinstance(key, str):
+                    raise self.error('Expecting property name')
+                self.expect(':')
+
+                if key in lazy and self.peek() == '[':
+                    items = self.items()
+                    yield key, items
+                    for _ in items:
+                        pass
+                else:
+                    yield key, self.decode()
+
+                if self.expect(',}') == '}':
+                    break
+
+        if self.peek():
+            raise self.error('Extra data')
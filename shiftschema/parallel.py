@@ -0,0 +1,324 @@
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from itertools import repeat
+import math
+import os
+
+# numpy is optional, only needed to share array columns
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# schema used by worker processes, set by initializer
+worker_schema = None
+
+
+def init_worker(schema):
+    """
+    Init worker
+    Process pool initializer: keeps schema in worker process, so that it is
+    only sent to each worker once rather than with every chunk.
+
+    :param schema:          shiftschema.schema.Schema
+    :return:                None
+    """
+    global worker_schema
+    worker_schema = schema
+
+
+def validate_chunk(schema, start, items, context=None):
+    """
+    Validate chunk
+    Validates a chunk of collection items with schema and returns results
+    of invalid items along with their indexes.
+
+    :param schema:          shiftschema.schema.Schema
+    :param start:           int, index of first item in collection
+    :param items:           list, items to validate
+    :param context:         object, dict or None
+    :return:                list of (index, result) tuples
+    """
+    failures = []
+    for offset, item in enumerate(items):
+        result = schema.validate(model=item, context=context)
+        if not result:
+            failures.append((start + offset, result))
+
+    return failures
+
+
+def validate_chunk_in_worker(start, items, context=None):
+    """ Validate chunk with schema given to worker process on startup """
+    return validate_chunk(worker_schema, start, items, context)
+
+
+def get_chunk_size(size, workers=None, chunk_size=None):
+    """
+    Get chunk size
+    Returns given chunk size or one splitting items evenly into four chunks
+    per worker.
+
+    :param size:            int, number of items
+    :param workers:         int or None, number of workers
+    :param chunk_size:      int or None, number of items per chunk
+    :return:                int
+    """
+    if chunk_size:
+        return chunk_size
+
+    workers = workers or os.cpu_count() or 1
+    return max(1, math.ceil(size / (workers * 4)))
+
+
+def create_executor(schema, workers=None, processes=False):
+    """
+    Create executor
+    Creates a thread pool, or a process pool with schema loaded into each
+    worker.
+
+    :param schema:          shiftschema.schema.Schema
+    :param workers:         int or None, number of workers
+    :param processes:       bool, use processes instead of threads
+    :return:                concurrent.futures.Executor
+    """
+    if not processes:
+        return ThreadPoolExecutor(max_workers=workers)
+
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_worker,
+        initargs=(schema,)
+    )
+
+
+def validate_in_parallel(
+    executor,
+    schema,
+    items,
+    context=None,
+    workers=None,
+    chunk_size=None,
+    processes=False
+):
+    """
+    Validate in parallel
+    Splits items into chunks and validates them with executor. Returns
+    results of invalid items ordered by their index.
+
+    :param executor:        concurrent.futures.Executor
+    :param schema:          shiftschema.schema.Schema
+    :param items:           sequence of items to validate
+    :param context:         object, dict or None
+    :param workers:         int or None, number of workers
+    :param chunk_size:      int or None, number of items per chunk
+    :param processes:       bool, executor is a process pool
+    :return:                list of (index, result) tuples
+    """
+    chunk_size = get_chunk_size(len(items), workers, chunk_size)
+    starts = range(0, len(items), chunk_size)
+    chunks = (items[start:start + chunk_size] for start in starts)
+    if processes:
+        chunk_results = executor.map(
+            validate_chunk_in_worker,
+            starts,
+            chunks,
+            repeat(context)
+        )
+    else:
+        chunk_results = executor.map(
+            validate_chunk,
+            repeat(schema),
+            starts,
+            chunks,
+            repeat(context)
+        )
+
+    failures = []
+    for chunk_failures in chunk_results:
+        failures.extend(chunk_failures)
+
+    return failures
+
+
+def compact(result, start=0):
+    """
+    Compact
+    Reduces batch result of a chunk to what's sent back from a worker
+    process: a mask of invalid rows and errors of invalid rows only.
+
+    :param result:          shiftschema.result.BatchResult
+    :param start:           int, index of first row of the chunk
+    :return:                tuple, (start, mask bytes, dict of errors)
+    """
+    errors = {row: result.errors[row].errors for row in result.errors}
+    return start, bytes(result.mask), errors
+
+
+def share_columns(columns):
+    """
+    Share columns
+    Copies NumPy array columns into shared memory blocks, so that worker
+    processes can read them without copying. Columns of objects and other
+    sequences can't be shared and are left as they are.
+
+    :param columns:         dict, column name to sequence of values
+    :return:                tuple, (dict of shared array specs by column
+                            name, list of shared memory blocks)
+    """
+    shared = dict()
+    blocks = []
+    for name, column in columns.items():
+        if getattr(column, 'dtype', None) is None:
+            continue
+        if column.dtype.kind == 'O' or column.ndim != 1:
+            continue
+
+        block = SharedMemory(create=True, size=max(column.nbytes, 1))
+        blocks.append(block)
+        view = np.ndarray(column.shape, dtype=column.dtype, buffer=block.buf)
+        view[:] = column
+        del view
+        shared[name] = (block.name, column.dtype.str, column.shape)
+
+    return shared, blocks
+
+
+def release(blocks, unlink=False):
+    """
+    Release
+    Closes shared memory blocks and optionally frees them.
+
+    :param blocks:          list of multiprocessing.shared_memory.SharedMemory
+    :param unlink:          bool, free the memory (owner only)
+    :return:                None
+    """
+    for block in blocks:
+        block.close()
+        if unlink:
+            block.unlink()
+
+
+def validate_columns_in_worker(start, stop, shared, columns, context=None):
+    """
+    Validate columns in worker
+    Validates a range of rows with schema given to worker process on
+    startup. Shared array columns are attached and sliced without copying,
+    other columns come already sliced.
+
+    :param start:           int, index of first row
+    :param stop:            int, index after last row
+    :param shared:          dict, shared array specs by column name
+    :param columns:         dict, other columns sliced to the range
+    :param context:         object, dict or None
+    :return:                tuple, (start, mask bytes, dict of errors)
+    """
+    blocks = []
+    columns = dict(columns)
+    try:
+        for name, (block_name, dtype, shape) in shared.items():
+            block = SharedMemory(name=block_name)
+            blocks.append(block)
+            array = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+            columns[name] = array[start:stop]
+            del array
+
+        result = worker_schema.validate_columns(columns, context=context)
+        return compact(result, start)
+    finally:
+        columns.clear()  # views must be gone before closing memory
+        release(blocks)
+
+
+def validate_batch_in_worker(start, models, context=None):
+    """
+    Validate batch in worker
+    Validates a chunk of models with schema given to worker process on
+    startup.
+
+    :param start:           int, index of first model
+    :param models:          list, models to validate
+    :param context:         object, dict or None
+    :return:                tuple, (start, mask bytes, dict of errors)
+    """
+    result = worker_schema.validate_batch(models, context=context)
+    return compact(result, start)
+
+
+def validate_columns_in_processes(
+    schema,
+    columns,
+    size,
+    context=None,
+    workers=None,
+    chunk_size=None
+):
+    """
+    Validate columns in processes
+    Validates row ranges of a columnar batch in a process pool. NumPy array
+    columns are passed through shared memory, so only their specs are sent
+    to workers, and workers only send back masks and errors of invalid
+    rows.
+
+    :param schema:          shiftschema.schema.Schema
+    :param columns:         dict, prepared columns
+    :param size:            int, number of rows
+    :param context:         object, dict or None
+    :param workers:         int or None, number of workers
+    :param chunk_size:      int or None, number of rows per chunk
+    :return:                iterator of (start, mask bytes, dict of errors)
+    """
+    chunk_size = get_chunk_size(size, workers, chunk_size)
+    shared, blocks = share_columns(columns)
+    try:
+        rest = {k: v for k, v in columns.items() if k not in shared}
+        executor = create_executor(schema, workers=workers, processes=True)
+        with executor:
+            futures = []
+            for start in range(0, size, chunk_size):
+                stop = min(start + chunk_size, size)
+                chunk = {k: v[start:stop] for k, v in rest.items()}
+                futures.append(executor.submit(
+                    validate_columns_in_worker,
+                    start,
+                    stop,
+                    shared,
+                    chunk,
+                    context
+                ))
+            for future in futures:
+                yield future.result()
+    finally:
+        release(blocks, unlink=True)
+
+
+def validate_batch_in_processes(
+    schema,
+    models,
+    context=None,
+    workers=None,
+    chunk_size=None
+):
+    """
+    Validate batch in processes
+    Validates chunks of a batch of models in a process pool. Workers only
+    send back masks and errors of invalid models.
+
+    :param schema:          shiftschema.schema.Schema
+    :param models:          sequence of models
+    :param context:         object, dict or None
+    :param workers:         int or None, number of workers
+    :param chunk_size:      int or None, number of models per chunk
+    :return:                iterator of (start, mask bytes, dict of errors)
+    """
+    chunk_size = get_chunk_size(len(models), workers, chunk_size)
+    starts = range(0, len(models), chunk_size)
+    chunks = (models[start:start + chunk_size] for start in starts)
+    executor = create_executor(schema, workers=workers, processes=True)
+    with executor:
+        yield from executor.map(
+            validate_batch_in_worker,
+            starts,
+            chunks,
+            repeat(context)
+        )
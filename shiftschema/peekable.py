@@ -0,0 +1,80 @@
+from collections.abc import Iterator
+
+
+class Peekable:
+    """
+    Peekable
+    Wraps a one-off iterator, like a generator or a database cursor, to let
+    validators look at its items before it gets consumed. Items seen while
+    peeking are buffered and handed out again when consuming, so that the
+    underlying iterator is only ever iterated once. Consumed items are
+    counted, so that size of a collection is known once it is consumed.
+    """
+
+    def __init__(self, iterator):
+        """
+        Initialize
+        Accepts an iterator to wrap.
+
+        :param iterator:        iterator to wrap
+        :return:                None
+        """
+        self.iterator = iter(iterator)
+        self.buffer = []
+        self.consumed = 0
+
+    def __iter__(self):
+        """ Iterate without consuming: items seen are buffered """
+        index = 0
+        while True:
+            if index < len(self.buffer):
+                yield self.buffer[index]
+            else:
+                try:
+                    item = next(self.iterator)
+                except StopIteration:
+                    return
+                self.buffer.append(item)
+                yield item
+            index += 1
+
+    def consume(self):
+        """ Iterate consuming items and releasing buffered ones """
+        buffer = self.buffer
+        self.buffer = []
+        buffer.reverse()
+        while buffer:
+            self.consumed += 1
+            yield buffer.pop()
+
+        for item in self.iterator:
+            self.consumed += 1
+            yield item
+
+    def count(self):
+        """
+        Count
+        Returns number of items. Items not seen yet are buffered, unless
+        the iterator is already consumed.
+
+        :return:                int
+        """
+        for _ in self:
+            pass
+
+        return self.consumed + len(self.buffer)
+
+    @staticmethod
+    def wrap(collection):
+        """
+        Wrap
+        Wraps collection if it is a one-off iterator, returns others as
+        they are.
+
+        :param collection:      collection to wrap
+        :return:                Peekable or collection
+        """
+        if isinstance(collection, Iterator):
+            return Peekable(collection)
+
+        return collection
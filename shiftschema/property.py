@@ -1,8 +1,14 @@
-from shiftschema.filters import AbstractFilter
+from shiftschema.filters import AbstractFilter, FusedString
 from shiftschema.validators import AbstractValidator
 from shiftschema.exceptions import InvalidFilter, InvalidValidator
-from shiftschema.exceptions import InvalidSchemaType
+from shiftschema.exceptions import InvalidSchemaType, InvalidOption
 from shiftschema.validators import Required
+from shiftschema.peekable import Peekable
+from shiftschema.result import CollectionErrors
+from shiftschema import parallel
+from collections.abc import Iterator, Sequence, Sized
+import threading
+import weakref
 
 
 class SimpleProperty:
@@ -10,7 +16,25 @@ class SimpleProperty:
     Simple property
     A single value property on the schema and holds a number of filters and
     validators for this value
+
+    When all filters are idempotent, property can remember recently
+    filtered immutable values (strings, numbers and bytes) and return them
+    as they are when they come in again, e.g. when processing the same
+    model repeatedly. This trades memory for speed, as remembered values
+    are kept alive, so it's off by default: set remember to the number of
+    values to keep. Total length of remembered strings and bytes is capped
+    with remember_size, longer values are never remembered.
     """
+
+    # types of values that can be remembered as filtered
+    immutable = (str, int, float, bool, bytes)
+
+    # number of filtered values to remember (off by default)
+    remember = 0
+
+    # total length of remembered strings and bytes
+    remember_size = 64 * 1024
+
     def __init__(self, use_context=True):
         """
         Initialize property
@@ -21,9 +45,47 @@ class SimpleProperty:
 
         :param use_context: bool, use or ignore passed context
         """
+        self.revision = 0
         self.filters = []
+        self.fused_filters = []
+        self.pipeline = []
         self.validators = []
         self.use_context = use_context
+        self.idempotent = False
+        self.filtered = dict()
+        self.filtered_size = 0
+        self.lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
+    @property
+    def filters(self):
+        """ List of filters """
+        return self._filters
+
+    @filters.setter
+    def filters(self, filters):
+        """ Replace list of filters """
+        self._filters = filters
+        self.revision += 1
+
+    @property
+    def validators(self):
+        """ List of validators """
+        return self._validators
+
+    @validators.setter
+    def validators(self, validators):
+        """ Replace list of validators """
+        self._validators = validators
+        self.revision += 1
 
     def add_filter(self, filter):
         """
@@ -37,8 +99,28 @@ class SimpleProperty:
 
         if filter not in self.filters:
             self.filters.append(filter)
+            self.revision += 1
+            self.fuse()
         return self
 
+    def fuse(self):
+        """
+        Fuse filters
+        Rebuilds filter pipeline, fusing consecutive string filters, unless
+        filters haven't changed since it was last built.
+
+        :return: list, filter pipeline
+        """
+        if self.fused_filters == self.filters:
+            return self.pipeline
+
+        self.pipeline = FusedString.fuse(self.filters)
+        self.idempotent = all(f.idempotent for f in self.filters)
+        self.filtered = dict()
+        self.filtered_size = 0
+        self.fused_filters = list(self.filters)
+        return self.pipeline
+
     def add_validator(self, validator):
         """
         Add validator to property
@@ -51,11 +133,43 @@ class SimpleProperty:
             raise InvalidValidator(err)
 
         self.validators.append(validator)
+        self.revision += 1
         return self
 
+    def version(self):
+        """
+        Version
+        Returns a token that changes when filters or validators are added,
+        removed or replaced, or their lists replaced, see
+        Schema.get_version().
+
+        :return: tuple
+        """
+        return (
+            self.revision,
+            tuple(map(id, self.filters)),
+            tuple(map(id, self.validators))
+        )
+
+    def definition(self):
+        """
+        Definition
+        Describes property for schema fingerprints: its type, filters and
+        validators.
+
+        :return: dict
+        """
+        return dict(
+            type=type(self),
+            use_context=self.use_context,
+            filters=[f.definition() for f in self.filters],
+            validators=[v.definition() for v in self.validators],
+        )
+
     def filter(self, value=None, model=None, context=None):
         """
-        Sequentially applies all the filters to provided value
+        Sequentially applies all the filters to provided value. Consecutive
+        built-in string filters are applied as one fused filter.
 
         :param value: a value to filter
         :param model: parent entity
@@ -64,25 +178,116 @@ class SimpleProperty:
         """
         if value is None:
             return value
-        for filter_obj in self.filters:
+
+        pipeline = self.fuse()
+        remember = self.remember and self.idempotent
+        remember = remember and type(value) in self.immutable
+        if remember and (type(value), value) in self.filtered:
+            return value
+
+        for filter_obj in pipeline:
             value = filter_obj.filter(
                 value=value,
                 model=model,
                 context=context if self.use_context else None
             )
+
+        if remember and type(value) in self.immutable:
+            self.remember_filtered(value)
+
         return value
 
-    def validate(self, value=None, model=None, context=None):
+    def filter_many(self, values, models=None, context=None):
+        """
+        Applies all the filters to a column of values. Filters with batch
+        implementations filter the whole column at once, others are applied
+        to each value, given its row from models. As with filter(), None
+        values are left as they are.
+
+        NumPy arrays of strings are kept as arrays as long as filters
+        support them, so result is either a list or an array.
+
+        :param values: sequence, values to filter
+        :param models: sequence or None, parent entity of each value
+        :param context: filtering context, usually parent entity
+        :return: list or numpy.ndarray, filtered values
+        """
+        if getattr(values, 'dtype', None) is None or values.dtype.kind == 'O':
+            values = AbstractFilter.to_list(values)
+
+        rows = None
+        batch = values
+        if isinstance(values, (list, tuple)) and None in values:
+            rows = [i for i, value in enumerate(values) if value is not None]
+            batch = [values[i] for i in rows]
+
+        context = context if self.use_context else None
+        for filter_obj in self.filters:
+            if filter_obj.vectorized:
+                batch = filter_obj.filter_many(batch, context=context)
+                continue
+
+            batch = AbstractFilter.to_list(batch)
+            batch = [
+                filter_obj.filter(
+                    value=value,
+                    model=models[row] if models is not None else None,
+                    context=context
+                )
+                for row, value in zip(rows or range(len(batch)), batch)
+            ]
+
+        if rows is None:
+            return list(batch) if isinstance(batch, tuple) else batch
+
+        filtered = list(values)
+        for row, value in zip(rows, AbstractFilter.to_list(batch)):
+            filtered[row] = value
+
+        return filtered
+
+    def remember_filtered(self, value):
+        """
+        Remember filtered value
+        Records value produced by idempotent filters to skip filtering it
+        again, forgetting the oldest ones once either the number of values
+        or their total length is over the limit.
+
+        :param value: immutable filtered value
+        :return: None
+        """
+        size = len(value) if isinstance(value, (str, bytes)) else 1
+        if size > self.remember_size:
+            return
+
+        key = (type(value), value)
+        with self.lock:
+            if key in self.filtered:
+                return
+            while self.filtered and (
+                len(self.filtered) >= self.remember
+                or self.filtered_size + size > self.remember_size
+            ):
+                oldest = next(iter(self.filtered))
+                self.filtered_size -= self.filtered.pop(oldest)
+            self.filtered[key] = size
+            self.filtered_size += size
+
+    def validate(self, value=None, model=None, context=None, validators=None):
         """
         Sequentially apply each validator to value and collect errors.
 
         :param value: a value to validate
         :param model: parent entity
         :param context: validation context, usually parent entity
+        :param validators: list of validators to apply, defaults to all
         :return: list of errors (if any)
         """
+        if validators is None:
+            validators = self.validators
+
         errors = []
-        for validator in self.validators:
+        for validator in validators:
             if value is None and not isinstance(validator, Required):
                 continue
 
@@ -96,6 +301,150 @@ class SimpleProperty:
 
         return errors
 
+    def validate_many(self, values, models=None, context=None):
+        """
+        Validate a column of values. Validators with batch implementations
+        check the whole column at once, others are applied to each value,
+        given its row from models. As with validate(), None values are
+        only checked by Required validators. NumPy arrays are validated
+        with validate_array().
+
+        :param values: sequence, values to validate
+        :param models: sequence or None, parent entity of each value
+        :param context: validation context
+        :return: dict, lists of errors mapped by index of invalid values,
+                 ordered by index
+        """
+        if hasattr(values, 'dtype'):
+            return self.validate_array(values, models=models, context=context)
+
+        errors = dict()
+        context = context if self.use_context else None
+        present = None
+        for validator in self.validators:
+            if isinstance(validator, Required):
+                rows = range(len(values))
+                batch = values
+            else:
+                if present is None:
+                    present = [
+                        i for i, value in enumerate(values)
+                        if value is not None
+                    ]
+                rows = present
+                if len(present) == len(values):
+                    batch = values
+                else:
+                    batch = [values[i] for i in present]
+
+            results = self.run_many(validator, batch, rows, models, context)
+            for row, error in zip(rows, results):
+                if error:
+                    if row in errors:
+                        errors[row].append(error)
+                    else:
+                        errors[row] = [error]
+
+        return dict(sorted(errors.items()))
+
+    def validate_array(self, array, models=None, context=None):
+        """
+        Validate a column of values stored as a NumPy array. Validators with
+        array implementations flag invalid values of the whole array and
+        are only run again on these to get their errors. Other validators
+        are given values as a list, as are all of them for arrays of
+        objects, which may hold None values.
+
+        :param array: numpy.ndarray, values to validate
+        :param models: sequence or None, parent entity of each value
+        :param context: validation context
+        :return: dict, lists of errors mapped by index of invalid values,
+                 ordered by index
+        """
+        if array.dtype.kind == 'O':
+            return self.validate_many(array.tolist(), models, context)
+
+        errors = dict()
+        context = context if self.use_context else None
+        values = None
+        for validator in self.validators:
+            if validator.vectorized_arrays:
+                mask = validator.validate_array(array, context=context)
+                rows = mask.nonzero()[0].tolist()
+                batch = [array[row].item() for row in rows]
+                results = self.run_each(
+                    validator,
+                    batch,
+                    rows,
+                    models,
+                    context
+                )
+            else:
+                if values is None:
+                    values = array.tolist()
+                rows = range(len(values))
+                results = self.run_many(
+                    validator,
+                    values,
+                    rows,
+                    models,
+                    context
+                )
+
+            for row, error in zip(rows, results):
+                if error:
+                    if row in errors:
+                        errors[row].append(error)
+                    else:
+                        errors[row] = [error]
+
+        return dict(sorted(errors.items()))
+
+    @staticmethod
+    def run_many(validator, values, rows, models=None, context=None):
+        """
+        Run validator on a batch of values, all at once if it has a batch
+        implementation, otherwise one by one with their parent entities.
+
+        :param validator: AbstractValidator, validator to run
+        :param values: sequence, values to validate
+        :param rows: sequence, index of each value in the column
+        :param models: sequence or None, parent entity of each row
+        :param context: validation context
+        :return: iterable of errors, one per value
+        """
+        if validator.vectorized:
+            return validator.validate_many(values, context=context)
+
+        return SimpleProperty.run_each(
+            validator,
+            values,
+            rows,
+            models,
+            context
+        )
+
+    @staticmethod
+    def run_each(validator, values, rows, models=None, context=None):
+        """
+        Run validator on each value of a batch with its parent entity.
+
+        :param validator: AbstractValidator, validator to run
+        :param values: sequence, values to validate
+        :param rows: sequence, index of each value in the column
+        :param models: sequence or None, parent entity of each row
+        :param context: validation context
+        :return: iterable of errors, one per value
+        """
+        return (
+            validator.run(
+                value=value,
+                model=models[row] if models is not None else None,
+                context=context
+            )
+            for row, value in zip(rows, values)
+        )
+
 
 class EntityProperty(SimpleProperty):
     """
@@ -117,11 +466,19 @@ class EntityProperty(SimpleProperty):
         from shiftschema.schema import Schema
         if isinstance(schema, Schema):
             self._schema = schema
+            self.revision += 1
             return
 
         err = 'Nested schema must be of type "{}" got "{}"'
         raise InvalidSchemaType(err.format(Schema, schema))
 
+    def definition(self):
+        """ Describes property along with fingerprint of nested schema """
+        definition = super().definition()
+        if self._schema is not None:
+            definition['schema'] = self._schema.fingerprint()
+        return definition
+
     def filter_with_schema(self, model=None, context=None):
         """ Perform model filtering with schema """
         if model is None or self.schema is None:
@@ -143,6 +500,16 @@ class EntityProperty(SimpleProperty):
         )
         return result
 
+    def filter_copy_with_schema(self, model=None, context=None):
+        """ Return filtered copy of the model, leaving original untouched """
+        if model is None or self.schema is None:
+            return model
+
+        return self._schema.filter_copy(
+            model=model,
+            context=context if self.use_context else None
+        )
+
 
 class CollectionProperty(EntityProperty):
     """
@@ -150,8 +517,198 @@ class CollectionProperty(EntityProperty):
     Allows to validate nested collection of entities that exist on a property
     of another entity. Filters and validators will be applied to collection as
     whole, when schema will be applied to each item in the collection.
+
+    Collections are validated in a single pass, so any iterable will do,
+    including generators and database cursors, and only results for invalid
+    items are kept, mapped by item index. Number of kept results can be
+    capped with max_errors, in which case the rest of invalid items are
+    only counted.
+
+    Items of large collections can be validated concurrently, see
+    parallelize().
     """
 
+    def __init__(self, use_context=True, max_errors=None):
+        """
+        Initialize property
+        Accepts a flag to use context (see SimpleProperty) and an optional
+        cap on number of invalid item results to keep.
+
+        :param use_context: bool, use or ignore passed context
+        :param max_errors: int or None, number of item results to keep
+        """
+        super().__init__(use_context=use_context)
+        self.max_errors = max_errors
+        self.threshold = None
+        self.workers = None
+        self.processes = False
+        self.chunk_size = None
+        self.executor = None
+        self.executor_schema = None
+        self.executor_version = None
+        self.executor_finalizer = None
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state['executor'] = None
+        state['executor_schema'] = None
+        state['executor_version'] = None
+        state['executor_finalizer'] = None
+        return state
+
+    def definition(self):
+        """ Describes property along with cap on kept item results """
+        definition = super().definition()
+        definition['max_errors'] = self.max_errors
+        return definition
+
+    def parallelize(
+        self,
+        threshold=1000,
+        workers=None,
+        processes=False,
+        chunk_size=None
+    ):
+        """
+        Parallelize
+        Opts in to validating items concurrently once collection has at
+        least threshold items. Uses a thread pool, which helps with
+        validators waiting on I/O or on free-threaded python, or a process
+        pool for CPU-bound validation. Process pools require schema, items,
+        context and results to be picklable. Only validation runs
+        concurrently: when processing, items are filtered in this process
+        first. Only sized collections are parallelized, iterators are
+        always validated in a single pass. Results are ordered by item index
+        either way.
+
+        :param threshold: int, minimum collection size
+        :param workers: int or None, number of workers (default: cpu count)
+        :param processes: bool, use processes instead of threads
+        :param chunk_size: int or None, items per chunk (default: split
+                           evenly into four chunks per worker)
+        :return: shiftschema.property.CollectionProperty
+        """
+        if not isinstance(threshold, int) or threshold < 1:
+            raise InvalidOption('Threshold must be a positive integer')
+        if chunk_size is not None and (
+            not isinstance(chunk_size, int) or chunk_size < 1
+        ):
+            raise InvalidOption('Chunk size must be a positive integer')
+
+        self.shutdown()
+        self.threshold = threshold
+        self.workers = workers
+        self.processes = bool(processes)
+        self.chunk_size = chunk_size
+        return self
+
+    def shutdown(self):
+        """
+        Shutdown
+        Shuts down worker pool, if any. A new one will be started on demand.
+        Pools that are not shut down explicitly are shut down once property
+        gets garbage collected, or on interpreter exit.
+
+        :return: None
+        """
+        if self.executor_finalizer is not None:
+            self.executor_finalizer.detach()
+        if self.executor is not None:
+            self.executor.shutdown()
+        self.executor = None
+        self.executor_schema = None
+        self.executor_version = None
+        self.executor_finalizer = None
+
+    def get_executor(self):
+        """
+        Get executor
+        Returns worker pool, starting it on first use or whenever nested
+        schema was replaced or modified since, as worker processes hold a
+        copy of the schema they were started with.
+
+        :return: concurrent.futures.Executor
+        """
+        version = self._schema.get_version()
+        if self.executor is None or (
+            self.executor_schema is not self._schema
+            or self.executor_version != version
+        ):
+            self.shutdown()
+            self.executor = parallel.create_executor(
+                self._schema,
+                workers=self.workers,
+                processes=self.processes
+            )
+            self.executor_schema = self._schema
+            self.executor_version = version
+            self.executor_finalizer = weakref.finalize(
+                self,
+                self.executor.shutdown,
+                wait=False
+            )
+
+        return self.executor
+
+    def is_parallel(self, collection):
+        """
+        Is parallel
+        Checks whether items of collection should be validated concurrently.
+
+        :param collection: collection to check
+        :return: bool
+        """
+        if self.threshold is None or isinstance(collection, Iterator):
+            return False
+
+        if not isinstance(collection, Sized):
+            return False
+
+        return len(collection) >= self.threshold
+
+    def collect(self, failures):
+        """
+        Collect
+        Gathers results of invalid items, keeping at most max_errors of
+        them and counting the rest.
+
+        :param failures: iterable of (index, result) tuples
+        :return: shiftschema.result.CollectionErrors
+        """
+        result = CollectionErrors()
+        max_errors = self.max_errors
+        for index, item_result in failures:
+            if max_errors is not None and len(result) >= max_errors:
+                result.truncated += 1
+            else:
+                result[index] = item_result
+
+        return result
+
+    def run_in_parallel(self, collection, context=None):
+        """
+        Run in parallel
+        Validates collection items concurrently.
+
+        :param collection: sized collection of items
+        :param context: object, dict or None
+        :return: shiftschema.result.CollectionErrors
+        """
+        items = collection
+        if not isinstance(items, Sequence):
+            items = list(items)
+
+        failures = parallel.validate_in_parallel(
+            self.get_executor(),
+            self._schema,
+            items,
+            context=context if self.use_context else None,
+            workers=self.workers,
+            chunk_size=self.chunk_size,
+            processes=self.processes
+        )
+        return self.collect(failures)
+
     def filter_with_schema(self, collection=None, context=None):
         """ Perform collection items filtering with schema """
         if collection is None or self.schema is None:
@@ -167,23 +724,82 @@ class CollectionProperty(EntityProperty):
             pass
 
     def validate_with_schema(self, collection=None, context=None):
-        """ Validate each item in collection with our schema"""
+        """
+        Validate each item in collection with our schema and return a dict
+        of results for invalid items, mapped by item index.
+        """
         if self._schema is None or not collection:
             return
 
-        result = []
+        if isinstance(collection, Peekable):
+            collection = collection.consume()
+        elif self.is_parallel(collection):
+            return self.run_in_parallel(collection, context)
+
+        result = CollectionErrors()
+        max_errors = self.max_errors
         try:
             for index, item in enumerate(collection):
                 item_result = self._schema.validate(
                     model=item,
                     context=context if self.use_context else None
                 )
-                result.append(item_result)
+                if item_result:
+                    continue
+                if max_errors is not None and len(result) >= max_errors:
+                    result.truncated += 1
+                else:
+                    result[index] = item_result
         except TypeError:
             pass
 
         return result
 
+    def validate_stream(self, items, model=None, context=None):
+        """
+        Validate a peekable stream of items, consuming it. Validators
+        checking size only run once items are consumed and counted, others
+        peek at items before. Returns errors and a dict of results for
+        invalid items, mapped by item index.
+        """
+        sized = [v for v in self.validators if v.sized]
+        peeking = [v for v in self.validators if not v.sized]
+        errors = self.validate(items, model, context, validators=peeking)
+        collection_errors = self.validate_with_schema(items, context)
+        for _ in items.consume():
+            pass
+
+        errors.extend(self.validate(items, model, context, validators=sized))
+        return errors, collection_errors
+
+    def filter_copy_with_schema(self, collection=None, context=None):
+        """
+        Return a collection of filtered copies of items, leaving original
+        collection and its items untouched. Lists and tuples are returned as
+        they are if no items changed, other iterables are always turned
+        into lists.
+        """
+        if collection is None or self.schema is None:
+            return collection
+
+        try:
+            items = [
+                self._schema.filter_copy(
+                    model=item,
+                    context=context if self.use_context else None
+                ) for item in collection
+            ]
+        except TypeError:
+            return collection
+
+        if not isinstance(collection, (list, tuple)):
+            return items
+        if all(new is old for new, old in zip(items, collection)):
+            return collection
+        if isinstance(collection, tuple):
+            return tuple(items)
+        return items
+
 
 
 
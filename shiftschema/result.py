@@ -31,6 +31,16 @@ class Error:
         return r.format(self.__class__.__qualname__, self.message)
 
 
+class CollectionErrors(dict):
+    """
+    Collection errors
+    A dict of results for invalid collection members mapped by member index.
+    When number of stored results is capped, keeps count of invalid members
+    that were left out.
+    """
+    truncated = 0
+
+
 class Result:
     """
     Result
@@ -169,11 +179,16 @@ class Result:
         """
         Add collection errors
         Accepts a list errors coming from validators attached directly,
-        or a list of schema results for each item in the collection.
+        or schema results for collection members: either a dict of results
+        for invalid members mapped by index or a list of results for each
+        member.
+
+        Number of invalid members left out when storing results was capped
+        is recorded on a 'truncated' key of property errors.
 
         :param property_name: str, property name
         :param direct_errors: list, errors from validators attached directly
-        :param collection_errors: list of results for collection members
+        :param collection_errors: dict or list of results for members
         :return: shiftschema.result.Result
         """
         if direct_errors is None and collection_errors is None:
@@ -194,14 +209,21 @@ class Result:
                 self.errors[property_name]['direct'].append(error)
 
         # collection errors
-        if collection_errors:
-            enum = enumerate(collection_errors)
-            errors_dict = {i: e for i, e in enum if not bool(e)}
-            if not errors_dict:
+        truncated = getattr(collection_errors, 'truncated', 0)
+        if collection_errors or truncated:
+            if isinstance(collection_errors, dict):
+                errors_dict = collection_errors
+            else:
+                enum = enumerate(collection_errors)
+                errors_dict = {i: e for i, e in enum if not bool(e)}
+            if not errors_dict and not truncated:
                 return self
 
             if property_name not in self.errors:
                 self.errors[property_name] = dict()
+            if truncated:
+                count = self.errors[property_name].get('truncated', 0)
+                self.errors[property_name]['truncated'] = count + truncated
             if 'collection' not in self.errors[property_name]:
                 self.errors[property_name]['collection'] = errors_dict
             else:
@@ -274,6 +296,11 @@ class Result:
                     remote['schema']
                 )
 
+            # merge counts of left out collection errors
+            if 'truncated' in remote:
+                count = local.get('truncated', 0) + remote['truncated']
+                errors_local[prop]['truncated'] = count
+
             # merge nested collections errors
             if 'collection' in remote and 'collection' in local:
                 for index, result in remote['collection'].items():
@@ -341,8 +368,10 @@ class Result:
             if type(prop_errors) is dict and 'collection' in prop_errors:
                 translated = dict()
                 for index, result in prop_errors['collection'].items():
+                    if isinstance(result, Result):
+                        result = result.errors  # merged ones are dicts
                     translated[index] = self._translate_errors(
-                        result.errors,
+                        result,
                         translate
                     )
                     errors[prop]['collection'] = translated
@@ -359,7 +388,76 @@ class Result:
         return error
 
 
+class BatchResult:
+    """
+    Batch result
+    Represents result of validating a batch of rows. Holds a compact mask
+    flagging invalid rows and results with errors for invalid rows only,
+    mapped by row index.
+    """
+    def __init__(self, size=0, translator=None, locale='en'):
+        self.size = size
+        self.mask = bytearray(size)
+        self.errors = dict()
+        self.translator = translator
+        self.locale = locale
+
+    def __bool__(self):
+        return not self.errors
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        r = '<BatchResult rows={} invalid={}>'
+        return r.format(self.size, len(self.errors))
 
+    @property
+    def invalid(self):
+        """ Sorted indexes of invalid rows """
+        return sorted(self.errors)
 
+    def get(self, row):
+        """
+        Get row result
+        Returns result for a row, creating one if it doesn't exist.
 
+        :param row: int, row index
+        :return: shiftschema.result.Result
+        """
+        if row not in self.errors:
+            self.errors[row] = Result(
+                translator=self.translator,
+                locale=self.locale
+            )
+        self.mask[row] = 1
+        return self.errors[row]
+
+    def add_errors(self, row, property_name, errors):
+        """
+        Add one or several errors to a property of a row.
+        :param row: int, row index
+        :param property_name: str, property name
+        :param errors: list or Error, error object(s)
+        :return: shiftschema.result.BatchResult
+        """
+        self.get(row).add_errors(property_name, errors)
+        return self
 
+    def merge(self, row, result):
+        """
+        Merge result of validating a row, unless it's valid.
+        :param row: int, row index
+        :param result: shiftschema.result.Result
+        :return: shiftschema.result.BatchResult
+        """
+        if not result:
+            self.get(row).merge(result)
+        return self
+
+    def get_messages(self, locale=None):
+        """ Get a dictionary of translated messages mapped by row index """
+        return {
+            row: self.errors[row].get_messages(locale=locale)
+            for row in self.invalid
+        }
@@ -0,0 +1,80 @@
+from shiftschema.exceptions import InvalidOption
+from collections.abc import Sequence
+
+
+class Rows(Sequence):
+    """
+    Rows
+    A read-only sequence of rows over a batch stored as columns. Each row is
+    a dict of column values built on access, so that validators needing a
+    parent model can be given one without converting the whole batch.
+    Values of array columns are given as python values.
+    """
+
+    def __init__(self, columns, size=None):
+        """
+        Initialize
+        Accepts a dict of columns, as returned by prepare(), and number of
+        rows.
+
+        :param columns:         dict, column name to sequence of values
+        :param size:            int or None, number of rows
+        :return:                None
+        """
+        if size is None:
+            columns, size = self.prepare(columns)
+        self.columns = columns
+        self.size = size
+        self.arrays = {
+            name for name, column in columns.items()
+            if hasattr(column, 'dtype')
+        }
+
+    @staticmethod
+    def prepare(columns):
+        """
+        Prepare columns
+        Converts columns to sequences and checks that all of them are of the
+        same length. NumPy arrays are kept as they are, to be validated with
+        array operations, unless they hold objects. Series are converted to
+        arrays, other iterables to lists.
+
+        :param columns:         dict, column name to iterable of values
+        :return:                tuple, (dict of sequences, number of rows)
+        """
+        prepared = dict()
+        size = None
+        for name, column in columns.items():
+            if hasattr(column, 'to_numpy'):
+                column = column.to_numpy()
+            if hasattr(column, 'dtype'):
+                if column.dtype.kind == 'O':
+                    column = column.tolist()
+            elif not isinstance(column, Sequence):
+                column = list(column)
+            if size is not None and len(column) != size:
+                err = 'Columns must be of equal length, got {} and {} on {}'
+                raise InvalidOption(err.format(size, len(column), name))
+            size = len(column)
+            prepared[name] = column
+
+        return prepared, size or 0
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.size))]
+
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError('Row index out of range')
+
+        row = dict()
+        for name, column in self.columns.items():
+            value = column[index]
+            row[name] = value.item() if name in self.arrays else value
+
+        return row
@@ -1,10 +1,22 @@
 from shiftschema.property import SimpleProperty
 from shiftschema.property import EntityProperty
 from shiftschema.property import CollectionProperty
-from shiftschema.result import Result
+from shiftschema.result import Result, BatchResult, CollectionErrors
 from shiftschema.validators import AbstractValidator
 from shiftschema.exceptions import InvalidValidator, PropertyExists
+from shiftschema.exceptions import InvalidOption
 from shiftschema.translator import Translator
+from shiftschema.peekable import Peekable
+from shiftschema.rows import Rows
+from shiftschema.json_stream import JsonStream
+from shiftschema.cache import AbstractCache
+from shiftschema import parallel
+from collections.abc import Iterator
+import copy
+import hashlib
+import io
+import json
+import pickle
 
 
 class Schema:
@@ -17,16 +29,26 @@ class Schema:
     locale = 'en'
     translator = Translator()
 
-    def __init__(self, locale=None, translator=None):
+    # optional cache of results (shiftschema.cache)
+    cache = None
+
+    # types of values models must be made of to be cached
+    cacheable = (str, int, float, bool, type(None))
+
+    def __init__(self, locale=None, translator=None, cache=None):
         self.state = []
         self.properties = {}
         self.entities = {}
         self.collections = {}
+        self._revision = 0
+        self._fingerprint = None
 
         if locale:
             self.locale = locale
         if translator:
             self.translator = translator
+        if cache is not None:
+            self.cache = cache
 
         # or by subclassing
         self.schema()
@@ -59,6 +81,9 @@ class Schema:
         :param property_name: name to get
         :return: obj, property
         """
+        if property_name in ('properties', 'entities', 'collections'):
+            raise AttributeError(property_name)  # not set yet, e.g. unpickling
+
         if property_name in self.properties:
             return self.properties[property_name]
         elif property_name in self.entities:
@@ -80,6 +105,7 @@ class Schema:
 
         if validator not in self.state:
             self.state.append(validator)
+            self._revision += 1
 
     def add_property(self, property_name, use_context=True):
         """
@@ -94,6 +120,7 @@ class Schema:
 
         prop = SimpleProperty(use_context=bool(use_context))
         self.properties[property_name] = prop
+        self._revision += 1
         return prop
 
     def add_entity(self, property_name, use_context=True):
@@ -108,23 +135,130 @@ class Schema:
             raise PropertyExists(err.format(property_name))
         prop = EntityProperty(use_context=bool(use_context))
         self.entities[property_name] = prop
+        self._revision += 1
         return prop
 
-    def add_collection(self, property_name, use_context=True):
+    def add_collection(
+        self,
+        property_name,
+        use_context=True,
+        max_errors=None
+    ):
         """
         Add collection property to schema
         :param property_name: str, property name
-        :param property_name: str, property name
+        :param use_context: bool, whether custom context should be used
+        :param max_errors: int or None, number of item errors to keep
         :return: shiftschema.property.CollectionProperty
         """
         if self.has_property(property_name):
             err = 'Property "{}" already exists'
             raise PropertyExists(err.format(property_name))
 
-        prop = CollectionProperty(use_context=bool(use_context))
+        prop = CollectionProperty(
+            use_context=bool(use_context),
+            max_errors=max_errors
+        )
         self.collections[property_name] = prop
+        self._revision += 1
         return prop
 
+    def get_version(self, seen=None):
+        """
+        Get version
+        Returns a token that changes whenever schema or any of its nested
+        schemas gets modified: state validators, properties, filters,
+        validators or nested schemas added or replaced, or their lists
+        replaced.
+        Filters and validators are expected not to change once added.
+        :param seen: set or None, ids of schemas visited (recursive schemas)
+        :return: tuple
+        """
+        seen = set() if seen is None else seen
+        if id(self) in seen:
+            return None
+
+        seen.add(id(self))
+        version = [self._revision, len(self.state)]
+        for props in (self.properties, self.entities, self.collections):
+            version.append(len(props))
+            for prop in props.values():
+                version.append(prop.version())
+                nested = getattr(prop, 'schema', None)
+                if nested is not None:
+                    version.append(nested.get_version(seen))
+
+        return tuple(version)
+
+    def get_definition(self):
+        """
+        Get definition
+        Describes schema for fingerprints: state validators and properties
+        with their filters, validators and fingerprints of nested schemas.
+        :return: dict
+        """
+        def describe(props):
+            return {name: prop.definition() for name, prop in props.items()}
+
+        return dict(
+            state=[validator.definition() for validator in self.state],
+            properties=describe(self.properties),
+            entities=describe(self.entities),
+            collections=describe(self.collections),
+        )
+
+    def fingerprint(self):
+        """
+        Fingerprint
+        Returns a hash of schema definition, equal for schemas defined the
+        same way, e.g. instances of the same schema class, to be used as a
+        key for caches shared by schemas and processes. It is only computed
+        again once schema gets modified, see get_version().
+        :return: str, hex digest
+        """
+        version = self.get_version()
+        if self._fingerprint and self._fingerprint[0] == version:
+            return self._fingerprint[1] or 'recursive'
+
+        self._fingerprint = (version, None)  # nested references to self
+        try:
+            definition = AbstractCache.canonical(self.get_definition())
+        except BaseException:
+            self._fingerprint = None
+            raise
+
+        digest = hashlib.sha256(definition.encode('utf-8')).hexdigest()
+        self._fingerprint = (version, digest)
+        return digest
+
+    def is_deterministic(self, seen=None):
+        """
+        Is deterministic
+        Checks that results of schema only depend on model and context, as
+        all of its state validators, filters and validators, including those
+        of nested schemas, are deterministic. Results are only cached if so.
+        :param seen: set or None, ids of schemas visited (recursive schemas)
+        :return: bool
+        """
+        seen = set() if seen is None else seen
+        if id(self) in seen:
+            return True
+
+        seen.add(id(self))
+        if not all(validator.deterministic for validator in self.state):
+            return False
+        for props in (self.properties, self.entities, self.collections):
+            for prop in props.values():
+                if not all(f.deterministic for f in prop.filters):
+                    return False
+                if not all(v.deterministic for v in prop.validators):
+                    return False
+                nested = getattr(prop, 'schema', None)
+                if nested is not None and not nested.is_deterministic(seen):
+                    return False
+
+        return True
+
     def get(self, model, property_name):
         """
         Get property from model. Use getter if possible.
@@ -170,12 +304,198 @@ class Schema:
         Perform validation and filtering at the same time, return a
         validation result object.
 
+        Walks the model graph once: simple properties are filtered first,
+        then each nested entity and collection item is filtered and validated
+        in one visit, and finally the model itself is validated, so state and
+        property validators see fully filtered data. Nested validators see
+        their own entity and its parents filtered, but not yet the entities
+        that follow them on the parent. Items of one-off iterators, like
+        generators, are processed one at a time and never held in memory
+        together. Use filter() followed by validate() when nested validators
+        need to see the whole model filtered, e.g. through context.
+
         :param model: object or dict
         :param context: object, dict or None
         :return: shiftschema.result.Result
         """
-        self.filter(model, context)
-        return self.validate(model, context)
+        if model is None:
+            return self.validate(model, context)
+
+        key = self.cache_key('process', model, context)
+        cached = self.load_cached(key, model)
+        if cached is not None:
+            return cached
+
+        values = self.filter_properties(model, context=context)
+        entities = self.process_entities(model, context=context)
+        collections = self.process_collections(model, context=context)
+
+        result = Result(translator=self.translator, locale=self.locale)
+        result.merge(self.validate_state(model, context=context))
+        result.merge(self.validate_properties(
+            model,
+            context=context,
+            values=values
+        ))
+        result.merge(self.validate_entities(
+            model,
+            context=context,
+            processed=entities
+        ))
+        result.merge(self.validate_collections(
+            model,
+            context=context,
+            processed=collections
+        ))
+        self.store_cached(key, result, model)
+        return result
+
+    def process_entities(self, model, context=None):
+        """
+        Process entities
+        Runs filters on entity properties and processes nested entities with
+        their schemas. If a filter replaces the entity, the original gets
+        filtered and the replacement validated, same as with separate
+        filtering and validation.
+
+        :param model:  object or dict
+        :param context: object, dict or None
+        :return: dict, property name to (value, nested schema result)
+        """
+        processed = dict()
+        for property_name in self.entities:
+            prop = self.entities[property_name]
+            value = self.get(model, property_name)
+
+            filtered_value = prop.filter(
+                value=value,
+                model=model,
+                context=context
+            )
+            current = value
+            if value != filtered_value:  # unless changed!
+                self.set(model, property_name, filtered_value)
+                current = self.get(model, property_name)
+
+            if current is value:
+                schema_result = None
+                if prop.schema is not None and value is not None:
+                    schema_result = prop.schema.process(
+                        model=value,
+                        context=context if prop.use_context else None
+                    )
+            else:
+                prop.filter_with_schema(model=value, context=context)
+                schema_result = prop.validate_with_schema(
+                    model=current,
+                    context=context
+                )
+
+            processed[property_name] = (current, schema_result)
+
+        return processed
+
+    def process_collections(self, model, context=None):
+        """
+        Process collections
+        Runs filters on collection properties and processes each item with
+        collection schema. If a filter replaces the collection, items of
+        the original get filtered and items of the replacement validated,
+        same as with separate filtering and validation.
+
+        One-off iterators, like generators, can only be iterated once, so
+        validators attached to such collections directly run before items
+        are processed.
+
+        :param model:  object or dict
+        :param context: object, dict or None
+        :return: dict, property name to (collection, direct errors or None,
+                 item results)
+        """
+        processed = dict()
+        for property_name in self.collections:
+            prop = self.collections[property_name]
+            collection = self.get(model, property_name)
+            filtered_value = prop.filter(
+                value=collection,
+                model=model,
+                context=context
+            )
+            self.set(model, property_name, filtered_value)
+            current = self.get(model, property_name)
+            replaced = current is not collection
+
+            errors = None
+            current = Peekable.wrap(current)
+            if isinstance(current, Peekable):
+                errors = prop.validate(
+                    value=current,
+                    model=model,
+                    context=context
+                )
+
+            if not replaced:
+                collection_results = self.process_items(
+                    prop,
+                    current,
+                    context=context
+                )
+            else:
+                prop.filter_with_schema(
+                    collection,
+                    context if prop.use_context else None
+                )
+                collection_results = prop.validate_with_schema(
+                    collection=current,
+                    context=context
+                )
+
+            processed[property_name] = (current, errors, collection_results)
+
+        return processed
+
+    def process_items(self, prop, collection, context=None):
+        """
+        Process items
+        Filters and validates each item of a collection with collection
+        schema in one visit, returning results of invalid items mapped by
+        item index. Items are processed one at a time, so that those of
+        one-off iterators are never held in memory together. Collections
+        validated in parallel get their items filtered first and then
+        validated concurrently.
+
+        :param prop: shiftschema.property.CollectionProperty
+        :param collection: collection of items
+        :param context: object, dict or None
+        :return: shiftschema.result.CollectionErrors or None
+        """
+        if prop.schema is None or not collection:
+            return None
+
+        if isinstance(collection, Peekable):
+            collection = collection.consume()
+        elif prop.is_parallel(collection):
+            prop.filter_with_schema(collection, context)
+            return prop.validate_with_schema(collection, context)
+
+        result = CollectionErrors()
+        max_errors = prop.max_errors
+        try:
+            for index, item in enumerate(collection):
+                item_result = prop.schema.process(
+                    model=item,
+                    context=context if prop.use_context else None
+                )
+                if item_result:
+                    continue
+                if max_errors is not None and len(result) >= max_errors:
+                    result.truncated += 1
+                else:
+                    result[index] = item_result
+        except TypeError:
+            pass
+
+        return result
 
     def filter(self, model=None, context=None):
         """
@@ -202,14 +522,16 @@ class Schema:
         Runs filters on simple properties changing them in place.
         :param model:  object or dict
         :param context: object, dict or None
-        :return: None
+        :return: dict, filtered values of properties
         """
         if model is None:
             return
 
+        values = dict()
         for property_name in self.properties:
             prop = self.properties[property_name]
             value = self.get(model, property_name)
+            values[property_name] = value
             if value is None:
                 continue
 
@@ -220,6 +542,9 @@ class Schema:
             )
             if value != filtered_value:  # unless changed!
                 self.set(model, property_name, filtered_value)
+                values[property_name] = self.get(model, property_name)
+
+        return values
 
     def filter_entities(self, model, context=None):
         """
@@ -275,6 +600,136 @@ class Schema:
                 context if prop.use_context else None
             )
 
+    def filter_copy(self, model=None, context=None):
+        """
+        Filter copy
+        Performs filtering without changing the model. Returns a filtered
+        copy that shares all unchanged values, nested entities and
+        collections with the original, or the model itself if nothing
+        changed. Nested schemas are applied to entities and collections as
+        returned by the filters attached to them. Objects are copied along
+        with their internal state, so that copies can be written to through
+        setters, see copy().
+
+        :param model: object or dict
+        :param context: object, dict or None
+        :return: filtered copy of the model
+        """
+        if model is None:
+            return model
+
+        changes = dict()
+        values = []
+        for property_name in self.properties:
+            prop = self.properties[property_name]
+            value = self.get(model, property_name)
+            values.append(value)
+            if value is None:
+                continue
+
+            filtered_value = prop.filter(
+                value=value,
+                model=model,
+                context=context
+            )
+            if self.changed(value, filtered_value):
+                changes[property_name] = filtered_value
+
+        for property_name in self.entities:
+            prop = self.entities[property_name]
+            value = self.get(model, property_name)
+            values.append(value)
+            filtered_value = prop.filter(
+                value=value,
+                model=model,
+                context=context
+            )
+            filtered_value = prop.filter_copy_with_schema(
+                model=filtered_value,
+                context=context
+            )
+            if self.changed(value, filtered_value):
+                changes[property_name] = filtered_value
+
+        for property_name in self.collections:
+            prop = self.collections[property_name]
+            collection = self.get(model, property_name)
+            values.append(collection)
+            filtered_value = prop.filter(
+                value=collection,
+                model=model,
+                context=context
+            )
+            filtered_value = prop.filter_copy_with_schema(
+                collection=filtered_value,
+                context=context
+            )
+            if self.changed(collection, filtered_value):
+                changes[property_name] = filtered_value
+
+        if not changes:
+            return model
+
+        model = self.copy(model, shared=values)
+        for property_name, value in changes.items():
+            self.set(model, property_name, value)
+
+        return model
+
+    def process_copy(self, model=None, context=None):
+        """
+        Process copy
+        Performs filtering without changing the model and validates the
+        filtered copy.
+
+        :param model: object or dict
+        :param context: object, dict or None
+        :return: tuple, (filtered copy, shiftschema.result.Result)
+        """
+        filtered = self.filter_copy(model, context=context)
+        return filtered, self.validate(filtered, context=context)
+
+    @staticmethod
+    def copy(model, shared=()):
+        """
+        Copy model
+        Makes a copy of a dict or an object that can be written to without
+        changing the original. Dicts are copied shallowly, as they are
+        written to directly. Objects may keep property values in internal
+        containers behind getters and setters, so they are copied deeply,
+        except for shared values, like values of properties, which the copy
+        keeps referencing.
+
+        :param model: object or dict
+        :param shared: iterable of values not to copy
+        :return: copy of the model
+        """
+        if type(model) is dict:
+            return dict(model)
+
+        memo = {id(value): value for value in shared}
+        return copy.deepcopy(model, memo)
+
+    @staticmethod
+    def changed(value, filtered_value):
+        """
+        Check whether filtering changed a value
+        Compares immutable scalars by value and everything else by identity
+        to avoid deep comparison of large nested values.
+
+        :param value: original value
+        :param filtered_value: filtered value
+        :return: bool
+        """
+        if filtered_value is value:
+            return False
+
+        scalars = (str, int, float, bool, bytes)
+        if type(value) in scalars and type(filtered_value) is type(value):
+            return value != filtered_value
+
+        return True
+
     def validate(self, model=None, context=None):
         """
         Validate model and return validation result object
@@ -282,6 +737,10 @@ class Schema:
         :param context: object, dict or None
         :return: shiftschema.result.Result
         """
+        key = self.cache_key('validate', model, context)
+        cached = self.load_cached(key)
+        if cached is not None:
+            return cached
 
         # inject with settings
         result = Result(translator=self.translator, locale=self.locale)
@@ -303,6 +762,315 @@ class Schema:
         result.merge(collections_result)
 
         # and return
+        self.store_cached(key, result)
+        return result
+
+    def is_plain(self, value):
+        """
+        Is plain
+        Checks that value is made of dicts with string keys, lists and
+        scalars only, like decoded JSON, so that its JSON encoding with
+        sorted keys identifies it by content.
+
+        :param value: value to check
+        :return: bool
+        """
+        if type(value) in self.cacheable:
+            return True
+        if type(value) is list:
+            return all(map(self.is_plain, value))
+        if type(value) is dict:
+            return all(type(k) is str for k in value) and all(
+                map(self.is_plain, value.values())
+            )
+
+        return False
+
+    def cache_key(self, operation, model, context=None):
+        """
+        Cache key
+        Returns content-addressed key for result of an operation on a model
+        if schema has a cache, is deterministic and model is a dict that can
+        be hashed by content, along with context. Returns None otherwise.
+
+        :param operation: str, operation name, e.g. 'validate'
+        :param model: object or dict
+        :param context: object, dict or None
+        :return: str or None
+        """
+        if self.cache is None or type(model) is not dict:
+            return None
+        if not self.is_plain(model) or not self.is_plain(context):
+            return None
+        if not self.is_deterministic():
+            return None
+
+        namespace = 'schema.' + operation + ':' + self.fingerprint()
+        content = json.dumps([model, context], sort_keys=True)
+        return self.cache.key(content, namespace)
+
+    def load_cached(self, key, model=None):
+        """
+        Load cached
+        Returns cached result for a key, or None on miss. When given a model
+        it gets updated in place to the cached filtered model.
+
+        :param key: str or None, cache key
+        :param model: dict or None, model to update
+        :return: shiftschema.result.Result or None
+        """
+        if key is None:
+            return None
+
+        cached = self.cache.get(key)
+        if cached is None:
+            return None
+
+        unpickler = pickle.Unpickler(io.BytesIO(cached))
+        unpickler.persistent_load = lambda _: self.translator
+        errors, filtered = unpickler.load()
+        if model is not None:
+            model.clear()
+            model.update(filtered)
+
+        return Result(errors, translator=self.translator, locale=self.locale)
+
+    def store_cached(self, key, result, model=None):
+        """
+        Store cached
+        Stores errors of a result along with filtered model under a key.
+        Translators of nested results are left out and replaced with
+        schema translator when loading.
+
+        :param key: str or None, cache key
+        :param result: shiftschema.result.Result
+        :param model: dict or None, filtered model
+        :return: None
+        """
+        if key is None:
+            return
+
+        data = io.BytesIO()
+        pickler = pickle.Pickler(data, protocol=pickle.HIGHEST_PROTOCOL)
+        pickler.persistent_id = lambda obj: (
+            'translator' if isinstance(obj, Translator) else None
+        )
+        pickler.dump((result.errors, model))
+        self.cache.set(key, data.getvalue())
+
+    def validate_json(self, fp, context=None, chunk_size=64 * 1024):
+        """
+        Validate JSON
+        Validates a JSON document with a top-level object as it is read from
+        a file, without loading it in memory as a whole. Arrays of
+        collections with a schema are streamed: each item is decoded,
+        validated with collection schema and discarded before the next one
+        is read. Other members are decoded into a dict model as usual.
+
+        Validators attached to streamed collections directly run on a
+        peekable iterator of items, while the model only holds members that
+        precede the collection. Those checking size only, like Length, run
+        once all items are counted. State validators never see streamed
+        collections. Malformed documents raise json.JSONDecodeError.
+
+        :param fp: file object, opened in text or binary mode
+        :param context: object, dict or None
+        :param chunk_size: int, number of characters to read at once
+        :return: shiftschema.result.Result
+        """
+        lazy = {
+            name for name, prop in self.collections.items()
+            if prop.schema is not None
+        }
+
+        model = dict()
+        streamed = dict()
+        stream = JsonStream(fp, chunk_size=chunk_size)
+        for property_name, value in stream.members(lazy=lazy):
+            if not isinstance(value, Iterator):
+                model[property_name] = value
+                continue
+
+            prop = self.collections[property_name]
+            errors, collection_errors = prop.validate_stream(
+                items=Peekable(value),
+                model=model,
+                context=context
+            )
+            streamed[property_name] = (None, errors, collection_errors)
+
+        result = Result(translator=self.translator, locale=self.locale)
+        result.merge(self.validate_state(model, context=context))
+        result.merge(self.validate_properties(model, context=context))
+        result.merge(self.validate_entities(model, context=context))
+        result.merge(self.validate_collections(
+            model,
+            context=context,
+            processed=streamed
+        ))
+        return result
+
+    def validate_columns(
+        self,
+        columns,
+        context=None,
+        workers=None,
+        chunk_size=None
+    ):
+        """
+        Validate columns
+        Validates a batch of rows stored as columns: a dict of lists, arrays
+        or other sequences of values mapped by property name. Each simple
+        property is validated a column at a time, using batch
+        implementations of validators where available, and array
+        implementations for columns stored as NumPy arrays. State validators,
+        nested entities and collections are validated a row at a time, with
+        rows given as dicts. Missing columns hold None values.
+
+        Given a number of workers, row ranges are validated in a process
+        pool. Array columns are then passed to workers in shared memory,
+        other columns are pickled. Schema, context and errors must be
+        picklable.
+
+        :param columns: dict, column name to sequence of values
+        :param context: object, dict or None
+        :param workers: int or None, number of worker processes
+        :param chunk_size: int or None, number of rows per worker task
+        :return: shiftschema.result.BatchResult
+        """
+        columns, size = Rows.prepare(columns)
+        if workers is None:
+            return self.validate_rows(columns, Rows(columns, size), context)
+
+        self.check_workers(workers, chunk_size)
+        chunks = parallel.validate_columns_in_processes(
+            self,
+            columns,
+            size,
+            context=context,
+            workers=workers,
+            chunk_size=chunk_size
+        )
+        return self.collect_batch(size, chunks)
+
+    def validate_batch(
+        self,
+        models,
+        context=None,
+        workers=None,
+        chunk_size=None
+    ):
+        """
+        Validate batch
+        Validates a batch of models, objects or dicts, the way
+        validate_columns() does: simple properties are collected into
+        columns to be validated a column at a time, while state validators,
+        nested entities and collections are given each model.
+
+        Given a number of workers, chunks of models are validated in a
+        process pool. Schema, models, context and errors must be picklable.
+
+        :param models: iterable of models
+        :param context: object, dict or None
+        :param workers: int or None, number of worker processes
+        :param chunk_size: int or None, number of models per worker task
+        :return: shiftschema.result.BatchResult
+        """
+        if not isinstance(models, (list, tuple)):
+            models = list(models)
+
+        if workers is None:
+            columns = {
+                name: [self.get(model, name) for model in models]
+                for name in self.properties
+            }
+            return self.validate_rows(columns, models, context)
+
+        self.check_workers(workers, chunk_size)
+        chunks = parallel.validate_batch_in_processes(
+            self,
+            models,
+            context=context,
+            workers=workers,
+            chunk_size=chunk_size
+        )
+        return self.collect_batch(len(models), chunks)
+
+    @staticmethod
+    def check_workers(workers, chunk_size=None):
+        """
+        Check workers
+        Checks options for validating batches in a process pool.
+        :param workers: int, number of worker processes
+        :param chunk_size: int or None, number of rows per worker task
+        :return: None
+        """
+        if not isinstance(workers, int) or workers < 1:
+            raise InvalidOption('Workers must be a positive integer')
+        if chunk_size is not None and (
+            not isinstance(chunk_size, int) or chunk_size < 1
+        ):
+            raise InvalidOption('Chunk size must be a positive integer')
+
+    def collect_batch(self, size, chunks):
+        """
+        Collect batch
+        Puts together batch result from compact results of validating its
+        chunks in worker processes.
+        :param size: int, number of rows
+        :param chunks: iterable of (start, mask bytes, dict of errors)
+        :return: shiftschema.result.BatchResult
+        """
+        result = BatchResult(
+            size,
+            translator=self.translator,
+            locale=self.locale
+        )
+        for start, mask, errors in chunks:
+            result.mask[start:start + len(mask)] = mask
+            for row, row_errors in errors.items():
+                result.merge(start + row, Result(row_errors))
+
+        return result
+
+    def validate_rows(self, columns, rows, context=None):
+        """
+        Validate rows
+        Validates simple properties a column at a time and the rest a row
+        at a time. Used by validate_columns() and validate_batch().
+        :param columns: dict, prepared columns of simple properties
+        :param rows: sequence of models, one per row
+        :param context: object, dict or None
+        :return: shiftschema.result.BatchResult
+        """
+        size = len(rows)
+        result = BatchResult(
+            size,
+            translator=self.translator,
+            locale=self.locale
+        )
+
+        # validate simple properties by column
+        for property_name, prop in self.properties.items():
+            values = columns.get(property_name)
+            if values is None:
+                values = [None] * size
+
+            errors = prop.validate_many(values, models=rows, context=context)
+            for row, row_errors in errors.items():
+                result.add_errors(row, property_name, row_errors)
+
+        # validate the rest by row
+        if not self.state and not self.entities and not self.collections:
+            return result
+
+        for row, model in enumerate(rows):
+            row_result = Result()
+            row_result.merge(self.validate_state(model, context=context))
+            row_result.merge(self.validate_entities(model, context=context))
+            row_result.merge(self.validate_collections(model, context=context))
+            result.merge(row, row_result)
+
         return result
 
     def validate_state(self, model, context=None):
@@ -325,18 +1093,22 @@ class Schema:
 
         return result
 
-    def validate_properties(self, model, context=None):
+    def validate_properties(self, model, context=None, values=None):
         """
         Validate simple properties
         Performs validation on simple properties to return a result object.
         :param model:  object or dict
         :param context: object, dict or None
+        :param values: dict, property values already got from model
         :return: shiftschema.result.Result
         """
         result = Result()
         for property_name in self.properties:
             prop = self.properties[property_name]
-            value = self.get(model, property_name)
+            if values is not None:
+                value = values[property_name]
+            else:
+                value = self.get(model, property_name)
             errors = prop.validate(
                 value=value,
                 model=model,
@@ -351,18 +1123,22 @@ class Schema:
 
         return result
 
-    def validate_entities(self, model, context=None):
+    def validate_entities(self, model, context=None, processed=None):
         """
         Validate entity properties
         Performs validation on entity properties to return a result object.
         :param model:  object or dict
         :param context: object, dict or None
+        :param processed: dict, entities already processed with schemas
         :return: shiftschema.result.Result
         """
         result = Result()
         for property_name in self.entities:
             prop = self.entities[property_name]
-            value = self.get(model, property_name)
+            if processed is not None:
+                value, schema_valid = processed[property_name]
+            else:
+                value = self.get(model, property_name)
 
             errors = prop.validate(
                 value=value,
@@ -378,10 +1154,11 @@ class Schema:
             if value is None:
                 continue
 
-            schema_valid = prop.validate_with_schema(
-                model=value,
-                context=context
-            )
+            if processed is None:
+                schema_valid = prop.validate_with_schema(
+                    model=value,
+                    context=context
+                )
             if schema_valid == False:
                 result.add_entity_errors(
                     property_name,
@@ -390,34 +1167,43 @@ class Schema:
 
         return result
 
-    def validate_collections(self, model, context=None):
+    def validate_collections(self, model, context=None, processed=None):
         """
         Validate collection properties
         Performs validation on collection properties to return a result object.
         :param model:  object or dict
         :param context: object, dict or None
+        :param processed: dict, collections already processed with schemas
         :return: shiftschema.result.Result
         """
         result = Result()
+        processed = processed or dict()
         for property_name in self.collections:
             prop = self.collections[property_name]
-            collection = self.get(model, property_name)
+            errors = None
+            if property_name in processed:
+                processed_collection = processed[property_name]
+                collection, errors, collection_errors = processed_collection
+            else:
+                collection = Peekable.wrap(self.get(model, property_name))
 
-            errors = prop.validate(
-                value=collection,
-                model=model,
-                context=context
-            )
+            if errors is None:
+                errors = prop.validate(
+                    value=collection,
+                    model=model,
+                    context=context
+                )
             if len(errors):
                 result.add_collection_errors(
                     property_name=property_name,
                     direct_errors=errors
                 )
 
-            collection_errors = prop.validate_with_schema(
-                collection=collection,
-                context=context
-            )
+            if property_name not in processed:
+                collection_errors = prop.validate_with_schema(
+                    collection=collection,
+                    context=context
+                )
 
             result.add_collection_errors(
                 property_name=property_name,
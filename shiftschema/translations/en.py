@@ -35,4 +35,8 @@ translations = {
 
     # ip
     '%invalid_ip%': 'This is not a valid IPv4 or IPv6 address',
+
+    # ip network
+    '%ip_denied%': 'This IP address belongs to a denied network',
+    '%ip_not_allowed%': 'This IP address is not in an allowed network',
 }
@@ -34,5 +34,9 @@ translations = {
 
     # ip
     '%invalid_ip%': 'Некорректный адрес IPv4 или IPv6',
+
+    # ip network
+    '%ip_denied%': 'IP-адрес принадлежит запрещённой сети',
+    '%ip_not_allowed%': 'IP-адрес не входит в разрешённые сети',
 }
 
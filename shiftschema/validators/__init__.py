@@ -1,4 +1,5 @@
 from shiftschema.validators.abstract_validator import AbstractValidator
+from shiftschema.validators.choice_index import ChoiceIndex
 from shiftschema.validators.choice import Choice
 from shiftschema.validators.multichoice import MultiChoice
 from shiftschema.validators.digits import Digits
@@ -8,6 +9,8 @@ from shiftschema.validators.required import Required
 from shiftschema.validators.not_empty import NotEmpty
 from shiftschema.validators.url import Url
 from shiftschema.validators.ip import Ip
+from shiftschema.validators.network_index import NetworkIndex
+from shiftschema.validators.ip_network import IpNetwork
 
 
 
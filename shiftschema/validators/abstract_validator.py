@@ -2,14 +2,35 @@ from abc import ABCMeta, abstractmethod
 from shiftschema.result import Error
 from shiftschema.exceptions import InvalidErrorType
 
+# numpy is optional, only needed to validate arrays
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class AbstractValidator(metaclass=ABCMeta):
     """
     Abstract validator
     Provides a base for concrete validators and your custom validators. All
     of those can be added to simple properties on the processor.
+
+    Validators whose results only depend on value, model, context and their
+    options should declare themselves deterministic. Schemas only cache
+    results when all of their validators and filters are deterministic,
+    unlike those that load data or query a database, for example.
     """
 
+    # whether results only depend on value, model, context and options
+    deterministic = False
+
+    # attributes holding runtime state rather than configuration
+    runtime = ()
+
+    # whether only size of values is checked, so that streamed collections
+    # can be validated once consumed, see Schema.validate_json()
+    sized = False
+
     @abstractmethod
     def validate(self, value, model=None, context=None):
         """
@@ -47,3 +68,74 @@ class AbstractValidator(metaclass=ABCMeta):
             )
 
         return res
+
+    def validate_many(self, values, model=None, context=None):
+        """
+        Validate many
+        Validates a batch of values sharing the same model and context and
+        returns a list of errors, one per value. Override this in concrete
+        validators to provide faster batch implementations.
+
+        :param values:              iterable, values to validate
+        :param model:               parent model of the property
+        :param context:             parent model or custom context
+        :return:                    list of shiftschema.result.Error
+        """
+        return [self.run(value, model, context) for value in values]
+
+    @property
+    def vectorized(self):
+        """
+        Vectorized
+        Whether validator provides its own batch implementation. Values of
+        a column are only validated as a batch by such validators, others
+        are run per value, with each row given as model.
+
+        :return:                    bool
+        """
+        return type(self).validate_many is not AbstractValidator.validate_many
+
+    def definition(self):
+        """
+        Definition
+        Describes validator for schema fingerprints: its class and instance
+        attributes, except those listed as runtime state. Override this if
+        attributes of your validator don't describe what it does.
+
+        :return:                    list, [class, dict of attributes]
+        """
+        config = {
+            name: value for name, value in vars(self).items()
+            if name not in self.runtime
+        }
+        return [type(self), config]
+
+    def validate_array(self, array, model=None, context=None):
+        """
+        Validate array
+        Validates a NumPy array of values sharing the same model and context
+        and returns a boolean mask flagging invalid values. Override this in
+        concrete validators to check arrays with NumPy operations, by
+        default values are validated as a list.
+
+        :param array:               numpy.ndarray, values to validate
+        :param model:               parent model of the property
+        :param context:             parent model or custom context
+        :return:                    numpy.ndarray of bool
+        """
+        values = array.tolist()
+        errors = self.validate_many(values, model, context)
+        return np.fromiter(map(bool, errors), dtype=bool, count=len(values))
+
+    @property
+    def vectorized_arrays(self):
+        """
+        Vectorized arrays
+        Whether validator provides its own array implementation. Such
+        validators check array columns as a whole and are only run again
+        on invalid values to get their errors.
+
+        :return:                    bool
+        """
+        implementation = type(self).validate_array
+        return implementation is not AbstractValidator.validate_array
@@ -1,6 +1,7 @@
 from shiftschema.validators.abstract_validator import AbstractValidator
+from shiftschema.validators.choice_index import ChoiceIndex
+from shiftschema.validators.abstract_validator import np
 from shiftschema.result import Error
-from shiftschema.exceptions import InvalidOption
 
 
 class Choice(AbstractValidator):
@@ -12,25 +13,35 @@ class Choice(AbstractValidator):
 
     invalid_choice = '%choice_not_valid%'
 
-    def __init__(self, valid_choices=None, message=None):
+    # choices as given, described by index
+    runtime = ('choices',)
+
+    def __init__(self, valid_choices=None, message=None, ttl=None):
         """
         Initialize validator
-        Accepts an iterable of valid choices to check against.
+        Accepts an iterable of valid choices to check against. Can also
+        accept a callable provider to load choices lazily on first use or
+        a prepared ChoiceIndex that can be shared between validators.
+        Provided choices can be periodically refreshed by setting a TTL.
 
-        :param min:             int or None, minimum length
-        :param max:             int or None, maximum length
+        :param valid_choices:   iterable, callable or ChoiceIndex
         :param message:         str, custom error message
+        :param ttl:             int or float, seconds to keep provided choices
         :return:                None
         """
         if message is not None:
             self.invalid_choice = message
 
-        try:
-            iter(valid_choices)
-        except TypeError:
-            raise InvalidOption('Choices must be an iterable')
-
         self.choices = valid_choices
+        if isinstance(valid_choices, ChoiceIndex):
+            self.index = valid_choices
+        else:
+            self.index = ChoiceIndex(valid_choices, ttl=ttl)
+
+    @property
+    def deterministic(self):
+        """ Choices loaded from a provider may change """
+        return self.index.provider is None
 
     def validate(self, value, model=None, context=None):
         """
@@ -44,10 +55,64 @@ class Choice(AbstractValidator):
         :return:                shiftschema.result.Error
         """
 
-        if value not in self.choices:
+        if value not in self.index:
             return Error(self.invalid_choice)
 
         # success otherwise
         return Error()
 
+    def validate_many(self, values, model=None, context=None):
+        """
+        Validate many
+        Validates a batch of values and returns a list of errors, one per
+        value. Invalid values are found with a single set difference when
+        possible. Valid values share the same empty error.
+
+        :param values:          iterable, values to check
+        :param model:           parent model being validated
+        :param context:         object or None, validation context
+        :return:                list of shiftschema.result.Error
+        """
+        if not isinstance(values, (list, tuple)):
+            values = list(values)
+
+        valid = Error()
+        invalid = self.index.invalid(values)
+        if not invalid:
+            return [valid] * len(values)
+
+        try:
+            invalid = set(invalid)
+            return [
+                Error(self.invalid_choice) if value in invalid else valid
+                for value in values
+            ]
+        except TypeError:
+            index = self.index
+            return [
+                valid if value in index else Error(self.invalid_choice)
+                for value in values
+            ]
+
+    def validate_array(self, array, model=None, context=None):
+        """
+        Validate array
+        Looks up string, bytes and numeric arrays with numpy.isin against
+        indexed choices of matching type, and returns a mask flagging
+        invalid values.
+
+        :param array:           numpy.ndarray, values to check
+        :param model:           parent model being validated
+        :param context:         object or None, validation context
+        :return:                numpy.ndarray of bool
+        """
+        hashed, unhashed = self.index.load()
+        kind = array.dtype.kind
+        types = dict(U=str, S=bytes)
+        if kind in 'biuf':
+            types[kind] = (bool, int, float)
+        if hashed is None or unhashed or kind not in types:
+            return super().validate_array(array, model, context)
 
+        choices = [c for c in hashed if isinstance(c, types[kind])]
+        return ~np.isin(array, choices)
@@ -0,0 +1,200 @@
+from shiftschema.exceptions import InvalidOption
+import threading
+import time
+
+
+class ChoiceIndex:
+    """
+    Choice index
+    Holds valid choices for choice validators. Hashable choices are indexed
+    in a frozenset for constant time lookups, while unhashable ones fall back
+    to linear search. Instead of an iterable can be given a provider callable
+    that will be used to load large choice sets lazily on first lookup.
+
+    Provided choices can be given a TTL in seconds. Once expired, choices
+    are reloaded in a background thread while lookups keep using current
+    ones. Loading is guarded with a lock, so concurrent lookups never call
+    the provider more than once at a time.
+    """
+
+    def __init__(self, choices=None, ttl=None):
+        """
+        Initialize index
+        Accepts an iterable of valid choices or a callable returning one.
+
+        :param choices:         iterable or callable, valid choices
+        :param ttl:             int or float, seconds to keep provided choices
+        :return:                None
+        """
+        self.provider = None
+        self.ttl = ttl
+        self.entries = None
+        self.loaded_at = None
+        self.lock = threading.Lock()
+        self.refreshing = False
+        self.refresher = None
+
+        try:
+            iter(choices)
+        except TypeError:
+            if not callable(choices):
+                err = 'Choices must be an iterable or a callable provider'
+                raise InvalidOption(err)
+            self.provider = choices
+            return
+
+        self.entries = self.build(choices)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['lock']
+        state['refreshing'] = False
+        state['refresher'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
+    @property
+    def hashed(self):
+        """ Frozenset of hashable choices (None for string choices) """
+        return self.load()[0]
+
+    @property
+    def unhashed(self):
+        """ List of unhashable choices (or string choices) """
+        return self.load()[1]
+
+    @staticmethod
+    def build(choices):
+        """
+        Build index
+        Splits choices into a frozenset of hashable choices and a list of
+        unhashable ones. Strings are kept as they are to preserve substring
+        lookups.
+
+        :param choices:         iterable, valid choices
+        :return:                tuple, (hashed, unhashed)
+        """
+        if isinstance(choices, str):
+            return None, choices
+
+        hashed = set()
+        unhashed = []
+        for choice in choices:
+            try:
+                hashed.add(choice)
+            except TypeError:
+                unhashed.append(choice)
+
+        return frozenset(hashed), unhashed
+
+    def load(self):
+        """
+        Load
+        Returns index, loading choices from provider on first access. Starts
+        background refresh if provided choices expired.
+
+        :return:                tuple, (hashed, unhashed)
+        """
+        entries = self.entries
+        if entries is None:
+            with self.lock:
+                if self.entries is None:
+                    self.entries = self.build(self.provider())
+                    self.loaded_at = time.monotonic()
+                return self.entries
+
+        if self.ttl is not None and self.provider and not self.refreshing:
+            if time.monotonic() - self.loaded_at >= self.ttl:
+                self.refresh_in_background()
+
+        return entries
+
+    def refresh(self):
+        """
+        Refresh
+        Reloads choices from provider right away.
+
+        :return:                None
+        """
+        with self.lock:
+            self.entries = self.build(self.provider())
+            self.loaded_at = time.monotonic()
+
+    def refresh_in_background(self):
+        """
+        Refresh in background
+        Starts a thread to reload choices from provider, unless one is
+        already running. Current choices are kept if reloading fails.
+
+        :return:                None
+        """
+        with self.lock:
+            if self.refreshing:
+                return
+            self.refreshing = True
+
+        def reload():
+            try:
+                entries = self.build(self.provider())
+                with self.lock:
+                    self.entries = entries
+            except Exception:
+                pass  # keep serving current choices
+            finally:
+                self.loaded_at = time.monotonic()
+                self.refreshing = False
+
+        self.refresher = threading.Thread(target=reload, daemon=True)
+        self.refresher.start()
+
+    def definition(self):
+        """
+        Definition
+        Describes index for schema fingerprints: its choices, or provider
+        and TTL for provided choices.
+
+        :return:                dict
+        """
+        if self.provider is not None:
+            return dict(provider=self.provider, ttl=self.ttl)
+
+        return dict(entries=self.entries)
+
+    def __contains__(self, value):
+        hashed, unhashed = self.load()
+        if hashed is None:
+            return value in unhashed
+
+        try:
+            found = value in hashed
+        except TypeError:
+            found = any(value == choice for choice in hashed)
+
+        return found or value in unhashed
+
+    def invalid(self, values):
+        """
+        Get invalid
+        Returns items that are not valid choices, preserving their order.
+
+        :param values:          iterable, items to check
+        :return:                list
+        """
+        if not isinstance(values, (list, tuple, set, frozenset)):
+            values = list(values)
+
+        hashed, unhashed = self.load()
+        if hashed is not None and not unhashed:
+            try:
+                invalid = set(values) - hashed
+            except TypeError:
+                invalid = None
+            if invalid is not None:
+                if not invalid:
+                    return []
+                return [item for item in values if item in invalid]
+
+        return [item for item in values if item not in self]
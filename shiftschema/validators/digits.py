@@ -1,4 +1,5 @@
 from shiftschema.validators.abstract_validator import AbstractValidator
+from shiftschema.validators.abstract_validator import np
 from shiftschema.result import Error
 
 
@@ -8,6 +9,9 @@ class Digits(AbstractValidator):
     Validates that passed in value consists only of digits.
     """
 
+    # results only depend on value and options
+    deterministic = True
+
     not_digital = '%digits_must_only_contain_digits%'
 
     def __init__(self, message=None):
@@ -31,14 +35,62 @@ class Digits(AbstractValidator):
         :param context:         object or None, validation context
         :return:                shiftschema.results.SimpleResult
         """
-        import re
-
-        value = str(value)
-        match = re.match(r'^\d+', value)
-        if not match or value != match.group():
+        if not self.is_digits(value):
             return Error(self.not_digital)
 
         # success otherwise
         return Error()
 
+    def validate_many(self, values, model=None, context=None):
+        """
+        Validate many
+        Validates a batch of values and returns a list of errors, one per
+        value. Valid values share the same empty error.
+
+        :param values:          iterable, values to check
+        :param model:           parent model being validated
+        :param context:         object or None, validation context
+        :return:                list of shiftschema.result.Error
+        """
+        valid = Error()
+        is_digits = self.is_digits
+        return [
+            valid if is_digits(value) else Error(self.not_digital)
+            for value in values
+        ]
+
+    def validate_array(self, array, model=None, context=None):
+        """
+        Validate array
+        Checks string arrays with numpy.char.isdecimal and integer arrays
+        for negative values, and returns a mask flagging invalid values.
 
+        :param array:           numpy.ndarray, values to check
+        :param model:           parent model being validated
+        :param context:         object or None, validation context
+        :return:                numpy.ndarray of bool
+        """
+        kind = array.dtype.kind
+        if kind == 'U':
+            return ~np.char.isdecimal(array)
+        if kind == 'i':
+            return array < 0
+        if kind == 'u':
+            return np.zeros(len(array), dtype=bool)
+
+        return super().validate_array(array, model, context)
+
+    @staticmethod
+    def is_digits(value):
+        """
+        Is digits
+        Checks that value, cast to string, only consists of digits.
+
+        :param value:           value to check
+        :return:                bool
+        """
+        if type(value) is int:
+            return value >= 0
+        if type(value) is not str:
+            value = str(value)
+        return value.isdecimal()
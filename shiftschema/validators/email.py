@@ -1,5 +1,6 @@
 from shiftschema.validators.abstract_validator import AbstractValidator
 from shiftschema.result import Error
+from shiftschema.exceptions import InvalidOption
 import re
 
 
@@ -10,19 +11,44 @@ class Email(AbstractValidator):
     so we don't do any MX checks here
     """
 
+    # results only depend on value and options
+    deterministic = True
+
     not_email = '%email_invalid%'
 
-    def __init__(self, message=None):
+    # validation engine (regex or parser)
+    engine = 'regex'
+    engines = ('regex', 'parser')
+
+    # compiled regex shared by all instances
+    compiled = None
+
+    # characters excluded from atoms, quoted strings and domain literals
+    extended = frozenset(chr(code) for code in range(0x80, 0x100))
+    atom_excluded = frozenset(chr(code) for code in range(0x21)) | extended
+    atom_excluded |= frozenset('"(),.:;<>@[\\]\x7f')
+    qtext_excluded = frozenset('\r"\\') | extended
+    dtext_excluded = frozenset('\r[\\]') | extended
+
+    def __init__(self, message=None, engine='regex'):
         """
         Initialize validator
-        Accepts an optional custom error message.
+        Accepts an optional custom error message. Can optionally use a
+        linear-time parser engine instead of the regex. Both engines accept
+        exactly the same emails.
 
         :param message:         str, custom error message
+        :param engine:          str, validation engine (regex or parser)
         :return:                None
         """
         if message is not None:
             self.not_email = message
 
+        if engine not in self.engines:
+            err = 'Email validation engine must be one of: {}'
+            raise InvalidOption(err.format(', '.join(self.engines)))
+        self.engine = engine
+
     def validate(self, value, model=None, context=None):
         """
         Validate
@@ -35,9 +61,12 @@ class Email(AbstractValidator):
         """
 
         value = str(value)
-        regex = self.regex()
-        match = regex.match(value)
-        if not match:
+        if self.engine == 'parser':
+            valid = self.scan(value)
+        else:
+            valid = self.regex().match(value)
+
+        if not valid:
             return Error(self.not_email)
 
         # success otherwise
@@ -54,6 +83,8 @@ class Email(AbstractValidator):
         http://creativecommons.org/licenses/by-sa/2.5/
         :return:
         """
+        if Email.compiled is not None:
+            return Email.compiled
 
         qtext = '[^\\x0d\\x22\\x5c\\x80-\\xff]'
         dtext = '[^\\x0d\\x5b-\\x5d\\x80-\\xff]'
@@ -72,7 +103,65 @@ class Email(AbstractValidator):
         addr_spec = "%s\\x40%s" % (local_part, domain)
 
         email_address = re.compile('\A%s\Z' % addr_spec)
+        Email.compiled = email_address
         return email_address
 
+    def scan(self, value):
+        """
+        Email parser
+        Hand-written linear-time scanner accepting the same language as the
+        RFC822 regex: dot-separated words (atoms or quoted strings), followed
+        by @ and dot-separated sub-domains (atoms or domain literals).
+
+        :param value:           str, value to check
+        :return:                bool
+        """
+        pos = self.scan_word(value, 0)
+        while pos is not None and value[pos:pos + 1] == '.':
+            pos = self.scan_word(value, pos + 1)
+        if pos is None or value[pos:pos + 1] != '@':
+            return False
+
+        pos = self.scan_sub_domain(value, pos + 1)
+        while pos is not None and value[pos:pos + 1] == '.':
+            pos = self.scan_sub_domain(value, pos + 1)
+        return pos == len(value)
+
+    def scan_word(self, value, pos):
+        """ Scan atom or quoted string, return position after it or None """
+        if value[pos:pos + 1] == '"':
+            return self.scan_quoted(value, pos, '"', self.qtext_excluded)
+        return self.scan_atom(value, pos)
+
+    def scan_sub_domain(self, value, pos):
+        """ Scan atom or domain literal, return position after it or None """
+        if value[pos:pos + 1] == '[':
+            return self.scan_quoted(value, pos, ']', self.dtext_excluded)
+        return self.scan_atom(value, pos)
+
+    def scan_atom(self, value, pos):
+        """ Scan atom, return position after it or None """
+        start = pos
+        while pos < len(value) and value[pos] not in self.atom_excluded:
+            pos += 1
+        return pos if pos > start else None
+
+    def scan_quoted(self, value, pos, closing, excluded):
+        """ Scan quoted text with quoted pairs, return position after it """
+        pos += 1
+        while pos < len(value):
+            char = value[pos]
+            if char == closing:
+                return pos + 1
+            if char == '\\':
+                if pos + 1 >= len(value) or value[pos + 1] > '\x7f':
+                    return None
+                pos += 2
+            elif char in excluded:
+                return None
+            else:
+                pos += 1
+        return None
+
 
 
@@ -9,6 +9,9 @@ class Ip(AbstractValidator):
     Validates that passed in value is a valid IPv4 or IPv6 address
     """
 
+    # results only depend on value and options
+    deterministic = True
+
     invalid_ip = '%invalid_ip%'
 
     def __init__(self, message=None):
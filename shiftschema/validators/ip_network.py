@@ -0,0 +1,70 @@
+from shiftschema.validators.abstract_validator import AbstractValidator
+from shiftschema.validators.network_index import NetworkIndex
+from shiftschema.result import Error
+import ipaddress
+
+
+class IpNetwork(AbstractValidator):
+    """
+    IP network validator
+    Validates that passed in value is a valid IPv4 or IPv6 address that
+    doesn't belong to any of denied networks and, if allowed networks are
+    given, belongs to one of them. Networks are compiled into an index,
+    so checks stay fast for tens of thousands of networks.
+    """
+
+    # results only depend on value and options
+    deterministic = True
+
+    invalid_ip = '%invalid_ip%'
+    ip_denied = '%ip_denied%'
+    ip_not_allowed = '%ip_not_allowed%'
+
+    def __init__(self, allow=None, deny=None, message=None):
+        """
+        Initialize validator
+        Accepts allowed and denied networks as iterables of networks in CIDR
+        notation or prepared network indexes, e.g. loaded from files with
+        NetworkIndex.from_file(). Accepts an optional custom error message.
+
+        :param allow:           iterable or NetworkIndex, allowed networks
+        :param deny:            iterable or NetworkIndex, denied networks
+        :param message:         str, custom error message
+        :return:                None
+        """
+        if message is not None:
+            self.invalid_ip = message
+            self.ip_denied = message
+            self.ip_not_allowed = message
+
+        if allow is not None and not isinstance(allow, NetworkIndex):
+            allow = NetworkIndex(allow)
+        if deny is not None and not isinstance(deny, NetworkIndex):
+            deny = NetworkIndex(deny)
+
+        self.allow = allow
+        self.deny = deny
+
+    def validate(self, value, model=None, context=None):
+        """
+        Validate
+        Perform value validation and return result
+
+        :param value:           value to check, cast to string
+        :param model:           parent model being validated
+        :param context:         object or None, validation context
+        :return:                shiftschema.results.SimpleResult
+        """
+        try:
+            ip = ipaddress.ip_address(str(value))
+        except ValueError:
+            return Error(self.invalid_ip)
+
+        if self.deny is not None and ip in self.deny:
+            return Error(self.ip_denied)
+
+        if self.allow is not None and ip not in self.allow:
+            return Error(self.ip_not_allowed)
+
+        # success otherwise
+        return Error()
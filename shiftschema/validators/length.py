@@ -1,5 +1,8 @@
 from shiftschema.validators.abstract_validator import AbstractValidator
 from shiftschema.result import Error
+from shiftschema.validators.abstract_validator import np
+from shiftschema.peekable import Peekable
+from collections.abc import Sequence
 
 
 class Length(AbstractValidator):
@@ -9,6 +12,12 @@ class Length(AbstractValidator):
     length, maximum length or both.
     """
 
+    # results only depend on value and options
+    deterministic = True
+
+    # only size of value is checked
+    sized = True
+
     too_long = '%length_too_long%'
     too_short = '%length_too_short%'
     not_in_range = '%length_not_in_range%'
@@ -42,26 +51,110 @@ class Length(AbstractValidator):
         :param context:         object or None, validation context
         :return:                shiftschema.results.SimpleResult
         """
+        if type(value) is str:
+            message = self.check(len(value))
+        else:
+            message = self.check(self.measure(value))
+
+        if message is not None:
+            return Error(message, dict(min=self.min, max=self.max))
+
+        # success otherwise
+        return Error()
+
+    def validate_many(self, values, model=None, context=None):
+        """
+        Validate many
+        Validates a batch of values and returns a list of errors, one per
+        value. Valid values share the same empty error.
+
+        :param values:          iterable, values to check
+        :param model:           parent model being validated
+        :param context:         object or None, validation context
+        :return:                list of shiftschema.result.Error
+        """
+        valid = Error()
+        check = self.check
+        measure = self.measure
+        errors = []
+        for value in values:
+            if type(value) is str:
+                message = check(len(value))
+            else:
+                message = check(measure(value))
+            if message is None:
+                errors.append(valid)
+            else:
+                errors.append(Error(message, dict(min=self.min, max=self.max)))
+
+        return errors
+
+    def validate_array(self, array, model=None, context=None):
+        """
+        Validate array
+        Measures string arrays with numpy.char.str_len, numeric arrays by
+        length of their string representation, and returns a mask flagging
+        values out of bounds.
+
+        :param array:           numpy.ndarray, values to check
+        :param model:           parent model being validated
+        :param context:         object or None, validation context
+        :return:                numpy.ndarray of bool
+        """
+        kind = array.dtype.kind
+        if kind not in 'USiub':
+            return super().validate_array(array, model, context)
+
+        if kind not in 'US':
+            array = array.astype(str)
+        lengths = np.char.str_len(array)
+
+        if self.min and self.max:
+            return (lengths < self.min) | (lengths > self.max)
+        if self.min and self.max is None:
+            return lengths < self.min
+        if self.max and self.min is None:
+            return lengths > self.max
+
+        return np.zeros(len(array), dtype=bool)
+
+    @staticmethod
+    def measure(value):
+        """
+        Measure
+        Returns length of strings, bytes and other sequences, and number of
+        items of peekable iterators. Any other values are measured by their
+        string representation.
 
-        value = str(value)
-        length = len(value)
-        params = dict(min=self.min, max=self.max)
+        :param value:           value to measure
+        :return:                int
+        """
+        if type(value) is str or isinstance(value, Sequence):
+            return len(value)
+        if isinstance(value, Peekable):
+            return value.count()
+        return len(str(value))
 
+    def check(self, length):
+        """
+        Check
+        Checks length against validation settings and returns error message
+        if it's out of bounds.
+
+        :param length:          int, length to check
+        :return:                str or None
+        """
         # too short?
         if self.min and self.max is None:
             if length < self.min:
-                return Error(self.too_short, params)
+                return self.too_short
 
         # too long?
         if self.max and self.min is None:
             if length > self.max:
-                return Error(self.too_long, params)
+                return self.too_long
 
         # within range?
         if self.min and self.max:
             if length < self.min or length > self.max:
-                return Error(self.not_in_range, params)
-
-        # success otherwise
-        return Error()
-
+                return self.not_in_range
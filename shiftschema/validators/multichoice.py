@@ -1,6 +1,6 @@
 from shiftschema.validators.abstract_validator import AbstractValidator
+from shiftschema.validators.choice_index import ChoiceIndex
 from shiftschema.result import Error
-from shiftschema.exceptions import InvalidOption
 
 
 class MultiChoice(AbstractValidator):
@@ -11,25 +11,35 @@ class MultiChoice(AbstractValidator):
 
     invalid_multichoice = '%invalid_multichoice%'
 
-    def __init__(self, valid_choices=None, message=None):
+    # choices as given, described by index
+    runtime = ('choices',)
+
+    def __init__(self, valid_choices=None, message=None, ttl=None):
         """
         Initialize validator
-        Accepts an iterable of valid choices to check against.
+        Accepts an iterable of valid choices to check against. Can also
+        accept a callable provider to load choices lazily on first use or
+        a prepared ChoiceIndex that can be shared between validators.
+        Provided choices can be periodically refreshed by setting a TTL.
 
-        :param min:             int or None, minimum length
-        :param max:             int or None, maximum length
+        :param valid_choices:   iterable, callable or ChoiceIndex
         :param message:         str, custom error message
+        :param ttl:             int or float, seconds to keep provided choices
         :return:                None
         """
         if message is not None:
             self.invalid_multichoice = message
 
-        try:
-            iter(valid_choices)
-        except TypeError:
-            raise InvalidOption('Choices must be an iterable')
-
         self.choices = valid_choices
+        if isinstance(valid_choices, ChoiceIndex):
+            self.index = valid_choices
+        else:
+            self.index = ChoiceIndex(valid_choices, ttl=ttl)
+
+    @property
+    def deterministic(self):
+        """ Choices loaded from a provider may change """
+        return self.index.provider is None
 
     def validate(self, value, model=None, context=None):
         """
@@ -42,7 +52,7 @@ class MultiChoice(AbstractValidator):
         :param context:         object or None, validation context
         :return:                shiftschema.result.Error
         """
-        invalid = [item for item in value if item not in self.choices]
+        invalid = self.index.invalid(value)
         if len(invalid):
             return Error(
                 self.invalid_multichoice,
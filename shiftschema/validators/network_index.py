@@ -0,0 +1,103 @@
+from shiftschema.exceptions import InvalidOption
+from bisect import bisect_right
+import ipaddress
+
+
+class NetworkIndex:
+    """
+    Network index
+    Compiles a list of IPv4 and IPv6 networks in CIDR notation into sorted
+    non-overlapping address intervals that can be searched in O(log n) time.
+    Can be loaded from a file with one network per line.
+    """
+
+    def __init__(self, networks=()):
+        """
+        Initialize index
+        Accepts an iterable of networks in CIDR notation or ipaddress network
+        objects. Single addresses are treated as /32 or /128 networks.
+
+        :param networks:        iterable, networks to index
+        :return:                None
+        """
+        intervals = {4: [], 6: []}
+        for network in networks:
+            try:
+                network = ipaddress.ip_network(network, strict=False)
+            except ValueError:
+                err = 'Invalid network [{}]'
+                raise InvalidOption(err.format(network))
+
+            intervals[network.version].append((
+                int(network.network_address),
+                int(network.broadcast_address)
+            ))
+
+        self.starts = {}
+        self.ends = {}
+        for version, items in intervals.items():
+            self.starts[version], self.ends[version] = self.merge(items)
+
+    @classmethod
+    def from_file(cls, path):
+        """
+        From file
+        Loads networks from a file with one network per line. Blank lines and
+        comments starting with # are ignored.
+
+        :param path:            str, path to file
+        :return:                shiftschema.validators.NetworkIndex
+        """
+        networks = []
+        with open(path) as file:
+            for line in file:
+                line = line.split('#', 1)[0].strip()
+                if line:
+                    networks.append(line)
+
+        return cls(networks)
+
+    @staticmethod
+    def merge(intervals):
+        """
+        Merge intervals
+        Sorts intervals and merges overlapping and adjacent ones.
+
+        :param intervals:       list, of (start, end) tuples
+        :return:                tuple, (starts, ends) lists
+        """
+        starts = []
+        ends = []
+        for start, end in sorted(intervals):
+            if ends and start <= ends[-1] + 1:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+
+        return starts, ends
+
+    def __len__(self):
+        return len(self.starts[4]) + len(self.starts[6])
+
+    def __contains__(self, address):
+        if isinstance(address, (str, int)):
+            address = ipaddress.ip_address(address)
+
+        if address.version == 6 and address.ipv4_mapped:
+            if self.lookup(4, int(address.ipv4_mapped)):
+                return True
+
+        return self.lookup(address.version, int(address))
+
+    def lookup(self, version, address):
+        """
+        Lookup
+        Binary searches intervals for integer address.
+
+        :param version:         int, IP version (4 or 6)
+        :param address:         int, address to find
+        :return:                bool
+        """
+        index = bisect_right(self.starts[version], address) - 1
+        return index >= 0 and address <= self.ends[version][index]
@@ -14,6 +14,9 @@ class NotEmpty(AbstractValidator):
     Checks that provide iterable value is not empty.
     """
 
+    # results only depend on value and options
+    deterministic = True
+
     not_iterable = '%not_iterable%'
     cant_be_empty = '%cant_be_empty%'
 
@@ -49,5 +52,28 @@ class NotEmpty(AbstractValidator):
 
         return Error()
 
+    def validate_many(self, values, model=None, context=None):
+        """
+        Validate many
+        Validates a batch of values and returns a list of errors, one per
+        value. Sized builtin containers are checked by their length. Valid
+        values share the same empty error.
+
+        :param values:          iterable, values to check
+        :param model:           parent model being validated
+        :param context:         object or None, validation context
+        :return:                list of shiftschema.result.Error
+        """
+        valid = Error()
+        sized = (str, list, tuple, dict, set, frozenset, bytes)
+        errors = []
+        for value in values:
+            if type(value) in sized:
+                errors.append(valid if value else Error(self.cant_be_empty))
+            else:
+                errors.append(self.validate(value, model, context))
+
+        return errors
+
 
 
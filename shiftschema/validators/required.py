@@ -1,4 +1,5 @@
 from shiftschema.validators.abstract_validator import AbstractValidator
+from shiftschema.validators.abstract_validator import np
 from shiftschema.result import Error
 
 
@@ -9,6 +10,9 @@ class Required(AbstractValidator):
     option to allow False to be a valid value.
     """
 
+    # results only depend on value and options
+    deterministic = True
+
     value_required = '%value_required%'
 
     allow_false = False
@@ -73,5 +77,48 @@ class Required(AbstractValidator):
         # error otherwise
         return Error(self.value_required)
 
+    def validate_many(self, values, model=None, context=None):
+        """
+        Validate many
+        Validates a batch of values and returns a list of errors, one per
+        value. Valid values share the same empty error.
+
+        :param values:          iterable, values to check
+        :param model:           parent model being validated
+        :param context:         object or None, validation context
+        :return:                list of shiftschema.result.Error
+        """
+        valid = Error()
+        validate = self.validate
+        return [valid if value else validate(value) for value in values]
+
+    def validate_array(self, array, model=None, context=None):
+        """
+        Validate array
+        Flags empty strings, zeros and False values in arrays, unless these
+        are allowed. Arrays can't hold None, except for arrays of objects,
+        which are validated as a list.
+
+        :param array:           numpy.ndarray, values to check
+        :param model:           parent model being validated
+        :param context:         object or None, validation context
+        :return:                numpy.ndarray of bool
+        """
+        kind = array.dtype.kind
+        if kind == 'U' and self.allow_empty_string:
+            return np.zeros(len(array), dtype=bool)
+        if kind in 'US':
+            return np.char.str_len(array) == 0
+        if kind == 'b':
+            if self.allow_false or self.allow_zero:
+                return np.zeros(len(array), dtype=bool)
+            return ~array
+        if kind in 'iuf':
+            if self.allow_zero:
+                return np.zeros(len(array), dtype=bool)
+            return array == 0
+
+        return super().validate_array(array, model, context)
+
 
 
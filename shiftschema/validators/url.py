@@ -1,5 +1,6 @@
 from shiftschema.validators.abstract_validator import AbstractValidator
 from shiftschema.result import Error
+from shiftschema.exceptions import InvalidOption
 import re
 
 
@@ -8,6 +9,9 @@ class Url(AbstractValidator):
     URL validator
     """
 
+    # results only depend on value and options
+    deterministic = True
+
     # default error message
     url_invalid = '%url_invalid%'
 
@@ -20,18 +24,44 @@ class Url(AbstractValidator):
     # allow localhost?
     localhost = False
 
-    def __init__(self, protocols=None, localhost=False, message=None):
+    # compiled patterns shared by all instances, keyed by configuration
+    compiled = {}
+
+    # validation engine (regex or parser)
+    engine = 'regex'
+    engines = ('regex', 'parser')
+
+    # url part delimiters and whitespace lookup used by the parser
+    delimiters = frozenset('/?#')
+    whitespace = re.compile(r'\s')
+
+    def __init__(
+        self,
+        protocols=None,
+        localhost=False,
+        message=None,
+        engine='regex'
+    ):
         """
         Initialize validator
-        Accepts an optional custom error message.
+        Accepts an optional custom error message. Can optionally use a
+        linear-time parser engine instead of the regex. Both engines accept
+        exactly the same urls, but the parser can't be forced into
+        catastrophic backtracking by crafted input.
 
         :param protocols:       list, allowed protocols
         :param localhost:       bool, wether to allow localhost
         :param message:         str, custom error message
+        :param engine:          str, validation engine (regex or parser)
         :return:                None
         """
+        if engine not in self.engines:
+            err = 'Url validation engine must be one of: {}'
+            raise InvalidOption(err.format(', '.join(self.engines)))
+        self.engine = engine
+
         if message is not None:
-            self.not_email = message
+            self.url_invalid = message
 
         if protocols:
             self.protocols = protocols
@@ -39,6 +69,28 @@ class Url(AbstractValidator):
         if localhost:
             self.localhost = True
 
+        self.prefixes = tuple(p.casefold() + '://' for p in self.protocols)
+        self.prefixes += ('//',)
+        self.prefix_size = max(map(len, self.prefixes))
+        self.pattern = self.compile(self.protocols, self.localhost)
+
+    def compile(self, protocols, localhost=False):
+        """
+        Compile
+        Returns compiled validation regex for the given configuration. Regexes
+        are compiled once per configuration and shared between instances.
+
+        :param protocols:       list, allowed protocols
+        :param localhost:       bool, wether to allow localhost
+        :return:                compiled regex
+        """
+        key = (tuple(protocols), bool(localhost))
+        if key not in self.compiled:
+            regex = self.regex(protocols=protocols, localhost=localhost)
+            self.compiled[key] = re.compile(regex, flags=self.flags)
+
+        return self.compiled[key]
+
     def validate(self, value, model=None, context=None):
         """
         Validate
@@ -50,21 +102,34 @@ class Url(AbstractValidator):
         :return:                shiftschema.results.SimpleResult
         """
         value = str(value)
-        regex = self.regex(
-            protocols=self.protocols,
-            localhost=self.localhost
-        )
+        if self.engine == 'parser':
+            if not self.scan(value):
+                return Error(self.url_invalid)
+            return Error()
 
-        regex = re.compile(regex, flags=self.flags)
-        match = regex.match(value)
+        if not self.precheck(value):
+            return Error(self.url_invalid)
 
         # return error
+        match = self.pattern.match(value)
         if not match:
             return Error(self.url_invalid)
 
         # success otherwise
         return Error()
 
+    def precheck(self, value):
+        """
+        Structural pre-check
+        Cheaply rejects values that can't possibly pass full regex validation,
+        i.e. values not starting with an allowed protocol followed by // or
+        with // alone. Never rejects anything the regex would accept.
+
+        :param value:           str, value to check
+        :return:                bool
+        """
+        return value[:self.prefix_size].casefold().startswith(self.prefixes)
+
     def regex(self, protocols, localhost=True):
         """
         URL Validation regex
@@ -117,7 +182,241 @@ class Url(AbstractValidator):
         p += r"$"
         return p
 
+    def scan(self, value):
+        """
+        URL parser
+        Hand-written linear-time scanner accepting the same language as the
+        validation regex. Used by the parser engine.
+
+        :param value:           str, value to check
+        :return:                bool
+        """
+        # like regex $, allow a single trailing newline
+        if value.endswith('\n'):
+            value = value[:-1]
+        if self.whitespace.search(value):
+            return False
+
+        # protocol
+        starts = []
+        if value.startswith('//'):
+            starts.append(2)
+        for protocol in self.protocols:
+            prefix = protocol.lower() + '://'
+            if value[:len(prefix)].lower() == prefix:
+                starts.append(len(prefix))
+
+        return any(self.scan_authority(value, start) for start in starts)
+
+    def scan_authority(self, value, start):
+        """
+        Scan authority
+        Checks the part after the protocol. Host and port run up to the first
+        path delimiter, optionally preceded by basic auth ending with @. The
+        only basic auth candidates are thus the last @ before each delimiter.
+
+        :param value:           str, value to check
+        :param start:           int, position after the protocol
+        :return:                bool
+        """
+        first_region = True
+        last_at = None
+        for index in range(start, len(value) + 1):
+            char = value[index] if index < len(value) else '/'
+            if char == '@' and index > start:
+                last_at = index
+            elif char in self.delimiters:
+                if first_region and self.scan_host(value[start:index]):
+                    return True
+                if last_at is not None:
+                    host = value[last_at + 1:index]
+                    if self.scan_host(host):
+                        return True
+                first_region = False
+                last_at = None
+
+        return False
+
+    def scan_host(self, value):
+        """
+        Scan host
+        Checks host and optional port against ip and hostname rules.
+
+        :param value:           str, host with optional port
+        :return:                bool
+        """
+        host, colon, port = value.partition(':')
+        if colon and not (2 <= len(port) <= 5 and port.isdecimal()):
+            return False
 
+        return self.scan_ip(host) or self.scan_hostname(host)
 
+    def scan_ip(self, host):
+        """
+        Scan IP
+        Checks public IPv4 address, excluding private and local networks,
+        loopback, reserved space and network/broadcast addresses.
+
+        :param host:            str, host to check
+        :return:                bool
+        """
+        octets = host.split('.')
+        if len(octets) != 4:
+            return False
+
+        first, second, third, fourth = octets
+        if not self.first_octet(first) or not self.last_octet(fourth):
+            return False
+        if not self.octet(second) or not self.octet(third):
+            return False
+
+        # private and local networks
+        if first in ('10', '127'):
+            return False
+        if first + '.' + second in ('169.254', '192.168'):
+            return False
+        if first == '172' and len(second) == 2:
+            if second[0] == '1' and second[1] in '6789':
+                return False
+            if second[0] == '2' and second[1].isdecimal():
+                return False
+            if second[0] == '3' and second[1] in '01':
+                return False
+
+        return True
+
+    @staticmethod
+    def first_octet(octet):
+        """ Match first octet: 1-223 """
+        if len(octet) == 1:
+            return '1' <= octet <= '9'
+        if len(octet) == 2:
+            return '1' <= octet[0] <= '9' and octet[1].isdecimal()
+        if len(octet) == 3:
+            if octet[0] == '1':
+                return octet[1:].isdecimal()
+            if octet[0] == '2' and octet[1] in '01':
+                return octet[2].isdecimal()
+            return octet[:2] == '22' and octet[2] in '0123'
+        return False
+
+    @staticmethod
+    def octet(octet):
+        """ Match middle octets: 0-255 """
+        if len(octet) in (1, 2):
+            return octet.isdecimal()
+        if len(octet) == 3:
+            if octet[0] == '1':
+                return octet[1:].isdecimal()
+            if octet[0] == '2' and octet[1] in '01234':
+                return octet[2].isdecimal()
+            return octet[:2] == '25' and octet[2] in '012345'
+        return False
+
+    @staticmethod
+    def last_octet(octet):
+        """ Match last octet: 1-254 """
+        if len(octet) == 1:
+            return '1' <= octet <= '9'
+        if len(octet) == 2:
+            return '1' <= octet[0] <= '9' and octet[1].isdecimal()
+        if len(octet) == 3:
+            if octet[0] == '1':
+                return octet[1:].isdecimal()
+            if octet[0] == '2' and octet[1] in '01234':
+                return octet[2].isdecimal()
+            return octet[:2] == '25' and octet[2] in '01234'
+        return False
+
+    def scan_hostname(self, host):
+        """
+        Scan hostname
+        Checks dot-separated labels followed by a top-level domain. When
+        localhost is allowed, dots between labels become optional.
+
+        :param host:            str, host to check
+        :return:                bool
+        """
+        if host.endswith('.'):
+            host = host[:-1]  # optional tld dot
+        *labels, tld = host.split('.')
+
+        if not self.localhost:
+            if not labels or len(tld) < 2:
+                return False
+            if not all(self.is_tld_char(char) for char in tld):
+                return False
+            return all(self.label(label) for label in labels)
+
+        # without dots tld may be carved out of the last label
+        if len(tld) > 2:
+            labels.append(tld[:-2])
+            tld = tld[-2:]
+        if not labels or len(tld) < 2:
+            return False
+        if not all(self.is_tld_char(char) for char in tld):
+            return False
+        return all(self.joined_labels(label) for label in labels)
+
+    def label(self, label):
+        """
+        Match hostname label
+        Up to 64 host characters, underscores and dashes allowed in the
+        middle.
 
+        :param label:           str, label to check
+        :return:                bool
+        """
+        if not label or len(label) > 64:
+            return False
+        if not self.is_host_char(label[0]):
+            return False
+        if not self.is_host_char(label[-1]):
+            return False
+        return all(self.is_host_char(c) or c in '_-' for c in label[1:-1])
+
+    def joined_labels(self, labels):
+        """
+        Match joined labels
+        Checks a run of labels not separated with dots (localhost mode). It
+        can be split between any two host characters, so each part between
+        such splits must fit in a single label.
 
+        :param labels:          str, labels to check
+        :return:                bool
+        """
+        if not labels:
+            return False
+        if not self.is_host_char(labels[0]):
+            return False
+        if not self.is_host_char(labels[-1]):
+            return False
+
+        size = 0
+        previous = False
+        for char in labels:
+            current = self.is_host_char(char)
+            if not current and char not in '_-':
+                return False
+            if current and previous:
+                size = 0
+            size += 1
+            if size > 64:
+                return False
+            previous = current
+
+        return True
+
+    @staticmethod
+    def is_host_char(char):
+        """ Host character: ascii letter, digit or non-ascii up to U+FFFF """
+        if char.isascii():
+            return char.isalnum()
+        return '\u00a1' <= char <= '\uffff'
+
+    @staticmethod
+    def is_tld_char(char):
+        """ TLD character: ascii letter or non-ascii up to U+FFFF """
+        if char.isascii():
+            return char.isalpha()
+        return '\u00a1' <= char <= '\uffff'
@@ -0,0 +1,126 @@
+from unittest import TestCase
+import functools
+import pickle
+from shiftschema.cache import AbstractCache, LruCache
+from shiftschema.exceptions import InvalidOption, NotCanonical
+
+
+class LruCacheTest(TestCase):
+    """ In-process LRU cache test"""
+
+    def test_create(self):
+        """ Can instantiate LRU cache """
+        cache = LruCache(maxsize=10)
+        self.assertIsInstance(cache, LruCache)
+        self.assertIsInstance(cache, AbstractCache)
+
+    def test_raise_on_invalid_maxsize(self):
+        """ Raise an exception on invalid maxsize """
+        with self.assertRaises(InvalidOption):
+            LruCache(maxsize=0)
+
+    def test_set_and_get(self):
+        """ Can store and retrieve values """
+        cache = LruCache()
+        cache.set('key', 'value')
+        self.assertEquals('value', cache.get('key'))
+        self.assertIsNone(cache.get('missing'))
+
+    def test_evict_least_recently_used(self):
+        """ Evicting least recently used entries when full """
+        cache = LruCache(maxsize=2)
+        cache.set('one', 1)
+        cache.set('two', 2)
+        cache.get('one')
+        cache.set('three', 3)
+        self.assertEquals(2, len(cache))
+        self.assertEquals(1, cache.get('one'))
+        self.assertIsNone(cache.get('two'))
+
+    def test_track_hit_rate(self):
+        """ Tracking cache hits and misses """
+        cache = LruCache()
+        cache.set('key', 'value')
+        cache.get('key')
+        cache.get('key')
+        cache.get('key')
+        cache.get('missing')
+        stats = cache.stats()
+        self.assertEquals(3, stats['hits'])
+        self.assertEquals(1, stats['misses'])
+        self.assertEquals(0.75, stats['hit_rate'])
+        self.assertEquals(1, stats['size'])
+
+        cache.reset_stats()
+        self.assertEquals(0.0, cache.hit_rate)
+
+    def test_can_pickle(self):
+        """ LRU cache can be pickled """
+        cache = LruCache()
+        cache.set('key', 'value')
+        restored = pickle.loads(pickle.dumps(cache))
+        self.assertEquals('value', restored.get('key'))
+
+    def test_key_depends_on_value_and_namespace(self):
+        """ Cache keys are derived from value and namespace """
+        key = AbstractCache.key('value', 'namespace')
+        self.assertEquals(key, AbstractCache.key('value', 'namespace'))
+        self.assertNotEqual(key, AbstractCache.key('other', 'namespace'))
+        self.assertNotEqual(key, AbstractCache.key('value', 'other'))
+
+    def test_namespace_is_deterministic(self):
+        """ Config namespaces do not depend on ordering of dicts and sets """
+        one = AbstractCache.namespace('test', dict(a={1, 2, 3}, b=[1]))
+        two = AbstractCache.namespace('test', dict(b=[1], a={3, 2, 1}))
+        self.assertEquals(one, two)
+
+        def callback():
+            pass
+        three = AbstractCache.namespace('test', dict(callback=callback))
+        self.assertIn('test:', three)
+        self.assertNotEqual(one, three)
+
+    def test_canonical_callables(self):
+        """ Closures, lambdas and partials are told apart by content """
+        def factory(value):
+            return lambda: value
+
+        def function(a, b=1):
+            return a
+
+        canonical = AbstractCache.canonical
+        self.assertEquals(canonical(factory(1)), canonical(factory(1)))
+        self.assertNotEqual(canonical(factory(1)), canonical(factory(2)))
+        one, two = (lambda: 1), (lambda: 2)
+        self.assertNotEqual(canonical(one), canonical(two))
+        self.assertNotEqual(
+            canonical(functools.partial(function, 1)),
+            canonical(functools.partial(function, 2))
+        )
+        self.assertNotEqual(
+            canonical(functools.partial(function, 1, b=1)),
+            canonical(functools.partial(function, 1, b=2))
+        )
+        self.assertEquals('<builtins.len>', canonical(len))
+
+    def test_refuse_undeterministic_representations(self):
+        """ Raise for objects represented by memory address """
+        with self.assertRaises(NotCanonical):
+            AbstractCache.canonical((1).__eq__)
+
+    def test_canonical_objects(self):
+        """ Objects are represented by definition or attributes """
+        class Config:
+            def __init__(self, value):
+                self.value = value
+
+        class Defined(Config):
+            def definition(self):
+                return dict(value=self.value)
+
+        one = AbstractCache.canonical(Config(1))
+        self.assertNotIn(' at 0x', one)
+        self.assertEquals(one, AbstractCache.canonical(Config(1)))
+        self.assertNotEqual(one, AbstractCache.canonical(Config(2)))
+        expected = AbstractCache.canonical(dict(value=1))
+        self.assertEquals(expected, AbstractCache.canonical(Defined(1)))
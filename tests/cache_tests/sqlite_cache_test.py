@@ -0,0 +1,89 @@
+from unittest import TestCase
+import os
+import pickle
+import tempfile
+import threading
+from shiftschema.cache import SqliteCache
+from shiftschema.exceptions import InvalidOption
+
+
+class SqliteCacheTest(TestCase):
+    """ On-disk sqlite cache test"""
+
+    def setUp(self):
+        super().setUp()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'cache.sqlite')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+        super().tearDown()
+
+    def test_create(self):
+        """ Can instantiate sqlite cache """
+        cache = SqliteCache(self.path)
+        self.assertIsInstance(cache, SqliteCache)
+        self.assertTrue(os.path.isfile(self.path))
+
+    def test_raise_on_invalid_maxsize(self):
+        """ Raise an exception on invalid maxsize """
+        with self.assertRaises(InvalidOption):
+            SqliteCache(self.path, maxsize=-1)
+
+    def test_set_and_get(self):
+        """ Can store and retrieve values """
+        cache = SqliteCache(self.path)
+        cache.set('key', '<p>value</p>')
+        self.assertEquals('<p>value</p>', cache.get('key'))
+        self.assertIsNone(cache.get('missing'))
+        self.assertEquals(1, cache.hits)
+        self.assertEquals(1, cache.misses)
+
+    def test_share_entries_between_instances(self):
+        """ Cache entries are shared through database file """
+        SqliteCache(self.path).set('key', 'value')
+        self.assertEquals('value', SqliteCache(self.path).get('key'))
+
+    def test_evict_oldest_entries(self):
+        """ Evicting oldest entries when full """
+        cache = SqliteCache(self.path, maxsize=2)
+        cache.set('one', 1)
+        cache.set('two', 2)
+        cache.set('three', 3)
+        self.assertEquals(2, len(cache))
+        self.assertIsNone(cache.get('one'))
+        self.assertEquals(3, cache.get('three'))
+
+    def test_keep_entries_of_last_writes(self):
+        """ Entries stored by last maxsize writes are kept """
+        cache = SqliteCache(self.path, maxsize=3)
+        for i in range(100):
+            cache.set('key' + str(i % 5), i)
+        self.assertEquals(3, len(cache))
+        self.assertEquals(99, cache.get('key4'))
+        self.assertIsNone(cache.get('key1'))
+
+        cache.set('key4', 100)  # last writes: key3, key4, key4
+        self.assertEquals(2, len(cache))
+        self.assertEquals(98, cache.get('key3'))
+        self.assertIsNone(cache.get('key2'))
+
+    def test_use_from_several_threads(self):
+        """ Each thread gets its own connection """
+        cache = SqliteCache(self.path)
+        cache.set('key', 'value')
+        found = []
+
+        def lookup():
+            found.append(cache.get('key'))
+        thread = threading.Thread(target=lookup)
+        thread.start()
+        thread.join()
+        self.assertEquals(['value'], found)
+
+    def test_can_pickle(self):
+        """ Sqlite cache can be pickled """
+        cache = SqliteCache(self.path)
+        cache.set('key', 'value')
+        restored = pickle.loads(pickle.dumps(cache))
+        self.assertEquals('value', restored.get('key'))
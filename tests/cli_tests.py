@@ -0,0 +1,146 @@
+from unittest import TestCase
+from nose.plugins.attrib import attr
+from click.testing import CliRunner
+import csv
+import json
+import os
+import sys
+import tempfile
+
+from shiftschema.cli import cli, split_lines
+
+
+@attr('cli')
+class CliTest(TestCase):
+
+    def setUp(self):
+        lines = [
+            dict(first_name='Matthew', last_name='Petersen', salutation='mr'),
+            dict(first_name='M', last_name='Petersen'),
+            None,
+            'not json',
+            dict(first_name='Kady', salutation='sir'),
+        ]
+        lines = [json.dumps(l) if type(l) is dict else l or '' for l in lines]
+        file, self.path = tempfile.mkstemp(suffix='.jsonl')
+        with os.fdopen(file, 'w') as file:
+            file.write('\n'.join(lines * 3) + '\n')
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_split_file_into_whole_lines(self):
+        """ Input is split into chunks of whole lines """
+        with open(self.path, 'rb') as file:
+            data = file.read()
+
+        chunks = list(split_lines(self.path, 20))
+        self.assertEqual(0, chunks[0][0])
+        self.assertEqual(len(data), chunks[-1][1])
+        for start, stop in chunks:
+            self.assertEqual(b'\n', data[stop - 1:stop])
+
+    def test_validate_json_lines(self):
+        """ Validating JSON lines reports invalid lines """
+        output = self.path + '.errors'
+        self.addCleanup(os.remove, output)
+        for workers in ('0', '2'):
+            result = CliRunner().invoke(cli, [
+                'validate',
+                'tests.helpers:PersonSpec',
+                self.path,
+                '--workers', workers,
+                '--chunk-size', '30',
+                '--output', output,
+            ])
+            self.assertEqual(1, result.exit_code)
+            self.assertIn('15 lines (9 invalid)', result.output)
+
+            with open(output) as file:
+                reports = [json.loads(line) for line in file]
+            lines = [report['line'] for report in reports]
+            self.assertEqual([2, 4, 5, 7, 9, 10, 12, 14, 15], lines)
+            self.assertIn('first_name', reports[0]['errors'])
+            self.assertIn('__json__', reports[1]['errors'])
+
+    def test_valid_input_exits_with_success(self):
+        """ Exit with status 0 when all lines are valid """
+        with open(self.path, 'w') as file:
+            file.write('{"first_name": "Matthew"}\n')
+
+        result = CliRunner().invoke(cli, [
+            'validate',
+            'tests.helpers:PersonSpec',
+            self.path,
+            '--workers', '0'
+        ])
+        self.assertEqual(0, result.exit_code)
+
+    def test_bad_schema_spec_fails(self):
+        """ Fail on schemas that can't be loaded """
+        for spec in ('tests.helpers', 'tests.helpers:Nope', 'tests:helpers'):
+            result = CliRunner().invoke(cli, ['validate', spec, self.path])
+            self.assertEqual(2, result.exit_code)
+
+    def test_load_schema_from_working_directory(self):
+        """ Schemas are looked up in current working directory """
+        runner = CliRunner()
+        with runner.isolated_filesystem():
+            cwd = os.getcwd()
+            self.addCleanup(sys.modules.pop, 'cwd_schema', None)
+            self.addCleanup(lambda: cwd in sys.path and sys.path.remove(cwd))
+            with open('cwd_schema.py', 'w') as file:
+                file.write(
+                    'from tests.helpers import PersonSpec as LocalSpec\n'
+                )
+
+            for workers in ('0', '2'):
+                result = runner.invoke(cli, [
+                    'validate',
+                    'cwd_schema:LocalSpec',
+                    self.path,
+                    '--workers', workers,
+                ])
+                self.assertEqual(1, result.exit_code, result.output)
+                self.assertIn('15 lines (9 invalid)', result.output)
+
+    def test_clean_csv(self):
+        """ Cleaning CSV writes filtered valid rows and rejected rows """
+        source = self.path + '.csv'
+        target = self.path + '.clean.csv'
+        rejected = self.path + '.rejected'
+        for path in (source, target, rejected):
+            self.addCleanup(os.remove, path)
+
+        with open(source, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(['first_name', 'last_name', 'birth_year'])
+            for i in range(10):
+                writer.writerow([' Matthew ', 'Petersen', 'born 1984'])
+                writer.writerow(['M', 'Petersen, Jr', ''])
+
+        for workers in ('0', '2'):
+            result = CliRunner().invoke(cli, [
+                'clean',
+                'tests.helpers:PersonSpec',
+                source,
+                target,
+                '--errors', rejected,
+                '--workers', workers,
+                '--batch-size', '3',
+            ])
+            self.assertEqual(0, result.exit_code)
+            self.assertIn('20 rows (10 invalid)', result.output)
+
+            with open(target, newline='') as file:
+                rows = list(csv.DictReader(file))
+            self.assertEqual(10, len(rows))
+            self.assertEqual('Matthew', rows[0]['first_name'])
+            self.assertEqual('1984', rows[0]['birth_year'])
+
+            with open(rejected) as file:
+                reports = [json.loads(line) for line in file]
+            rows = [report['row'] for report in reports]
+            self.assertEqual(list(range(2, 21, 2)), rows)
+            self.assertEqual('Petersen, Jr', reports[0]['data']['last_name'])
+            self.assertIn('first_name', reports[0]['errors'])
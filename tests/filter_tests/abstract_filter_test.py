@@ -0,0 +1,59 @@
+from unittest import TestCase
+from shiftschema.filters import AbstractFilter
+from shiftschema.filters import AddHttp, Digits, Lowercase, Stringify
+from shiftschema.filters import Strip, Uppercase
+from tests.helpers import np, requires_numpy
+
+
+class AbstractFilterTest(TestCase):
+    """ Abstract filter tests"""
+
+    def test_can_extend(self):
+        """ Can extend from abstract """
+        class Custom(AbstractFilter):
+            def filter(self, value, model=None, context=None):
+                return value
+
+        filter = Custom()
+        self.assertIsInstance(filter, AbstractFilter)
+        self.assertFalse(filter.vectorized)
+
+    def filters(self):
+        """ Filters to check batch implementations of """
+        class Custom(AbstractFilter):
+            def filter(self, value, model=None, context=None):
+                return value if not isinstance(value, str) else value[:3]
+
+        return [
+            Custom(),
+            AddHttp(),
+            Digits(), Digits(to_int=True),
+            Lowercase(),
+            Uppercase(),
+            Stringify(), Stringify(True, True),
+            Strip(), Strip('left', 'xK '), Strip('right'),
+        ]
+
+    def test_filter_many(self):
+        """ Filtering a batch gives same values as filtering one by one """
+        values = [
+            ' Kady ', '\tMIXed Case\n', 'https://x.io', '', 'a1b2 ٣',
+            12, None, False
+        ]
+        for filter in self.filters():
+            with self.subTest(filter=filter):
+                expected = [filter.filter(value) for value in values]
+                self.assertEqual(expected, filter.filter_many(values))
+                self.assertEqual(expected, filter.filter_many(iter(values)))
+
+    @requires_numpy
+    def test_filter_many_arrays(self):
+        """ Filtering arrays gives same values as filtering one by one """
+        values = [
+            ' Kady ', '\tMIXed\u00a0', 'https://x.io', 'x.io', '', 'a1b2'
+        ]
+        for filter in self.filters():
+            with self.subTest(filter=filter):
+                expected = [filter.filter(value) for value in values]
+                filtered = filter.filter_many(np.array(values))
+                self.assertEqual(expected, list(filtered))
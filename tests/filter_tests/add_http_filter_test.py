@@ -33,10 +33,3 @@ class AddHttpFilterTest(TestCase):
         value = 'https://google.com'
         filter = AddHttp()
         self.assertEquals('https://google.com', filter.filter(value))
-
-
-
-
-
-
-
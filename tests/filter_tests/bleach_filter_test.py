@@ -1,6 +1,10 @@
 from unittest import TestCase
+import pickle
+import threading
 
 from shiftschema.filters import Bleach
+from shiftschema.cache import LruCache
+from shiftschema.exceptions import InvalidOption
 
 
 class BleachFilterTest(TestCase):
@@ -79,7 +83,68 @@ class BleachFilterTest(TestCase):
         # assert link removed as protocol was invalid
         self.assertEquals(expected, filtered)
 
+    def test_reuses_cleaner_within_thread(self):
+        """ Bleach filter creates cleaner once per thread """
+        filter = Bleach()
+        cleaner = filter.cleaner
+        filter.filter('<p>one</p>')
+        filter.filter('<p>two</p>')
+        self.assertIs(cleaner, filter.cleaner)
 
-
-
-
+    def test_creates_separate_cleaner_per_thread(self):
+        """ Bleach filter does not share cleaner between threads """
+        filter = Bleach()
+        cleaners = []
+        def get_cleaner():
+            cleaners.append(filter.cleaner)
+        thread = threading.Thread(target=get_cleaner)
+        thread.start()
+        thread.join()
+        self.assertIsNot(cleaners[0], filter.cleaner)
+
+    def test_can_pickle_filter(self):
+        """ Bleach filter can be pickled """
+        filter = Bleach()
+        text = '<p>https://google.com</p>'
+        restored = pickle.loads(pickle.dumps(filter))
+        self.assertEquals(filter.filter(text), restored.filter(text))
+
+    def test_can_use_cache(self):
+        """ Bleach filter reuses cached results for recurring values """
+        cache = LruCache()
+        filter = Bleach(cache=cache)
+        text = '<p>text<script>x</script></p>'
+        expected = Bleach().filter(text)
+        self.assertEquals(expected, filter.filter(text))
+        self.assertEquals(expected, filter.filter(text))
+        self.assertEquals(1, cache.hits)
+        self.assertEquals(1, cache.misses)
+
+    def test_cache_keys_depend_on_config(self):
+        """ Bleach filters with different config do not share results """
+        cache = LruCache()
+        text = '<p>text<script>x</script></p>'
+        Bleach(cache=cache).filter(text)
+        Bleach(cache=cache, strip=False).filter(text)
+        self.assertEquals(0, cache.hits)
+        self.assertEquals(2, len(cache))
+
+    def test_cache_keys_depend_on_callback_config(self):
+        """ Bleach filters with differently configured callbacks """
+        def allow(names):
+            def check(tag, name, value):
+                return name in names
+            return check
+
+        cache = LruCache()
+        text = '<a href="x" title="t">l</a>'
+        href = Bleach(tags=['a'], attributes=allow(['href']), cache=cache)
+        title = Bleach(tags=['a'], attributes=allow(['title']), cache=cache)
+        self.assertNotEqual(href.namespace, title.namespace)
+        self.assertEquals('<a href="x">l</a>', href.filter(text))
+        self.assertEquals('<a title="t">l</a>', title.filter(text))
+
+    def test_refuse_to_cache_undeterministic_config(self):
+        """ Raise when config can't be hashed into cache keys """
+        with self.assertRaises(InvalidOption):
+            Bleach(attributes=(1).__eq__, cache=LruCache())
@@ -38,8 +38,3 @@ class DigitsFilterTest(TestCase):
         value = 'I was born in 1964'
         filter = Digits(to_int=True)
         self.assertEqual(1964, filter.filter(value))
-
-
-
-
-
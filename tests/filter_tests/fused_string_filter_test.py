@@ -0,0 +1,123 @@
+from unittest import TestCase
+import random
+
+from shiftschema import filters
+from shiftschema.filters import FusedString
+
+
+class FusedStringFilterTest(TestCase):
+    """ Fused string filters test"""
+
+    def test_create(self):
+        """ Can instantiate fused filter """
+        filter = FusedString([filters.Strip(), filters.Lowercase()])
+        self.assertIsInstance(filter, FusedString)
+        self.assertEquals(2, len(filter.steps))
+
+    def test_fuse_consecutive_string_filters(self):
+        """ Fusing consecutive string filters only """
+        bleach = filters.Bleach()
+        strip = filters.Strip()
+        pipeline = FusedString.fuse([
+            filters.Stringify(),
+            filters.Strip(),
+            bleach,
+            strip,
+            filters.Lowercase(),
+            filters.Uppercase(),
+        ])
+        self.assertEquals(3, len(pipeline))
+        self.assertIsInstance(pipeline[0], FusedString)
+        self.assertIs(bleach, pipeline[1])
+        self.assertIsInstance(pipeline[2], FusedString)
+
+    def test_do_not_fuse_single_filters(self):
+        """ Single string filters are left as they are """
+        strip = filters.Strip()
+        self.assertEquals([strip], FusedString.fuse([strip]))
+
+    def test_do_not_fuse_subclasses(self):
+        """ Custom filters extending string filters are not fused """
+        class CustomStrip(filters.Strip):
+            pass
+
+        custom = CustomStrip()
+        pipeline = FusedString.fuse([custom, filters.Lowercase()])
+        self.assertIs(custom, pipeline[0])
+
+    def test_digits_to_int_ends_fused_run(self):
+        """ Digits filter converting to int ends fused run """
+        pipeline = FusedString.fuse([
+            filters.Strip(),
+            filters.Digits(to_int=True),
+            filters.Stringify(),
+            filters.Strip(),
+        ])
+        self.assertEquals(2, len(pipeline))
+        self.assertEquals(42, pipeline[0].filter('  4 2  '))
+
+    def test_drop_redundant_steps(self):
+        """ Redundant steps are dropped from fused filter """
+        filter = FusedString([
+            filters.Strip(),
+            filters.Stringify(),
+            filters.Strip(),
+            filters.Lowercase(),
+            filters.Lowercase(),
+        ])
+        self.assertEquals(2, len(filter.steps))
+
+        filter = FusedString([filters.Slugify(), filters.Lowercase()])
+        self.assertEquals(1, len(filter.steps))
+
+        filter = FusedString([
+            filters.Slugify(replacements=[['a', 'A']]),
+            filters.Lowercase()
+        ])
+        self.assertEquals(2, len(filter.steps))
+        self.assertEquals('a-b', filter.filter('a b'))
+
+    def test_pass_non_strings_through_original_filters(self):
+        """ Non-string values are filtered by original filters """
+        filter = FusedString([
+            filters.Stringify(),
+            filters.Strip(chars='1'),
+            filters.AddHttp(),
+        ])
+        self.assertEquals('http://23', filter.filter(123))
+
+        filter = FusedString([filters.Strip(), filters.Lowercase()])
+        self.assertEquals(123, filter.filter(123))
+
+    def test_fused_filter_matches_unfused_chain(self):
+        """ Fused filter produces the same result as unfused chain """
+        random.seed(34)
+        pool = [
+            lambda: filters.Strip(),
+            lambda: filters.Strip(mode='left'),
+            lambda: filters.Strip(mode='right', chars='x '),
+            lambda: filters.Lowercase(),
+            lambda: filters.Uppercase(),
+            lambda: filters.Digits(),
+            lambda: filters.Digits(to_int=True),
+            lambda: filters.AddHttp(),
+            lambda: filters.Stringify(),
+            lambda: filters.Slugify(),
+            lambda: filters.Slugify(lowercase=False),
+        ]
+        values = ['  Hello World 42 ', 'https://X.com ', 'xx ab12 xx', '',
+                  12, 3.5, True, 'İSTANBUL ß']
+
+        for _ in range(500):
+            chain = [random.choice(pool)() for _ in range(5)]
+            pipeline = FusedString.fuse(chain)
+            for value in values:
+                expected = value
+                for filter in chain:
+                    expected = filter.filter(expected)
+                fused = value
+                for filter in pipeline:
+                    fused = filter.filter(fused)
+
+                self.assertEqual(expected, fused)
+                self.assertIs(type(expected), type(fused))
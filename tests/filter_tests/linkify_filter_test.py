@@ -1,6 +1,9 @@
 from unittest import TestCase
+import pickle
+import threading
 
 from shiftschema.filters import Linkify
+from shiftschema.cache import LruCache
 
 
 class LinkifyFilterTest(TestCase):
@@ -83,5 +86,48 @@ class LinkifyFilterTest(TestCase):
         expected += '<pre>https://yahoo.com</pre>'
         self.assertEquals(expected, filtered)
 
+    def test_reuses_linker_within_thread(self):
+        """ Linkify filter creates linker once per thread """
+        filter = Linkify()
+        linker = filter.linker
+        filter.filter('<p>one</p>')
+        filter.filter('<p>two</p>')
+        self.assertIs(linker, filter.linker)
 
-
+    def test_creates_separate_linker_per_thread(self):
+        """ Linkify filter does not share linker between threads """
+        filter = Linkify()
+        linkers = []
+        def get_linker():
+            linkers.append(filter.linker)
+        thread = threading.Thread(target=get_linker)
+        thread.start()
+        thread.join()
+        self.assertIsNot(linkers[0], filter.linker)
+
+    def test_can_pickle_filter(self):
+        """ Linkify filter can be pickled """
+        filter = Linkify()
+        text = '<p>https://google.com</p>'
+        restored = pickle.loads(pickle.dumps(filter))
+        self.assertEquals(filter.filter(text), restored.filter(text))
+
+    def test_can_use_cache(self):
+        """ Linkify filter reuses cached results for recurring values """
+        cache = LruCache()
+        filter = Linkify(cache=cache)
+        text = 'see https://google.com'
+        expected = Linkify().filter(text)
+        self.assertEquals(expected, filter.filter(text))
+        self.assertEquals(expected, filter.filter(text))
+        self.assertEquals(1, cache.hits)
+        self.assertEquals(1, cache.misses)
+
+    def test_cache_keys_depend_on_config(self):
+        """ Linkify filters with different config do not share results """
+        cache = LruCache()
+        text = 'see https://google.com'
+        Linkify(cache=cache).filter(text)
+        Linkify(cache=cache, skip_tags=['p']).filter(text)
+        self.assertEquals(0, cache.hits)
+        self.assertEquals(2, len(cache))
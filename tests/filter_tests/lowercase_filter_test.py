@@ -22,8 +22,3 @@ class LowercaseFilterTest(TestCase):
         value = 'Me Is Value'
         filter = Lowercase()
         self.assertEqual(value.lower(), filter.filter(value))
-
-
-
-
-
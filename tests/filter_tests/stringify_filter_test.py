@@ -1,5 +1,6 @@
 from unittest import TestCase
 from shiftschema.filters import Stringify
+from tests.helpers import np, requires_numpy
 
 
 class StringifyFilterTest(TestCase):
@@ -31,7 +32,11 @@ class StringifyFilterTest(TestCase):
         strip = Stringify(false_to_empty=True)
         self.assertEqual(expected, strip.filter(value))
 
-
-
-
-
+    @requires_numpy
+    def test_filter_numeric_arrays(self):
+        """ Filtering arrays of numbers and booleans """
+        for filter in [Stringify(), Stringify(True, True)]:
+            for values in ([1, -20, 0], [True, False]):
+                expected = [filter.filter(value) for value in values]
+                filtered = filter.filter_many(np.array(values))
+                self.assertEqual(expected, list(filtered))
@@ -50,7 +50,3 @@ class StripFilterTest(TestCase):
         expected = 'filter me'
         strip = Strip(chars='w.')
         self.assertEqual(expected, strip.filter(value))
-
-
-
-
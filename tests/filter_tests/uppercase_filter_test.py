@@ -22,8 +22,3 @@ class UppercaseFilterTest(TestCase):
         value = 'Me Is Value'
         filter = Uppercase()
         self.assertEqual(value.upper(), filter.filter(value))
-
-
-
-
-
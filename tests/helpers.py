@@ -1,9 +1,19 @@
 
+from unittest import skipIf
 from shiftschema import validators
 from shiftschema import filters
 from shiftschema.result import Error
 from shiftschema.schema import Schema
 
+# numpy is optional
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# skips tests of array implementations if numpy is not installed
+requires_numpy = skipIf(np is None, 'numpy not installed')
+
 # -----------------------------------------------------------------------------
 # Test helpers
 # -----------------------------------------------------------------------------
@@ -11,12 +21,16 @@ from shiftschema.schema import Schema
 
 class ValidatorValid(validators.AbstractValidator):
     """ Test validator that is always valid"""
+    deterministic = True
+
     def validate(self, value=None, model=None, context=None):
         return Error() # always valid
 
 
 class ValidatorInvalid(validators.AbstractValidator):
     """ Test validator that is always invalid"""
+    deterministic = True
+
     def validate(self, value=None, model=None, context=None):
         return Error('always invalid')
 
@@ -0,0 +1,108 @@
+from unittest import TestCase
+from nose.plugins.attrib import attr
+
+from shiftschema.json_stream import JsonStream
+import json
+import io
+
+
+@attr('json_stream')
+class JsonStreamTest(TestCase):
+
+    document = json.dumps(dict(
+        name='Matthew ü漢😀 "\\"',
+        count=-12,
+        ratio=1.25e-3,
+        flags=[True, False, None],
+        nested={'items': [1, 22, 333]},
+        items=[{'id': 1}, {'id': '2'}, [], {}],
+    ))
+
+    def members(self, stream, lazy=()):
+        """ Collect members, consuming lazy ones """
+        members = dict()
+        for key, value in stream.members(lazy=lazy):
+            if key in lazy:
+                self.assertNotIsInstance(value, list)
+                value = list(value)
+            members[key] = value
+        return members
+
+    def test_create(self):
+        """ Creating json stream """
+        stream = JsonStream(io.StringIO('{}'))
+        self.assertIsInstance(stream, JsonStream)
+
+    def test_decode_members_in_chunks(self):
+        """ Decoding members of text and binary documents in small chunks """
+        expected = json.loads(self.document)
+        for chunk_size in (1, 2, 3, 7, 1024):
+            stream = JsonStream(io.StringIO(self.document), chunk_size)
+            self.assertEqual(expected, self.members(stream))
+            data = io.BytesIO(self.document.encode())
+            stream = JsonStream(data, chunk_size)
+            self.assertEqual(expected, self.members(stream))
+
+    def test_numbers_are_not_split_at_chunk_boundary(self):
+        """ Numbers are decoded whole when split between chunks """
+        stream = JsonStream(io.StringIO('{"a": 1.5e10, "b": -12}'), 1)
+        self.assertEqual(dict(a=1.5e10, b=-12), self.members(stream))
+
+    def test_iterate_lazy_members(self):
+        """ Iterating over items of lazy members one at a time """
+        stream = JsonStream(io.StringIO(self.document), 4)
+        members = stream.members(lazy=['items', 'name'])
+        for key, value in members:
+            if key == 'name':
+                self.assertEqual('Matthew ü漢😀 "\\"', value)
+            if key == 'items':
+                break
+
+        self.assertEqual({'id': 1}, next(value))
+        self.assertFalse(stream.eof)  # rest of items not read yet
+        self.assertEqual([{'id': '2'}, [], {}], list(value))
+
+    def test_skip_items_not_iterated(self):
+        """ Items of lazy members not iterated are skipped """
+        document = '{"items": [1, 2, 3], "after": true}'
+        stream = JsonStream(io.StringIO(document), 2)
+        members = [key for key, _ in stream.members(lazy=['items'])]
+        self.assertEqual(['items', 'after'], members)
+
+    def test_raise_on_malformed_documents(self):
+        """ Raise decode errors on malformed documents """
+        documents = [
+            '',
+            '[1, 2]',
+            '{"a" 1}',
+            '{"a": 1} 2',
+            '{"a": 1.}',
+            '{"a": 12',
+            '{1: 2}',
+            '{"items": [1 2]}',
+        ]
+        for document in documents:
+            stream = JsonStream(io.StringIO(document), 2)
+            with self.assertRaises(json.JSONDecodeError):
+                self.members(stream, lazy=['items'])
+
+    def test_raise_on_malformed_items_without_reading_ahead(self):
+        """ Malformed items raise before the rest of document is read """
+        document = '{"items": [1, x' + ', 2' * 10000 + ']}'
+        fp = io.StringIO(document)
+        stream = JsonStream(fp, 64)
+        with self.assertRaises(json.JSONDecodeError):
+            self.members(stream, lazy=['items'])
+        self.assertLess(fp.tell(), 1024)
+
+    def test_report_error_position_in_document(self):
+        """ Decode errors give position in document rather than buffer """
+        document = '{\n"items": [\n' + '1,\n' * 100 + '  x]}'
+        stream = JsonStream(io.StringIO(document), 16)
+        with self.assertRaises(json.JSONDecodeError) as cm:
+            self.members(stream, lazy=['items'])
+
+        self.assertEqual(document.index('x'), cm.exception.pos)
+        self.assertEqual(103, cm.exception.lineno)
+        self.assertEqual(3, cm.exception.colno)
+        self.assertIn('line 103 column 3', str(cm.exception))
@@ -0,0 +1,110 @@
+from unittest import TestCase, skipIf
+from nose.plugins.attrib import attr
+
+from shiftschema.result import Error, Result
+from shiftschema import validators
+from tests import helpers
+
+try:
+    import pandas as pd
+    from shiftschema.ext import pandas as ext
+except ImportError:
+    pd = None
+
+
+class Even(validators.AbstractValidator):
+    def validate(self, value, model=None, context=None):
+        if value % 2:
+            return Error('odd')
+        return Error()
+
+
+@attr('pandas')
+@skipIf(pd is None, 'pandas not installed')
+class PandasTest(TestCase):
+
+    def frame(self):
+        return pd.DataFrame(dict(
+            first_name=['  Matthew ', 'K', None, 'Jo'],
+            last_name=['Petersen', 'Reyna', 'Li', float('nan')],
+            salutation=['mr', 'sir', 'ms', 'ms'],
+            birth_year=[' 1980', '1990 ', None, '2001'],
+            number=[2, 4, 6, 7],
+        ), index=['a', 'b', 'c', 'd'])
+
+    def schema(self):
+        schema = ext.FrameSchema()
+        for property_name in helpers.PersonSpec().properties:
+            schema.properties[property_name] = (
+                helpers.PersonSpec().properties[property_name]
+            )
+        schema.add_property('number')
+        schema.number.add_validator(Even())
+        return schema
+
+    def test_convert_frame_columns(self):
+        """ Converting frame columns keeping arrays without missing values """
+        columns = ext.frame_columns(self.frame())
+        self.assertIsNone(columns['first_name'][2])
+        self.assertIsNone(columns['last_name'][3])
+        self.assertEqual(7, columns['number'].to_numpy()[3])
+
+    def test_flatten_errors(self):
+        """ Flattening nested errors into paths """
+        short, required, long, missing = (
+            Error('short'), Error('required'), Error('long'), Error('missing')
+        )
+        errors = dict(
+            first_name=[short],
+            spouse=dict(direct=[required], schema=dict(name=[long])),
+            addresses=dict(collection={1: Result(dict(city=[missing]))}),
+        )
+        self.assertEqual([
+            ('first_name', short),
+            ('spouse', required),
+            ('spouse.name', long),
+            ('addresses.1.city', missing),
+        ], list(ext.flatten(errors)))
+
+    def test_validate_frame(self):
+        """ Validating frame returns validity series and errors frame """
+        frame = self.frame()
+        valid, errors = self.schema().validate_frame(frame)
+        self.assertEqual([True, False, True, False], valid.tolist())
+        self.assertEqual(list(frame.index), list(valid.index))
+        self.assertEqual(['row', 'path', 'message'], list(errors.columns))
+        self.assertEqual(['b', 'b', 'd'], errors['row'].tolist())
+        self.assertEqual(
+            ['first_name', 'salutation', 'number'],
+            errors['path'].tolist()
+        )
+        self.assertEqual('odd', errors['message'].iloc[2])
+
+    def test_validate_nested_entities_by_row(self):
+        """ Validating entities of frame rows """
+        frame = pd.DataFrame(dict(
+            first_name=['Matthew', 'Kady'],
+            spouse=[dict(first_name='Kady'), dict(first_name='M')],
+            addresses=[[dict(address='2 Hollin Croft')], []],
+        ))
+        valid, errors = ext.validate_frame(
+            helpers.PersonSpecAggregate(),
+            frame
+        )
+        self.assertEqual([False, False], valid.tolist())
+        paths = errors[errors['row'] == 1]['path'].tolist()
+        self.assertIn('spouse.first_name', paths)
+        self.assertIn('addresses', paths)
+        paths = errors[errors['row'] == 0]['path'].tolist()
+        self.assertIn('addresses.0.city', paths)
+
+    def test_filter_frame(self):
+        """ Filtering frame returns filtered copy """
+        frame = self.frame()
+        filtered = self.schema().filter_frame(frame)
+        self.assertEqual('  Matthew ', frame['first_name']['a'])
+        self.assertEqual('Matthew', filtered['first_name']['a'])
+        self.assertTrue(pd.isna(filtered['first_name']['c']))
+        self.assertEqual(1990, filtered['birth_year']['b'])
+        self.assertEqual([2, 4, 6, 7], filtered['number'].tolist())
+        self.assertEqual(list(frame.index), list(filtered.index))
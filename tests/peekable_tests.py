@@ -0,0 +1,47 @@
+from unittest import TestCase
+from nose.plugins.attrib import attr
+
+from shiftschema.peekable import Peekable
+
+
+@attr('peekable')
+class PeekableTest(TestCase):
+
+    def test_create(self):
+        """ Creating peekable iterator """
+        peekable = Peekable(iter([1, 2, 3]))
+        self.assertIsInstance(peekable, Peekable)
+
+    def test_wrap_only_iterators(self):
+        """ Wrapping one-off iterators only """
+        collection = [1, 2, 3]
+        self.assertIs(collection, Peekable.wrap(collection))
+        self.assertIsNone(Peekable.wrap(None))
+        self.assertIsInstance(Peekable.wrap(iter(collection)), Peekable)
+
+    def test_peek_without_consuming(self):
+        """ Peeking does not consume items """
+        generator = (i for i in range(5))
+        peekable = Peekable(generator)
+        self.assertEqual(0, next(iter(peekable)))
+        self.assertEqual([0, 1], [i for i, _ in zip(peekable, range(2))])
+        self.assertEqual([0, 1, 2, 3, 4], list(peekable.consume()))
+        self.assertEqual([], list(generator))
+
+    def test_release_buffered_items_when_consuming(self):
+        """ Buffered items are released when consumed """
+        peekable = Peekable(iter(range(3)))
+        list(peekable)
+        self.assertEqual(3, len(peekable.buffer))
+        consumer = peekable.consume()
+        next(consumer)
+        self.assertEqual(0, len(peekable.buffer))
+        self.assertEqual([1, 2], list(consumer))
+
+    def test_count_items(self):
+        """ Counting items before and after consuming """
+        peekable = Peekable(iter(range(3)))
+        self.assertEqual(3, peekable.count())
+        self.assertEqual([0, 1, 2], list(peekable.consume()))
+        self.assertEqual(3, peekable.count())
+        self.assertEqual(0, len(peekable.buffer))
@@ -10,10 +10,12 @@ from shiftschema.property import CollectionProperty
 from shiftschema.exceptions import InvalidFilter
 from shiftschema.exceptions import InvalidValidator
 from shiftschema.exceptions import InvalidSchemaType
+from shiftschema.exceptions import InvalidOption
 from shiftschema import filters
 from shiftschema import validators
 
 from tests import helpers
+import gc
 
 
 @attr('property', 'simple')
@@ -78,6 +80,84 @@ class SimplePropertyTests(TestCase):
         value = '  Good luck in 2024 to you and your robots!'
         self.assertEqual('2024', prop.filter(value))
 
+    def test_fuse_string_filters(self):
+        """ Consecutive string filters are fused when added """
+        prop = SimpleProperty()
+        prop.add_filter(filters.Stringify())
+        prop.add_filter(filters.Strip())
+        prop.add_filter(filters.Lowercase())
+        self.assertEquals(3, len(prop.filters))
+        self.assertEquals(1, len(prop.pipeline))
+        self.assertIsInstance(prop.pipeline[0], filters.FusedString)
+        self.assertEquals('example', prop.filter('  ExAmple '))
+        self.assertEquals('123', prop.filter(123))
+
+    def test_skip_filtering_values_filtered_by_idempotent_filters(self):
+        """ Values produced by idempotent filters are not refiltered """
+        class Counting(filters.Strip):
+            calls = 0
+
+            def filter(self, value, model=None, context=None):
+                self.calls += 1
+                return super().filter(value, model, context)
+
+        counting = Counting()
+        prop = SimpleProperty()
+        prop.remember = 1024
+        prop.add_filter(counting)
+        self.assertTrue(prop.idempotent)
+
+        self.assertEquals('value', prop.filter('  value  '))
+        self.assertEquals('value', prop.filter('value'))
+        self.assertEquals('value', prop.filter('value'))
+        self.assertEquals(1, counting.calls)
+
+        # values are told apart by type
+        self.assertEquals(1, prop.filter(1))
+        self.assertEquals(True, prop.filter(True))
+        self.assertIs(bool, type(prop.filter(True)))
+
+    def test_always_refilter_when_some_filters_are_not_idempotent(self):
+        """ Values are always filtered if not all filters are idempotent """
+        prop = SimpleProperty()
+        prop.add_filter(filters.Strip())
+        prop.add_filter(filters.Linkify())
+        self.assertFalse(prop.idempotent)
+        prop.filter('  value  ')
+        self.assertEquals({}, prop.filtered)
+
+    def test_remember_bounded_number_of_filtered_values(self):
+        """ Property remembers limited number of filtered values """
+        prop = SimpleProperty()
+        prop.remember = 3
+        prop.add_filter(filters.Strip())
+        for i in range(10):
+            prop.filter(' {} '.format(i))
+        self.assertEquals(3, len(prop.filtered))
+        self.assertIn((str, '9'), prop.filtered)
+        self.assertNotIn((str, '0'), prop.filtered)
+
+    def test_remember_filtered_values_bounded_by_size(self):
+        """ Property remembers filtered values up to total length """
+        prop = SimpleProperty()
+        prop.remember = 100
+        prop.remember_size = 10
+        prop.add_filter(filters.Strip())
+        prop.filter('x' * 11)
+        self.assertEquals({}, prop.filtered)
+        for value in ('aaaa', 'bbbb', 'cccc'):
+            prop.filter(value)
+        self.assertEquals(8, prop.filtered_size)
+        self.assertNotIn((str, 'aaaa'), prop.filtered)
+        self.assertIn((str, 'cccc'), prop.filtered)
+
+    def test_do_not_remember_filtered_values_by_default(self):
+        """ Remembering filtered values is opt-in """
+        prop = SimpleProperty()
+        prop.add_filter(filters.Strip())
+        prop.filter(' value ')
+        self.assertEquals({}, prop.filtered)
+
 
     def test_filtering_simple_prop_with_context(self):
         """ Filtering simple property with context (default) """
@@ -167,6 +247,93 @@ class SimplePropertyTests(TestCase):
         result = prop.validate(None)
         self.assertEquals(0, len(result))
 
+    def test_filter_column_of_values(self):
+        """ Filter a column of values, leaving None values as they are """
+        class Initial(filters.AbstractFilter):
+            def filter(self, value, model=None, context=None):
+                assert model == dict(row=value)
+                return value[0]
+
+        prop = SimpleProperty()
+        prop.add_filter(filters.Strip())
+        prop.add_filter(filters.Uppercase())
+        values = (' kady ', None, 'jo ', None)
+        self.assertEqual(['KADY', None, 'JO', None], prop.filter_many(values))
+
+        prop.add_filter(Initial())
+        models = [dict(row=value) for value in ('KADY', None, 'JO', None)]
+        filtered = prop.filter_many(iter(values), models=models)
+        self.assertEqual(['K', None, 'J', None], filtered)
+
+    def test_filter_array_of_values(self):
+        """ Filter a column of values stored as an array """
+        try:
+            import numpy as np
+        except ImportError:
+            self.skipTest('numpy not installed')
+
+        prop = SimpleProperty()
+        prop.add_filter(filters.Strip())
+        prop.add_filter(filters.Lowercase())
+        filtered = prop.filter_many(np.array([' Kady ', 'JO ']))
+        self.assertIsInstance(filtered, np.ndarray)
+        self.assertEqual(['kady', 'jo'], filtered.tolist())
+
+        prop.add_filter(filters.Digits())
+        filtered = prop.filter_many(np.array([' Kady1 ', None], dtype=object))
+        self.assertEqual(['1', None], filtered)
+
+    def test_validate_column_of_values(self):
+        """ Validate a column of values, keeping errors of invalid ones """
+        class Even(validators.AbstractValidator):
+            def validate(self, value, model=None, context=None):
+                assert model == dict(row=value)
+                return Error('odd') if value % 2 else Error()
+
+        prop = SimpleProperty()
+        prop.add_validator(validators.Required())
+        prop.add_validator(validators.Length(max=1, message='long'))
+        prop.add_validator(Even())
+
+        values = [2, None, 3, 44]
+        models = [dict(row=value) for value in values]
+        errors = prop.validate_many(values, models=models)
+        self.assertEqual([1, 2, 3], list(errors.keys()))
+        self.assertEqual('%value_required%', errors[1][0].message)
+        self.assertEqual(['odd'], [error.message for error in errors[2]])
+        self.assertEqual(['long'], [error.message for error in errors[3]])
+
+    def test_validate_array_of_values(self):
+        """ Validate a column of values stored as an array """
+        try:
+            import numpy as np
+        except ImportError:
+            self.skipTest('numpy not installed')
+
+        class Even(validators.AbstractValidator):
+            def validate(self, value, model=None, context=None):
+                assert type(value) is int and model == dict(row=value)
+                return Error('odd') if value % 2 else Error()
+
+        prop = SimpleProperty()
+        prop.add_validator(validators.Required())
+        prop.add_validator(validators.Length(max=1, message='long'))
+        prop.add_validator(Even())
+
+        values = np.array([2, 0, 3, 44])
+        models = [dict(row=value) for value in values.tolist()]
+        errors = prop.validate_many(values, models=models)
+        self.assertEqual([1, 2, 3], list(errors.keys()))
+        self.assertEqual('%value_required%', errors[1][0].message)
+        self.assertEqual(['odd'], [error.message for error in errors[2]])
+        self.assertEqual(['long'], [error.message for error in errors[3]])
+
+        prop.validators.pop()
+        values = np.array(['ab', None], dtype=object)
+        errors = prop.validate_many(values)
+        self.assertEqual([0, 1], list(errors.keys()))
+        self.assertEqual(['long'], [error.message for error in errors[0]])
+
     def test_required_validator_still_runs_if_value_is_none(self):
         """ Required validator still runs even if value is None """
         prop = SimpleProperty()
@@ -435,11 +602,135 @@ class CollectionPropertyTests(TestCase):
 
         result = prop.validate_with_schema(collection)
 
-        self.assertTrue(type(result) is list)
+        self.assertIsInstance(result, dict)
+        self.assertEquals([0, 2], list(result.keys()))
         self.assertFalse(result[0])
-        self.assertTrue(result[1])
         self.assertFalse(result[2])
-        self.assertTrue(result[3])
+
+    def test_cap_number_of_kept_item_results(self):
+        """ Keep limited number of invalid item results and count the rest """
+        prop = CollectionProperty(max_errors=2)
+        prop.schema = Schema()
+        prop.schema.add_property('name')
+        prop.schema.name.add_validator(validators.Required())
+
+        collection = [dict(name=None)] * 5 + [dict(name='Kady')]
+        result = prop.validate_with_schema(collection)
+        self.assertEquals([0, 1], list(result.keys()))
+        self.assertEquals(3, result.truncated)
+
+        result = prop.validate_with_schema(iter(collection))
+        self.assertEquals([0, 1], list(result.keys()))
+        self.assertEquals(3, result.truncated)
+
+    def test_filter_copy_of_collection_items_with_schema(self):
+        """ Filter copies of collection items with schema """
+        prop = CollectionProperty()
+        prop.schema = Schema()
+        prop.schema.add_property('name').add_filter(filters.Strip())
+
+        collection = (dict(name='    Kady   '), dict(name='Jeff'))
+        filtered = prop.filter_copy_with_schema(collection)
+        self.assertIsInstance(filtered, tuple)
+        self.assertEquals('Kady', filtered[0]['name'])
+        self.assertEquals('    Kady   ', collection[0]['name'])
+        self.assertIs(collection[1], filtered[1])
+
+        generator = (item for item in [dict(name=' Jeff ')])
+        filtered = prop.filter_copy_with_schema(generator)
+        self.assertEquals([dict(name='Jeff')], filtered)
+
+    def test_raise_on_invalid_parallel_options(self):
+        """ Raise on invalid parallel validation options """
+        prop = CollectionProperty()
+        with self.assertRaises(InvalidOption):
+            prop.parallelize(threshold=0)
+        with self.assertRaises(InvalidOption):
+            prop.parallelize(chunk_size=-1)
+
+    def test_small_collections_are_validated_serially(self):
+        """ Collections below threshold are not sent to a worker pool """
+        prop = CollectionProperty().parallelize(threshold=10)
+        prop.schema = Schema()
+        prop.schema.add_property('name')
+        prop.schema.name.add_validator(validators.Required())
+
+        result = prop.validate_with_schema([dict(name=None)] * 9)
+        self.assertEquals(9, len(result))
+        self.assertIsNone(prop.executor)
+
+    def test_restart_worker_pool_when_schema_changes(self):
+        """ Worker pool is restarted once nested schema gets modified """
+        prop = CollectionProperty().parallelize(threshold=2, workers=1)
+        prop.schema = Schema()
+        prop.schema.add_property('name')
+        executor = prop.get_executor()
+        self.assertIs(executor, prop.get_executor())
+
+        prop.schema.name.add_validator(validators.Required())
+        restarted = prop.get_executor()
+        self.assertIsNot(executor, restarted)
+        self.assertTrue(executor._shutdown)
+
+        prop.schema = Schema()
+        self.assertIsNot(restarted, prop.get_executor())
+        self.assertTrue(restarted._shutdown)
+        prop.shutdown()
+
+    def test_shut_down_worker_pool_when_collected(self):
+        """ Worker pool is shut down once property gets garbage collected """
+        prop = CollectionProperty().parallelize(threshold=2, workers=1)
+        prop.schema = Schema()
+        executor = prop.get_executor()
+        self.assertFalse(executor._shutdown)
+        del prop
+        gc.collect()
+        self.assertTrue(executor._shutdown)
+
+    def test_validate_collection_items_in_threads(self):
+        """ Validate items of large collections in a thread pool """
+        schema = Schema()
+        prop = schema.add_collection('people', max_errors=5)
+        prop.parallelize(threshold=10, workers=3, chunk_size=4)
+        prop.schema = Schema()
+        prop.schema.add_property('name').add_filter(filters.Strip())
+        prop.schema.name.add_validator(validators.Required())
+
+        items = [dict(name=' Kady ' if i % 3 else '') for i in range(30)]
+        result = prop.validate_with_schema(items)
+        self.assertEquals([0, 3, 6, 9, 12], list(result.keys()))
+        self.assertEquals(5, result.truncated)
+        self.assertEquals(' Kady ', items[1]['name'])
+
+        result = schema.process(dict(people=items))
+        errors = result.errors['people']['collection']
+        self.assertEquals([0, 3, 6, 9, 12], list(errors.keys()))
+        self.assertEquals('Kady', items[1]['name'])
+        prop.shutdown()
+
+    def test_validate_collection_items_in_processes(self):
+        """ Validate items of large collections in a process pool """
+        schema = Schema()
+        prop = schema.add_collection('addresses')
+        prop.parallelize(threshold=2, workers=2, processes=True)
+        prop.schema = helpers.AddressSpec()
+
+        valid = dict(
+            address=' 1 Main St ',
+            city='London',
+            country='UK',
+            postcode='N1'
+        )
+        items = [dict(valid), dict(valid, city=None), dict(valid)]
+        items.append(dict(valid, country=None))
+
+        result = schema.process(dict(addresses=items))
+        prop.shutdown()
+        errors = result.errors['addresses']['collection']
+        self.assertEquals([1, 3], list(errors.keys()))
+        self.assertIn('city', errors[1].errors)
+        self.assertIn('country', errors[3].errors)
+        self.assertEquals('1 Main St', items[0]['address'])
 
     def test_filtering_collection_prop_with_schema_using_context(self):
         """ Filtering collection property with schema using context (default)"""
@@ -519,7 +810,8 @@ class CollectionPropertyTests(TestCase):
         ]
 
         res = prop.validate_with_schema(collection=col, context=custom_context)
-        for result in res:
+        self.assertEquals(2, len(res))
+        for result in res.values():
             err = result.get_messages()
             self.assertEquals('CONTEXT', err['prop'][0])
 
@@ -547,7 +839,8 @@ class CollectionPropertyTests(TestCase):
         ]
 
         res = prop.validate_with_schema(collection=col, context=custom_context)
-        for result in res:
+        self.assertEquals(2, len(res))
+        for result in res.values():
             err = result.get_messages()
             self.assertEquals('NO CONTEXT', err['prop'][0])
 
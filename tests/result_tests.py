@@ -1,7 +1,7 @@
 from unittest import TestCase
 from nose.plugins.attrib import attr
 
-from shiftschema.result import Error, Result
+from shiftschema.result import Error, Result, CollectionErrors
 from shiftschema import exceptions as x
 from pprint import pprint as pp
 
@@ -269,6 +269,37 @@ class ResultTest(TestCase):
         self.assertIn(e1, errors[0].errors['simple'])
         self.assertIn(e2, errors[2].errors['simple'])
 
+    def test_add_sparse_collection_errors(self):
+        """ Adding sparse collection errors with truncated count """
+        collection_errors = CollectionErrors()
+        collection_errors[5] = Result(errors=dict(simple=[Error('error 1')]))
+        collection_errors.truncated = 3
+
+        result = Result()
+        result.add_collection_errors(
+            'collection_prop',
+            collection_errors=collection_errors
+        )
+        errors = result.errors['collection_prop']
+        self.assertIs(collection_errors, errors['collection'])
+
+        more_errors = CollectionErrors()
+        more_errors[5] = Result(errors=dict(simple=[Error('error 2')]))
+        more_errors.truncated = 3
+        result.add_collection_errors(
+            'collection_prop',
+            collection_errors=more_errors
+        )
+
+        self.assertEquals(6, errors['truncated'])
+        self.assertEquals(
+            dict(collection_prop=dict(
+                collection={5: dict(simple=['error 1', 'error 2'])},
+                truncated=6
+            )),
+            result.get_messages()
+        )
+
     def test_append_collection_errors_to_nested_collection_errors(self):
         """ Appending direct errors to nested collection errors """
         result = Result()
@@ -2,16 +2,25 @@ from unittest import TestCase, mock
 from nose.plugins.attrib import attr
 
 from shiftschema.schema import Schema
-from shiftschema.result import Result
+from shiftschema.result import Result, Error, BatchResult
 from shiftschema.property import SimpleProperty
 from shiftschema.property import EntityProperty
 from shiftschema.property import CollectionProperty
 from shiftschema.exceptions import PropertyExists, InvalidValidator
+from shiftschema.exceptions import InvalidOption
 from shiftschema.translator import Translator
+from shiftschema.cache import LruCache, SqliteCache
 from shiftschema import validators
 from shiftschema import filters
 from tests import helpers
 from pprint import pprint as pp
+from copy import deepcopy
+from functools import partial
+import json
+import io
+import os
+import tempfile
+import tracemalloc
 
 
 @attr('schema')
@@ -454,6 +463,651 @@ class SchemaTest(TestCase):
         self.assertTrue('first_name' in result.errors) # too short
         self.assertTrue('first_name' in result.errors['spouse']['schema'])
 
+    def test_process_matches_filter_then_validate(self):
+        """ Process gives the same result as filtering and then validating """
+        def create_person():
+            person = helpers.Person(first_name='  Matthew  ', last_name='R')
+            person.spouse = helpers.Person(first_name='  X  ')
+            person.addresses = [
+                helpers.Address(address='  2 Hollin Croft  ', country='UK'),
+                helpers.Address(city='  Bolton  ', country='  US  '),
+                helpers.Address(city='  Billings  ', country='  UK  '),
+            ]
+            return person
+
+        for schema in [
+            helpers.PersonSpecAggregate(),
+            helpers.PersonSpecCollectionAggregate()
+        ]:
+            person1 = create_person()
+            schema.filter(person1)
+            expected = schema.validate(person1)
+
+            person2 = create_person()
+            result = schema.process(person2)
+            self.assertEqual(expected.get_messages(), result.get_messages())
+            self.assertEqual(repr(person1), repr(person2))
+            self.assertEqual(
+                [repr(address) for address in person1.addresses],
+                [repr(address) for address in person2.addresses]
+            )
+
+    def test_filter_copy_leaves_model_untouched(self):
+        """ Filtering copy does not change the model """
+        schema = helpers.PersonSpecAggregate()
+        model = dict(
+            first_name='  Matthew  ',
+            last_name='Rankin',
+            spouse=dict(first_name='  Mary  ', last_name='Rankin'),
+            addresses=[
+                dict(address='  2 Hollin Croft  ', country='UK'),
+                dict(address='40 Churchgate', country='UK'),
+            ]
+        )
+        schema.addresses.filters = []
+        snapshot = deepcopy(model)
+
+        filtered = schema.filter_copy(model)
+        self.assertEqual(snapshot, model)
+
+        schema.filter(model)
+        self.assertEqual(model, filtered)
+
+    def test_filter_copy_shares_unchanged_values(self):
+        """ Filtered copy shares unchanged values with the model """
+        schema = helpers.PersonSpecCollectionAggregate()
+        schema.addresses.filters = []
+        clean = dict(address='40 Churchgate', country='UK')
+        model = dict(
+            first_name='Matthew',
+            last_name='Rankin',
+            addresses=[clean, dict(address='  2 Hollin Croft  ')]
+        )
+
+        def original_address(model):
+            return model['addresses'][1]['address']
+
+        filtered = schema.filter_copy(model)
+        self.assertIsNot(model, filtered)
+        self.assertIsNot(model['addresses'], filtered['addresses'])
+        self.assertIs(clean, filtered['addresses'][0])
+        self.assertEqual('2 Hollin Croft', filtered['addresses'][1]['address'])
+        self.assertEqual('  2 Hollin Croft  ', original_address(model))
+
+        # nothing to filter
+        self.assertIs(filtered, schema.filter_copy(filtered))
+
+    def test_filter_copy_of_objects(self):
+        """ Filtering copy of an object """
+        person = helpers.Person(first_name='  Matthew  ', last_name='Rankin')
+        schema = helpers.PersonSpec()
+        filtered = schema.filter_copy(person)
+        self.assertIsInstance(filtered, helpers.Person)
+        self.assertEqual('Matthew', filtered.first_name)
+        self.assertEqual('  Matthew  ', person.first_name)
+
+    def test_filter_copy_of_objects_with_accessors(self):
+        """ Filtering copy of objects keeping data behind accessors """
+        class Record:
+            def __init__(self, **data):
+                self._data = data
+
+            def get_name(self):
+                return self._data.get('name')
+
+            def set_name(self, name):
+                self._data['name'] = name
+
+            def get_owner(self):
+                return self._data.get('owner')
+
+            def set_owner(self, owner):
+                self._data['owner'] = owner
+
+        schema = Schema()
+        schema.add_property('name').add_filter(filters.Strip())
+        schema.add_entity('owner').schema = schema
+        model = Record(name='  Kady  ', owner=Record(name='  Jeff  '))
+        owner = model.get_owner()
+
+        filtered = schema.filter_copy(model)
+        self.assertEqual('  Kady  ', model.get_name())
+        self.assertIs(owner, model.get_owner())
+        self.assertEqual('  Jeff  ', owner.get_name())
+        self.assertEqual('Kady', filtered.get_name())
+        self.assertEqual('Jeff', filtered.get_owner().get_name())
+
+    def test_filter_copy_of_objects_with_nested_entities(self):
+        """ Filtering copy of an object leaves nested entities untouched """
+        person = helpers.Person(first_name='Matthew', last_name='Rankin')
+        person.spouse = helpers.Person(first_name='  Mary  ')
+        person.addresses = [helpers.Address(address='  2 Hollin Croft  ')]
+        spouse, addresses = person.spouse, person.addresses
+        address = addresses[0]
+
+        schema = helpers.PersonSpecCollectionAggregate()
+        schema.add_entity('spouse').schema = helpers.PersonSpec()
+        schema.addresses.filters = []
+        filtered = schema.filter_copy(person)
+        self.assertIs(spouse, person.spouse)
+        self.assertEqual('  Mary  ', spouse.first_name)
+        self.assertIs(addresses, person.addresses)
+        self.assertIs(address, person.addresses[0])
+        self.assertEqual('  2 Hollin Croft  ', address.address)
+        self.assertEqual('Mary', filtered.spouse.first_name)
+        self.assertEqual('2 Hollin Croft', filtered.addresses[0].address)
+
+    def test_process_copy(self):
+        """ Process copy returns filtered copy and validation result """
+        schema = helpers.PersonSpec()
+        model = dict(first_name='  W  ', last_name='  Rankin  ')
+        filtered, result = schema.process_copy(model)
+        self.assertEqual('  W  ', model['first_name'])
+        self.assertEqual('W', filtered['first_name'])
+        self.assertIn('first_name', result.errors)
+        self.assertNotIn('last_name', result.errors)
+
+    def test_process_validates_state_with_filtered_nested_data(self):
+        """ Process runs state validators after nested data is filtered """
+        seen = []
+
+        class SpouseName(validators.AbstractValidator):
+            def validate(self, value=None, model=None, context=None):
+                seen.append(model.spouse.first_name)
+                return Error()
+
+        schema = helpers.PersonSpecAggregate()
+        schema.add_state_validator(SpouseName())
+        person = helpers.Person(first_name='  Matthew  ')
+        person.spouse = helpers.Person(first_name='  X  ')
+        schema.process(person)
+        self.assertEqual(['X'], seen)
+
+    def test_cap_collection_errors(self):
+        """ Capping number of stored collection item errors """
+        schema = Schema()
+        schema.add_collection('addresses', max_errors=2)
+        schema.addresses.schema = helpers.AddressSpec()
+        self.assertEqual(2, schema.addresses.max_errors)
+
+        model = dict(addresses=[dict(address='x')] * 10)
+        result = schema.process(model)
+        errors = result.errors['addresses']
+        self.assertEqual([0, 1], list(errors['collection'].keys()))
+        self.assertEqual(8, errors['truncated'])
+
+        messages = result.get_messages()
+        self.assertEqual(8, messages['addresses']['truncated'])
+        self.assertIn('city', messages['addresses']['collection'][1])
+
+        result.merge(schema.validate(model))
+        self.assertEqual(16, result.errors['addresses']['truncated'])
+
+    def test_validate_generator_collection(self):
+        """ Generators are validated in a single pass """
+        def addresses():
+            yield dict(address='2 Hollin Croft', city='Barnsley')
+            yield dict(address='40 Churchgate')
+            yield dict(city='Bolton')
+
+        schema = helpers.PersonSpecCollectionAggregate()
+        schema.addresses.filters = []
+        model = dict(first_name='Matthew', addresses=addresses())
+        result = schema.process(model)
+        self.assertNotIn('direct', result.errors['addresses'])
+        collection = result.errors['addresses']['collection']
+        self.assertEqual([0, 1, 2], list(collection.keys()))
+        self.assertIn('address', collection[2].errors)
+
+        model = dict(first_name='Matthew', addresses=(a for a in []))
+        result = schema.validate(model)
+        self.assertIn('direct', result.errors['addresses'])
+
+    def test_process_generator_collection_in_constant_memory(self):
+        """ Process does not keep items of generators in memory """
+        schema = Schema()
+        schema.add_collection('people')
+        schema.people.schema = Schema()
+        schema.people.schema.add_property('name').add_filter(filters.Strip())
+        schema.people.schema.name.add_validator(validators.Length(min=2))
+
+        model = dict(people=(dict(name=' Kady ') for _ in range(20000)))
+        tracemalloc.start()
+        try:
+            result = schema.process(model)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        self.assertTrue(result)
+        self.assertLess(peak, 256 * 1024)
+
+    def test_process_visits_collection_items_once(self):
+        """ Process iterates over collection only once """
+        class Collection(list):
+            iterations = 0
+
+            def __iter__(self):
+                self.iterations += 1
+                return super().__iter__()
+
+        person = helpers.Person(first_name='Matthew')
+        person.addresses = Collection([
+            helpers.Address(address='  2 Hollin Croft  '),
+            helpers.Address(address='  40 Churchgate  '),
+        ])
+        schema = helpers.PersonSpecCollectionAggregate()
+        schema.addresses.filters = []  # keep the collection
+        schema.addresses.validators = []  # and do not peek into it
+        result = schema.process(person)
+        self.assertEqual(1, person.addresses.iterations)
+        self.assertEqual('2 Hollin Croft', person.addresses[0].address)
+        self.assertIn(1, result.errors['addresses']['collection'])
+
+    def test_validate_json_while_streaming(self):
+        """ Validate a JSON document streaming collection items """
+        document = json.dumps(dict(
+            first_name='Matthew',
+            last_name='X',
+            spouse=dict(first_name='K'),
+            addresses=[
+                dict(address='2 Hollin Croft', city='Leeds',
+                     country='UK', postcode='LS1'),
+                dict(address='40 Churchgate', city='Leeds'),
+                dict(postcode='LS2'),
+            ],
+            salutation='sir',
+        ))
+        schema = helpers.PersonSpecAggregate()
+        expected = schema.validate(json.loads(document))
+        result = schema.validate_json(io.StringIO(document), chunk_size=8)
+        self.assertIsInstance(result, Result)
+        self.assertEqual(expected.get_messages(), result.get_messages())
+        collection = result.errors['addresses']['collection']
+        self.assertEqual([1, 2], list(collection.keys()))
+
+        document = '{"first_name": "Matthew", "addresses": []}'
+        result = schema.validate_json(io.BytesIO(document.encode()))
+        self.assertIn('direct', result.errors['addresses'])
+
+        with self.assertRaises(json.JSONDecodeError):
+            schema.validate_json(io.StringIO('{"addresses": [{}'))
+
+    def test_validate_json_length_of_streamed_collection(self):
+        """ Length of streamed collections is checked once items are read """
+        schema = helpers.PersonSpecAggregate()
+        schema.addresses.validators = [validators.Length(min=1, max=3)]
+        address = dict(address='2 Hollin Croft', city='Leeds', country='UK')
+        for size in range(5):
+            with self.subTest(size=size):
+                model = dict(first_name='Matthew', addresses=[address] * size)
+                document = json.dumps(model)
+                expected = schema.validate(model)
+                result = schema.validate_json(
+                    io.StringIO(document),
+                    chunk_size=16
+                )
+                messages = result.get_messages()
+                self.assertEqual(expected.get_messages(), messages)
+                errors = result.errors.get('addresses', {})
+                self.assertEqual(size not in (1, 2, 3), 'direct' in errors)
+
+    def test_fingerprint_schema_definition(self):
+        """ Schemas defined the same way have the same fingerprint """
+        schema = helpers.PersonSpecAggregate()
+        fingerprint = schema.fingerprint()
+        self.assertEqual(64, len(fingerprint))
+        same = helpers.PersonSpecAggregate()
+        self.assertEqual(fingerprint, same.fingerprint())
+        self.assertNotEqual(fingerprint, helpers.PersonSpec().fingerprint())
+
+        other = helpers.PersonSpecAggregate()
+        other.first_name.validators[0].max = 20
+        other.first_name.add_validator(validators.Required())
+        self.assertNotEqual(fingerprint, other.fingerprint())
+
+        # runtime state does not count
+        one, two = Schema(), Schema()
+        one.add_property('html')
+        one.html.add_filter(filters.Bleach(tags=['p']))
+        two.add_property('html')
+        two.html.add_filter(filters.Bleach(tags=['p'], cache=LruCache()))
+        self.assertEqual(one.fingerprint(), two.fingerprint())
+
+    def test_fingerprint_callables_by_behaviour(self):
+        """ Closures, lambdas and partials are told apart in fingerprints """
+        class Apply(filters.AbstractFilter):
+            def __init__(self, function):
+                self.function = function
+
+            def filter(self, value, model=None, context=None):
+                return self.function(value)
+
+        def fingerprint(filter=None, validator=None):
+            schema = Schema()
+            schema.add_property('value')
+            if filter:
+                schema.value.add_filter(filter)
+            if validator:
+                schema.value.add_validator(validator)
+            return schema.fingerprint()
+
+        def provider(choices):
+            return lambda: choices
+
+        def pad(width, value):
+            return value.ljust(width)
+
+        self.assertNotEqual(
+            fingerprint(validator=validators.Choice(provider(['a']))),
+            fingerprint(validator=validators.Choice(provider(['b'])))
+        )
+        self.assertEqual(
+            fingerprint(validator=validators.Choice(provider(['a']))),
+            fingerprint(validator=validators.Choice(provider(['a'])))
+        )
+        lambdas = [lambda: ['a'], lambda: ['b']]
+        self.assertNotEqual(
+            fingerprint(validator=validators.MultiChoice(lambdas[0])),
+            fingerprint(validator=validators.MultiChoice(lambdas[1]))
+        )
+        self.assertNotEqual(
+            fingerprint(filter=Apply(partial(pad, 1))),
+            fingerprint(filter=Apply(partial(pad, 2)))
+        )
+        self.assertEqual(
+            fingerprint(filter=Apply(partial(pad, 1))),
+            fingerprint(filter=Apply(partial(pad, 1)))
+        )
+
+    def test_fingerprint_is_recomputed_when_schema_changes(self):
+        """ Fingerprint is cached until schema gets modified """
+        schema = helpers.PersonSpecAggregate()
+        fingerprint = schema.fingerprint()
+        with mock.patch.object(schema, 'get_definition') as definition:
+            self.assertEqual(fingerprint, schema.fingerprint())
+            definition.assert_not_called()
+
+        changes = [
+            lambda: schema.add_property('email'),
+            lambda: schema.email.add_filter(filters.Strip()),
+            lambda: schema.email.add_validator(validators.Email()),
+            lambda: setattr(schema.email, 'filters', []),
+            lambda: schema.add_state_validator(helpers.ValidatorInvalid()),
+            lambda: schema.spouse.schema.add_property('email'),
+            lambda: schema.addresses.schema.city.add_validator(
+                validators.Length(min=2)
+            ),
+            lambda: setattr(schema.spouse, 'schema', helpers.AddressSpec()),
+        ]
+        for change in changes:
+            change()
+            self.assertNotEqual(fingerprint, schema.fingerprint())
+            fingerprint = schema.fingerprint()
+
+    def test_version_changes_when_lists_replaced_with_same_length(self):
+        """ Replacing filters or validators of same length changes version """
+        schema = Schema()
+        schema.add_property('name')
+        schema.name.add_filter(filters.Strip())
+        schema.name.add_validator(validators.Length(max=3))
+        fingerprint = schema.fingerprint()
+        self.assertFalse(schema.process(dict(name=' Kady ')))
+
+        schema.name.filters = [filters.Uppercase()]
+        schema.name.validators = [validators.Length(max=10)]
+        self.assertNotEqual(fingerprint, schema.fingerprint())
+        fingerprint = schema.fingerprint()
+
+        model = dict(name='kady')
+        self.assertTrue(schema.process(model))
+        self.assertEqual('KADY', model['name'])
+
+        schema.name.validators[0] = validators.Length(max=2)
+        self.assertNotEqual(fingerprint, schema.fingerprint())
+        self.assertFalse(schema.validate(dict(name='kady')))
+
+    def test_fingerprint_recursive_schema(self):
+        """ Fingerprinting schemas nested in themselves """
+        schema = Schema()
+        schema.add_property('name')
+        schema.add_collection('children')
+        schema.children.schema = schema
+        fingerprint = schema.fingerprint()
+        self.assertEqual(fingerprint, schema.fingerprint())
+
+    def test_process_with_cached_results(self):
+        """ Processing identical models returns cached results """
+        cache = LruCache()
+        schema = helpers.PersonSpecAggregate(cache=cache)
+        schema.addresses.filters = []
+        model = dict(
+            first_name='  Matthew  ',
+            birth_year=' 1980',
+            spouse=dict(first_name='K'),
+            addresses=[dict(address=' 2 Hollin Croft ')],
+        )
+        first = deepcopy(model)
+        expected = schema.process(first)
+        second = deepcopy(model)
+        result = schema.process(second)
+        self.assertEqual(dict(hits=1, misses=1), dict(
+            hits=cache.hits,
+            misses=cache.misses
+        ))
+        self.assertEqual(first, second)
+        self.assertEqual(1980, second['birth_year'])
+        self.assertEqual(expected.get_messages(), result.get_messages())
+        collection = result.errors['addresses']['collection']
+        self.assertIs(schema.translator, collection[0].translator)
+
+        # validation is cached separately
+        schema.validate(model)
+        schema.validate(model)
+        self.assertEqual(2, cache.hits)
+
+        # and so are different contexts
+        schema.process(deepcopy(model), context=dict(user=1))
+        self.assertEqual(2, cache.hits)
+
+    def test_do_not_cache_objects(self):
+        """ Models that can't be hashed by content are not cached """
+        cache = LruCache()
+        schema = helpers.PersonSpec(cache=cache)
+        schema.process(helpers.Person(first_name='Matthew'))
+        schema.process(dict(first_name='Matthew', tags=('a',)))
+        schema.process(dict(first_name='Matthew'), context=object())
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0, cache.misses)
+
+    def test_do_not_cache_nondeterministic_schemas(self):
+        """ Results of schemas that may change over time are not cached """
+        class Unique(validators.AbstractValidator):
+            def validate(self, value=None, model=None, context=None):
+                return Error()
+
+        model = dict(first_name='Matthew', salutation='mr')
+        schema = helpers.PersonSpec(cache=LruCache())
+        self.assertTrue(schema.is_deterministic())
+        self.assertIsNotNone(schema.cache_key('validate', model))
+
+        schema.salutation.validators = [validators.Choice(lambda: ['mr'])]
+        self.assertFalse(schema.is_deterministic())
+        self.assertIsNone(schema.cache_key('validate', model))
+        schema.validate(model)
+        self.assertEqual(0, len(schema.cache))
+
+        schema.salutation.validators = [Unique()]
+        self.assertIsNone(schema.cache_key('validate', model))
+
+        Unique.deterministic = True
+        self.assertIsNotNone(schema.cache_key('validate', model))
+
+        nested = Schema(cache=LruCache())
+        nested.add_entity('person').schema = helpers.PersonSpec()
+        nested.person.schema.last_name.add_validator(Unique())
+        self.assertTrue(nested.is_deterministic())
+        nested.person.schema.add_state_validator(validators.MultiChoice(
+            lambda: ['mr']
+        ))
+        self.assertFalse(nested.is_deterministic())
+
+    def test_share_cached_results_on_disk(self):
+        """ Schemas share cached results in sqlite database """
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'cache.sqlite')
+            model = dict(first_name=' K ', salutation='sir')
+            expected = helpers.PersonSpec(cache=SqliteCache(path)).process(
+                deepcopy(model)
+            )
+            cache = SqliteCache(path)
+            result = helpers.PersonSpec(cache=cache).process(model)
+            self.assertEqual(1, cache.hits)
+            self.assertEqual('K', model['first_name'])
+            self.assertEqual(expected.get_messages(), result.get_messages())
+
+    def test_validate_columns(self):
+        """ Validate a batch of rows stored as columns """
+        class LastNameDiffers(validators.AbstractValidator):
+            def validate(self, value, model=None, context=None):
+                if value == model['last_name']:
+                    return Error('same')
+                return Error()
+
+        schema = Schema()
+        schema.add_property('first_name')
+        schema.first_name.add_validator(validators.Required())
+        schema.first_name.add_validator(validators.Length(min=2))
+        schema.first_name.add_validator(LastNameDiffers())
+        schema.add_property('last_name')
+        schema.add_property('salutation')
+        schema.salutation.add_validator(validators.Choice(['mr', 'ms']))
+
+        result = schema.validate_columns(dict(
+            first_name=['Kady', None, 'J', 'Geoff'],
+            last_name=('Reyna', 'Petersen', 'Smith', 'Geoff'),
+            salutation=iter(['ms', 'mr', None, 'sir']),
+        ))
+        self.assertIsInstance(result, BatchResult)
+        self.assertFalse(result)
+        self.assertEqual(4, len(result))
+        self.assertEqual(bytearray([0, 1, 1, 1]), result.mask)
+        self.assertEqual([1, 2, 3], result.invalid)
+        self.assertEqual(['first_name'], list(result.errors[1].errors))
+        self.assertEqual(['first_name'], list(result.errors[2].errors))
+
+        messages = result.get_messages()
+        self.assertEqual(['same'], messages[3]['first_name'])
+        self.assertEqual(1, len(messages[3]['salutation']))
+
+    def test_validate_columns_by_row_for_state_and_nested(self):
+        """ State and nested schemas are validated a row at a time """
+        schema = helpers.PersonSpecCollectionAggregate()
+        result = schema.validate_columns(dict(
+            first_name=['Matthew', 'Kady'],
+            last_name=['Petersen', 'Reyna'],
+            addresses=[[dict(address='40 Churchgate')], None],
+        ))
+        self.assertEqual([0], result.invalid)
+        self.assertIn('collection', result.errors[0].errors['addresses'])
+
+    def test_validate_columns_of_unequal_length_raises(self):
+        """ Columns must be of the same length """
+        schema = Schema()
+        with self.assertRaises(InvalidOption):
+            schema.validate_columns(dict(a=[1, 2], b=[1]))
+
+    def test_validate_numpy_columns(self):
+        """ NumPy arrays are validated with array operations """
+        try:
+            import numpy as np
+        except ImportError:
+            self.skipTest('numpy not installed')
+        try:
+            import pandas
+        except ImportError:
+            pandas = None
+
+        schema = Schema()
+        schema.add_property('year').add_validator(validators.Digits())
+        schema.add_property('name').add_validator(validators.Length(max=3))
+        result = schema.validate_columns(dict(
+            year=np.array([1984, -1, 2020]),
+            name=np.array(['Ann', 'Kady', 'Jo'])
+        ))
+        self.assertEqual([1], result.invalid)
+        self.assertEqual(2, len(result.errors[1].errors))
+
+        class Born(validators.AbstractValidator):
+            def validate(self, value, model=None, context=None):
+                assert type(model['year']) is int
+                assert type(model['name']) is str
+                return Error()
+
+        schema.add_state_validator(Born())
+        schema.validate_columns(dict(
+            year=np.array([1984]),
+            name=pandas.Series(['Ann']) if pandas else np.array(['Ann'])
+        ))
+
+    def test_validate_batch_of_models(self):
+        """ Validate a batch of models collected into columns """
+        address = dict(
+            address='2 Hollin Croft',
+            city='Barnsley',
+            country='UK',
+            postcode='S70'
+        )
+        person = helpers.Person(first_name='Matthew', last_name='Petersen')
+        person.addresses = [address]
+
+        schema = helpers.PersonSpecCollectionAggregate()
+        models = [
+            person,
+            dict(first_name='K', last_name='Reyna', addresses=[address]),
+            dict(first_name='Kady', addresses=[dict(city='Bolton')]),
+        ]
+        result = schema.validate_batch(iter(models))
+        self.assertEqual([1, 2], result.invalid)
+        self.assertIn('first_name', result.errors[1].errors)
+        self.assertIn('addresses', result.errors[2].errors)
+
+    def test_validate_batch_in_processes(self):
+        """ Validate chunks of a batch in worker processes """
+        schema = helpers.PersonSpecCollectionAggregate()
+        models = [
+            dict(first_name='Matthew', last_name='Petersen'),
+            dict(first_name='K', last_name='Reyna'),
+            dict(first_name='Kady', addresses=[dict(city='Bolton')]),
+        ] * 3
+        expected = schema.validate_batch(models)
+        result = schema.validate_batch(models, workers=2, chunk_size=2)
+        self.assertEqual(expected.mask, result.mask)
+        self.assertEqual(expected.get_messages(), result.get_messages())
+
+        with self.assertRaises(InvalidOption):
+            schema.validate_batch(models, workers=0)
+
+    def test_validate_columns_in_processes(self):
+        """ Validate row ranges in worker processes sharing array columns """
+        try:
+            import numpy as np
+        except ImportError:
+            self.skipTest('numpy not installed')
+
+        schema = helpers.PersonSpec()
+        columns = dict(
+            first_name=np.array(['Matthew', 'K', 'Kady', 'Jo'] * 5),
+            last_name=['Petersen', 'Reyna', None, 'Li'] * 5,
+            salutation=np.array(['mr', 'ms', 'sir', 'mr'] * 5),
+        )
+        expected = schema.validate_columns(columns)
+        result = schema.validate_columns(columns, workers=2, chunk_size=3)
+        self.assertEqual(expected.mask, result.mask)
+        self.assertEqual(expected.get_messages(), result.get_messages())
+        invalid = [row for row in range(20) if row % 4 in (1, 2)]
+        self.assertEqual(invalid, result.invalid)
+
     def test_results_injected_with_translations(self):
         """ Schema-generated results are injected with translation settings """
         schema = Schema()
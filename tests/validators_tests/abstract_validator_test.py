@@ -1,6 +1,9 @@
 from unittest import TestCase
 from shiftschema.validators import AbstractValidator
+from shiftschema.validators import Choice, Digits, Length, Required
 from shiftschema.exceptions import InvalidErrorType
+from shiftschema.result import Error
+from tests.helpers import np, requires_numpy
 
 
 class AbstractValidatorTest(TestCase):
@@ -25,5 +28,42 @@ class AbstractValidatorTest(TestCase):
             validator = Custom()
             validator.run('some value')
 
+    def test_validate_many(self):
+        """ Validate many runs validation for each value """
+        class Custom(AbstractValidator):
+            def validate(self, value, model=None, context=None):
+                return Error('Too big') if value > 2 else Error()
+
+        errors = Custom().validate_many([1, 2, 3])
+        self.assertEqual([False, False, True], list(map(bool, errors)))
 
+    @requires_numpy
+    def test_validate_array(self):
+        """ Validating arrays flags same values as validating one by one """
+        class Custom(AbstractValidator):
+            def validate(self, value, model=None, context=None):
+                return Error('Too big') if value > 2 else Error()
 
+        strings = ['me', '', 'abcd', '12', '1a', '٣']
+        numbers = [0, 1, -1, 12, 1234]
+        floats = [0.0, 0.5, 1.0, 3.5, float('nan')]
+        arrays = (
+            strings, numbers, floats,
+            [True, False], [b'me', b'', b'four'], ['one', None]
+        )
+        cases = [
+            (Custom(), [numbers, floats, [True, False]]),
+            (Required(), arrays),
+            (Required(allow_zero=True), arrays),
+            (Required(allow_false=True), arrays),
+            (Required(allow_empty_string=True), arrays),
+            (Length(min=2, max=3), [strings, numbers, [True]]),
+            (Choice(['one', 2, 3.5, b'four', True]), arrays),
+            (Digits(), [strings, numbers, [1.0], [True]]),
+        ]
+        for validator, values_list in cases:
+            for values in values_list:
+                with self.subTest(validator=validator, values=values):
+                    mask = validator.validate_array(np.array(values))
+                    expected = [bool(validator.validate(v)) for v in values]
+                    self.assertEqual(expected, mask.tolist())
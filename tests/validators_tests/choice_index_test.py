@@ -0,0 +1,147 @@
+from unittest import TestCase, mock
+import pickle
+import threading
+from shiftschema.validators import ChoiceIndex
+from shiftschema.exceptions import InvalidOption
+
+
+class ChoiceIndexTest(TestCase):
+    """ Choice index test"""
+
+    def test_create(self):
+        """ Can instantiate choice index """
+        index = ChoiceIndex(['one', 'two', 'three'])
+        self.assertIsInstance(index, ChoiceIndex)
+
+    def test_raise_if_choices_not_iterable_or_callable(self):
+        """ Raise an exception if choices not iterable or callable """
+        with self.assertRaises(InvalidOption):
+            ChoiceIndex(123)
+
+    def test_index_hashable_choices(self):
+        """ Hashable choices are indexed in a frozenset """
+        index = ChoiceIndex(['one', 'two', 'three'])
+        self.assertEqual(frozenset(['one', 'two', 'three']), index.hashed)
+        self.assertIn('two', index)
+        self.assertNotIn('four', index)
+
+    def test_fall_back_to_linear_search_for_unhashable_choices(self):
+        """ Unhashable choices and values are looked up linearly """
+        index = ChoiceIndex(['one', ['two'], {'three': 3}])
+        self.assertEqual(frozenset(['one']), index.hashed)
+        self.assertIn('one', index)
+        self.assertIn(['two'], index)
+        self.assertIn({'three': 3}, index)
+        self.assertNotIn(['four'], index)
+
+    def test_string_choices_keep_substring_lookups(self):
+        """ String choices keep substring lookups """
+        index = ChoiceIndex('spam')
+        self.assertIn('s', index)
+        self.assertIn('pa', index)
+        self.assertNotIn('x', index)
+
+    def test_can_index_generators(self):
+        """ Choices can be given as a one-off generator """
+        index = ChoiceIndex(str(i) for i in range(100))
+        self.assertIn('50', index)
+        self.assertIn('50', index)
+
+    def test_load_choices_lazily_from_provider(self):
+        """ Provider is called once on first lookup """
+        provider = mock.Mock(return_value=['one', 'two'])
+        index = ChoiceIndex(provider)
+        provider.assert_not_called()
+
+        self.assertIn('one', index)
+        self.assertNotIn('three', index)
+        provider.assert_called_once_with()
+
+    def test_get_invalid_items(self):
+        """ Get invalid items preserving order """
+        index = ChoiceIndex(['one', 'two', 'three'])
+        self.assertEqual([], index.invalid(['one', 'two']))
+        invalid = index.invalid(['four', 'one', 'five', 'four'])
+        self.assertEqual(['four', 'five', 'four'], invalid)
+
+    def test_get_invalid_unhashable_items(self):
+        """ Get invalid items when some items are unhashable """
+        index = ChoiceIndex(['one', ['two']])
+        self.assertEqual([], index.invalid(['one', ['two']]))
+        self.assertEqual([['three']], index.invalid([['three'], 'one']))
+
+    def test_provided_choices_are_kept_until_ttl_expires(self):
+        """ Provided choices are not reloaded before TTL expires """
+        provider = mock.Mock(return_value=['one'])
+        index = ChoiceIndex(provider, ttl=60)
+        self.assertIn('one', index)
+        self.assertIn('one', index)
+        self.assertIsNone(index.refresher)
+        provider.assert_called_once_with()
+
+    def test_refresh_expired_choices_in_background(self):
+        """ Expired choices are served while refreshing in background """
+        provider = mock.Mock(side_effect=[['one'], ['two']])
+        index = ChoiceIndex(provider, ttl=60)
+        self.assertIn('one', index)
+
+        index.loaded_at -= 61
+        self.assertIn('one', index)  # stale, but served
+        index.refresher.join()
+
+        self.assertIn('two', index)
+        self.assertNotIn('one', index)
+        self.assertEqual(2, provider.call_count)
+
+    def test_keep_current_choices_if_refresh_fails(self):
+        """ Current choices are kept if background refresh fails """
+        provider = mock.Mock(side_effect=[['one'], Exception('Db is down')])
+        index = ChoiceIndex(provider, ttl=60)
+        self.assertIn('one', index)
+
+        index.loaded_at -= 61
+        self.assertIn('one', index)
+        index.refresher.join()
+        self.assertIn('one', index)
+        self.assertFalse(index.refreshing)
+
+    def test_can_refresh_choices(self):
+        """ Can reload provided choices right away """
+        provider = mock.Mock(side_effect=[['one'], ['two']])
+        index = ChoiceIndex(provider)
+        self.assertIn('one', index)
+        index.refresh()
+        self.assertIn('two', index)
+
+    def test_concurrent_lookups_load_choices_once(self):
+        """ Concurrent first lookups call provider only once """
+        release = threading.Event()
+        calls = []
+
+        def provider():
+            calls.append(1)
+            release.wait()
+            return ['one']
+
+        index = ChoiceIndex(provider)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append('one' in index))
+            for _ in range(10)
+        ]
+        for thread in threads:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(1, len(calls))
+        self.assertEqual([True] * 10, results)
+
+    def test_can_pickle_index(self):
+        """ Index can be pickled, e.g. to be sent to worker processes """
+        index = ChoiceIndex(['one', 'two'])
+        restored = pickle.loads(pickle.dumps(index))
+        self.assertIn('two', restored)
+        self.assertNotIn('three', restored)
+        self.assertIsNot(index.lock, restored.lock)
@@ -1,7 +1,8 @@
-from unittest import TestCase
+from unittest import TestCase, mock
 from nose.plugins.attrib import attr
-from shiftschema.validators import Choice
+from shiftschema.validators import Choice, ChoiceIndex
 from shiftschema.exceptions import InvalidOption
+from tests.helpers import np, requires_numpy
 
 
 class ChoiceValidatorTest(TestCase):
@@ -39,4 +40,48 @@ class ChoiceValidatorTest(TestCase):
         error = validator.run('s')
         self.assertFalse(error)
 
+    def test_can_load_choices_from_provider(self):
+        """ Can load choices lazily from provider """
+        provider = mock.Mock(return_value=['one', 'two'])
+        validator = Choice(provider)
+        provider.assert_not_called()
+        self.assertFalse(validator.run('one'))
+        self.assertTrue(validator.run('three'))
+        provider.assert_called_once_with()
 
+    def test_can_share_choice_index(self):
+        """ Validators can share prepared choice index """
+        index = ChoiceIndex(['one', 'two'])
+        validator = Choice(index)
+        self.assertIs(index, validator.index)
+        self.assertFalse(validator.run('two'))
+
+    def test_can_refresh_provided_choices(self):
+        """ Provided choices can be refreshed after TTL """
+        provider = mock.Mock(side_effect=[['one'], ['two']])
+        validator = Choice(provider, ttl=60)
+        self.assertEqual(60, validator.index.ttl)
+        self.assertFalse(validator.run('one'))
+
+        validator.index.loaded_at -= 61
+        validator.run('one')
+        validator.index.refresher.join()
+        self.assertFalse(validator.run('two'))
+
+    def test_validate_many(self):
+        """ Validating a batch of values """
+        validator = Choice(['one', 'two'])
+        errors = validator.validate_many(['one', 'three', 'two', 'one'])
+        expected = [False, True, False, False]
+        self.assertEqual(expected, [bool(error) for error in errors])
+        self.assertEqual('%choice_not_valid%', errors[1].message)
+
+        errors = validator.validate_many(('two', ['one'], 'four'))
+        self.assertEqual([False, True, True], [bool(e) for e in errors])
+
+    @requires_numpy
+    def test_validate_array_with_choices_from_string(self):
+        """ Validating arrays against choices given as a string """
+        validator = Choice('one two')
+        mask = validator.validate_array(np.array(['one', 'three']))
+        self.assertEqual([False, True], mask.tolist())
@@ -1,5 +1,6 @@
 from unittest import TestCase
 from shiftschema.validators import Digits
+from tests.helpers import np, requires_numpy
 
 
 class DigitsValidatorTest(TestCase):
@@ -42,3 +43,24 @@ class DigitsValidatorTest(TestCase):
         self.assertFalse(error1)
         self.assertFalse(error2)
 
+    def test_validate_integers_without_conversion(self):
+        """ Integers are validated without string conversion """
+        validator = Digits()
+        self.assertFalse(validator.validate(0))
+        self.assertTrue(validator.validate(-123))
+        self.assertTrue(validator.validate(True))
+        self.assertTrue(validator.validate(1.5))
+
+    def test_validate_many(self):
+        """ Validating a batch of values """
+        validator = Digits()
+        errors = validator.validate_many(['123', 456, '12a', '', None])
+        expected = [False, False, True, True, True]
+        self.assertEqual(expected, [bool(error) for error in errors])
+
+    @requires_numpy
+    def test_validate_unsigned_array(self):
+        """ Unsigned integer arrays are all digits """
+        validator = Digits()
+        mask = validator.validate_array(np.array([1, 2], dtype=np.uint8))
+        self.assertEqual([False, False], mask.tolist())
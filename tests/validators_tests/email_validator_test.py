@@ -1,5 +1,8 @@
 from unittest import TestCase
 from shiftschema.validators import Email
+from shiftschema.exceptions import InvalidOption
+import random
+import time
 
 
 class EmailValidatorTest(TestCase):
@@ -54,4 +57,44 @@ class EmailValidatorTest(TestCase):
             msg = 'Email [{}] failed validation'.format(address)
             self.assertTrue(error, msg=msg)
 
+    def test_raise_on_bad_engine(self):
+        """ Raise when creating validator with unknown engine """
+        with self.assertRaises(InvalidOption):
+            Email(engine='magic')
 
+    def test_parser_engine_validates_emails(self):
+        """ Parser engine passes valid and fails invalid emails """
+        validator = Email(engine='parser')
+        self.assertFalse(validator.validate('cal+henderson@iamcalx.com'))
+        self.assertFalse(validator.validate('"cal henderson"@iamcalx.com'))
+        self.assertFalse(validator.validate('cal@[hello world].com'))
+        self.assertTrue(validator.validate('cal henderson@iamcalx.com'))
+        self.assertTrue(validator.validate('cal@iamcalx com'))
+        self.assertTrue(validator.validate('not-an-email'))
+
+    def test_parser_engine_matches_regex(self):
+        """ Parser engine accepts the same emails as the regex """
+        rnd = random.Random(42)
+        chars = list('ab.@"[]\\ ()\r') + ['\x7f', '\x80', 'é', 'Ā']
+        regex = Email()
+        parser = Email(engine='parser')
+        for _ in range(5000):
+            size = rnd.randint(0, 12)
+            email = ''.join(rnd.choice(chars) for _ in range(size))
+            expected = bool(regex.regex().match(email))
+            self.assertEqual(expected, parser.scan(email), msg=repr(email))
+
+    def test_parser_engine_time_is_bounded_on_adversarial_input(self):
+        """ Parser engine runs in linear time on crafted input """
+        size = 100000
+        crafted = [
+            'a' * size + '@',
+            '"' + '\\a' * (size // 2),
+            'a.' * (size // 2) + '@',
+            'a@' + 'a.' * (size // 2) + '@',
+        ]
+        validator = Email(engine='parser')
+        for email in crafted:
+            start = time.perf_counter()
+            self.assertTrue(validator.validate(email))
+            self.assertLess(time.perf_counter() - start, 1)
@@ -0,0 +1,47 @@
+from unittest import TestCase
+from shiftschema.validators import IpNetwork, NetworkIndex
+
+
+class IpNetworkValidatorTest(TestCase):
+
+    def test_create(self):
+        """ Can instantiate IP network validator """
+        validator = IpNetwork(allow=['10.0.0.0/8'], deny=['10.1.0.0/16'])
+        self.assertIsInstance(validator, IpNetwork)
+        self.assertIsInstance(validator.allow, NetworkIndex)
+        self.assertIsInstance(validator.deny, NetworkIndex)
+
+    def test_invalid_ip_fails_validation(self):
+        """ Invalid IP fails validation """
+        validator = IpNetwork(deny=['10.0.0.0/8'])
+        error = validator.validate('not an ip')
+        self.assertEqual(IpNetwork.invalid_ip, error.message)
+
+    def test_denied_ip_fails_validation(self):
+        """ IP in denied networks fails validation """
+        validator = IpNetwork(deny=['10.0.0.0/8', '2001:db8::/32'])
+        error = validator.validate('10.1.2.3')
+        self.assertEqual(IpNetwork.ip_denied, error.message)
+        self.assertTrue(validator.validate('2001:db8::1'))
+        self.assertFalse(validator.validate('11.1.2.3'))
+
+    def test_ip_not_in_allowed_networks_fails_validation(self):
+        """ IP not in allowed networks fails validation """
+        validator = IpNetwork(allow=['10.0.0.0/8'], deny=['10.1.0.0/16'])
+        error = validator.validate('11.1.2.3')
+        self.assertEqual(IpNetwork.ip_not_allowed, error.message)
+        self.assertFalse(validator.validate('10.2.0.1'))
+        self.assertTrue(validator.validate('10.1.0.1'))
+
+    def test_can_use_prepared_index(self):
+        """ Can use prepared network index """
+        index = NetworkIndex(['10.0.0.0/8'])
+        validator = IpNetwork(deny=index)
+        self.assertIs(index, validator.deny)
+        self.assertTrue(validator.validate('10.0.0.1'))
+
+    def test_can_fail_with_custom_message(self):
+        """ IP network validator accepts custom error """
+        validator = IpNetwork(deny=['10.0.0.0/8'], message='Go away')
+        self.assertEqual('Go away', validator.validate('10.0.0.1').message)
+        self.assertEqual('Go away', validator.validate('bad').message)
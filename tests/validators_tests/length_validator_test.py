@@ -1,5 +1,7 @@
 from unittest import TestCase
 from shiftschema.validators import Length
+from shiftschema.peekable import Peekable
+from tests.helpers import np, requires_numpy
 
 
 class LengthValidatorTest(TestCase):
@@ -55,3 +57,38 @@ class LengthValidatorTest(TestCase):
         error = validator.validate(value)
         self.assertFalse(error)
 
+    def test_return_error_params(self):
+        """ Error holds validation settings for translation """
+        validator = Length(min=3, max=5)
+        error = validator.validate('Me is too long')
+        self.assertEqual(dict(min=3, max=5), error.kwargs)
+        self.assertIsNone(validator.validate('Okay').kwargs)
+
+    def test_measure_sequences_natively(self):
+        """ Bytes and sequences are measured natively """
+        validator = Length(max=3)
+        self.assertFalse(validator.validate(b'abc'))
+        self.assertFalse(validator.validate([100, 200, 300]))
+        self.assertFalse(validator.validate(('one', 'two')))
+        self.assertTrue(validator.validate(b'abcd'))
+        self.assertTrue(validator.validate(12345))
+
+    def test_measure_peekable_iterators_by_number_of_items(self):
+        """ Peekable iterators are measured by number of items """
+        validator = Length(max=3)
+        self.assertFalse(validator.validate(Peekable(iter(['abcd']))))
+        self.assertTrue(validator.validate(Peekable(iter(range(4)))))
+
+    def test_validate_many(self):
+        """ Validating a batch of values """
+        validator = Length(min=2, max=3)
+        errors = validator.validate_many(['a', 'ab', 'abcd', b'abc', 1234])
+        expected = [True, False, True, False, True]
+        self.assertEqual(expected, [bool(error) for error in errors])
+        self.assertEqual(dict(min=2, max=3), errors[0].kwargs)
+
+    @requires_numpy
+    def test_validate_float_array(self):
+        """ Floats have no length and are always invalid in arrays """
+        mask = Length(max=2).validate_array(np.array([1.5, 1.0]))
+        self.assertEqual([True, True], mask.tolist())
@@ -42,4 +42,8 @@ class ChoiceValidatorTest(TestCase):
         error = validator.run(value)
         self.assertFalse(error)
 
-
+    def test_report_invalid_items_in_order(self):
+        """ Invalid items are reported in order """
+        validator = MultiChoice(['one', 'two', 'three'])
+        error = validator.run(['seventeen', 'one', 'four'])
+        self.assertEqual('seventeen, four', error.kwargs['items'])
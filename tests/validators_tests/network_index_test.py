@@ -0,0 +1,77 @@
+from unittest import TestCase
+from shiftschema.validators import NetworkIndex
+from shiftschema.exceptions import InvalidOption
+import ipaddress
+import tempfile
+import os
+
+
+class NetworkIndexTest(TestCase):
+    """ Network index test"""
+
+    def test_create(self):
+        """ Can instantiate network index """
+        index = NetworkIndex(['10.0.0.0/8', '2001:db8::/32'])
+        self.assertIsInstance(index, NetworkIndex)
+
+    def test_raise_on_invalid_network(self):
+        """ Raise if network is invalid """
+        with self.assertRaises(InvalidOption):
+            NetworkIndex(['10.0.0.0/8', 'not a network'])
+
+    def test_merge_overlapping_and_adjacent_networks(self):
+        """ Overlapping and adjacent networks are merged """
+        index = NetworkIndex([
+            '10.0.0.0/8',
+            '10.1.0.0/16',
+            '11.0.0.0/8',
+            '192.168.1.0/24',
+        ])
+        self.assertEqual(2, len(index))
+
+    def test_lookup_addresses(self):
+        """ Looking up IPv4 and IPv6 addresses """
+        index = NetworkIndex([
+            '10.0.0.0/8',
+            '192.168.1.0/24',
+            '203.0.113.7',
+            '2001:db8::/32',
+        ])
+        self.assertIn('10.20.30.40', index)
+        self.assertIn('192.168.1.255', index)
+        self.assertIn('203.0.113.7', index)
+        self.assertIn('2001:db8::1', index)
+        self.assertIn(ipaddress.ip_address('10.0.0.1'), index)
+        self.assertNotIn('9.255.255.255', index)
+        self.assertNotIn('192.168.2.0', index)
+        self.assertNotIn('203.0.113.8', index)
+        self.assertNotIn('2001:db9::1', index)
+
+    def test_lookup_ipv4_mapped_addresses(self):
+        """ IPv4-mapped IPv6 addresses are looked up in IPv4 networks """
+        index = NetworkIndex(['10.0.0.0/8'])
+        self.assertIn('::ffff:10.1.2.3', index)
+        self.assertNotIn('::ffff:11.1.2.3', index)
+
+    def test_lookup_in_large_index(self):
+        """ Looking up addresses in a large index """
+        networks = ['10.{}.{}.0/24'.format(i // 256, i % 256)
+                    for i in range(0, 60000, 2)]
+        index = NetworkIndex(networks)
+        self.assertEqual(30000, len(index))
+        self.assertIn('10.0.2.1', index)
+        self.assertNotIn('10.0.3.1', index)
+
+    def test_load_from_file(self):
+        """ Loading networks from file """
+        content = '# bad actors\n10.0.0.0/8\n\n2001:db8::/32  # test net\n'
+        with tempfile.NamedTemporaryFile('w', delete=False) as file:
+            file.write(content)
+        try:
+            index = NetworkIndex.from_file(file.name)
+        finally:
+            os.remove(file.name)
+
+        self.assertEqual(2, len(index))
+        self.assertIn('10.1.1.1', index)
+        self.assertIn('2001:db8::1', index)
@@ -29,3 +29,11 @@ class NotEmptyValidatorTest(TestCase):
         error = validator.validate(1)
         self.assertTrue(error)
         self.assertEquals('%not_iterable%', error.message)
+
+    def test_validate_many(self):
+        """ Validating a batch of values """
+        validator = NotEmpty()
+        errors = validator.validate_many([[1], [], '', 'a', 1, iter([])])
+        expected = [False, True, True, False, True, True]
+        self.assertEqual(expected, [bool(error) for error in errors])
+        self.assertEqual('%not_iterable%', errors[4].message)
@@ -59,3 +59,10 @@ class RequiredValidatorTest(TestCase):
         validator = Required(allow_empty_string=True)
         error = validator.validate('')
         self.assertFalse(error)
+
+    def test_validate_many(self):
+        """ Validating a batch of values """
+        validator = Required(allow_zero=True)
+        errors = validator.validate_many(['me', '', 0, None, [], [1]])
+        expected = [False, True, False, True, True, False]
+        self.assertEqual(expected, [bool(error) for error in errors])
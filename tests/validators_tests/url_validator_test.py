@@ -1,6 +1,9 @@
-from unittest import TestCase
+from unittest import TestCase, mock
 
 from shiftschema.validators import Url
+from shiftschema.exceptions import InvalidOption
+import random
+import time
 import re
 
 # these are valid urls
@@ -121,4 +124,98 @@ class UrlValidatorTest(TestCase):
         if error:
             self.fail('URL [{}] failed'.format(url))
 
+    def test_can_use_custom_message(self):
+        """ Can fail with custom error message """
+        msg = 'Custom error'
+        validator = Url(message=msg)
+        error = validator.validate('foo.com')
+        self.assertEqual(msg, error.message)
 
+    def test_compiled_regex_shared_by_configuration(self):
+        """ Validators with the same configuration share compiled regex """
+        validator1 = Url(protocols=['http', 'ftp'])
+        validator2 = Url(protocols=['http', 'ftp'])
+        validator3 = Url(protocols=['http', 'ftp'], localhost=True)
+        self.assertIs(validator1.pattern, validator2.pattern)
+        self.assertIsNot(validator1.pattern, validator3.pattern)
+
+    def test_regex_not_compiled_on_validation(self):
+        """ Validation does not recompile the regex """
+        validator = Url()
+        with mock.patch('re.compile') as compile:
+            validator.validate('http://foo.com')
+            validator.validate('http://bar.com')
+        compile.assert_not_called()
+
+    def test_precheck_rejects_bad_structure(self):
+        """ Structural pre-check rejects bad protocols and missing host """
+        validator = Url()
+        self.assertFalse(validator.precheck('ftp://foo.com'))
+        self.assertFalse(validator.precheck('http:/foo.com'))
+        self.assertFalse(validator.precheck('foo.com'))
+        self.assertTrue(validator.precheck('HTTPS://foo.com'))
+        self.assertTrue(validator.precheck('//foo.com'))
+
+    def test_precheck_passes_valid_urls(self):
+        """ Structural pre-check never rejects valid urls """
+        validator = Url(protocols=['http', 'https', 'ftp', 'sftp'])
+        for url in valid + ['http:///path@foo.com', 'http://foo.com\n']:
+            self.assertTrue(validator.pattern.match(url))
+            self.assertTrue(validator.precheck(url))
+
+        validator = Url(protocols=['git_x'])
+        for url in ('git_x://a.co', 'GIT_X://a.co', '//a.co'):
+            self.assertTrue(validator.pattern.match(url))
+            self.assertTrue(validator.precheck(url))
+
+    def test_raise_on_bad_engine(self):
+        """ Raise when creating validator with unknown engine """
+        with self.assertRaises(InvalidOption):
+            Url(engine='magic')
+
+    def test_parser_engine_validates_urls(self):
+        """ Parser engine passes valid and fails invalid urls """
+        protocols = ['http', 'https', 'ftp', 'sftp']
+        validator = Url(protocols=protocols, engine='parser')
+        for url in valid:
+            self.assertFalse(validator.validate(url), msg=url)
+        for url in invalid:
+            self.assertTrue(validator.validate(url), msg=url)
+
+        validator = Url(localhost=True, engine='parser')
+        self.assertFalse(validator.validate('http://localhost:5000'))
+
+    def test_parser_engine_matches_regex(self):
+        """ Parser engine accepts the same urls as the regex """
+        rnd = random.Random(42)
+        chars = list('aZ9._-:@/?#% ') + ['é', '٣', '\U0001F600', '\n']
+        prefixes = ['http://', 'HTTP://', '//', 'ftp://', 'http:/', '']
+        hosts = ['10.1.1.1', '172.16.0.1', '223.1.2.3', 'foo.com', 'a-b.co']
+        for localhost in (False, True):
+            regex = Url(localhost=localhost)
+            parser = Url(localhost=localhost, engine='parser')
+            for _ in range(3000):
+                url = rnd.choice(prefixes)
+                if rnd.random() < 0.5:
+                    url += rnd.choice(hosts)
+                size = rnd.randint(0, 12)
+                url += ''.join(rnd.choice(chars) for _ in range(size))
+                expected = bool(regex.pattern.match(url))
+                self.assertEqual(expected, parser.scan(url), msg=repr(url))
+
+    def test_parser_engine_time_is_bounded_on_adversarial_input(self):
+        """ Parser engine runs in linear time on crafted input """
+        size = 100000
+        crafted = [
+            'http://' + 'a' * size + '-',
+            'http://' + ':' * size + '!',
+            'http://' + 'a@' * (size // 2),
+            'http://' + 'a-' * (size // 2) + '!',
+            'http://' + '@/' * (size // 2),
+        ]
+        for localhost in (False, True):
+            validator = Url(localhost=localhost, engine='parser')
+            for url in crafted:
+                start = time.perf_counter()
+                self.assertTrue(validator.validate(url))
+                self.assertLess(time.perf_counter() - start, 1)